@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_crawl.py — 크롤러 처리량 벤치마크 (로컬 대역 서버 대상)
+─────────────────────────────────────────────────
+mock_medigate.py 서버를 띄우고 phase4_crawler.py 를 처음부터 끝까지 실행해
+  · 공고/분 (목록 수집 루프 기준, 로그인 시간 제외)
+  · 구간별 시간 비중 — 요청(fetch) / 조건 대기(wait) / 딜레이(sleep) / 파싱(parse) / DB
+를 출력한다. 크롤러 성능 변경 전후를 같은 조건으로 비교하는 용도.
+
+  · 운영 DB 보호를 위해 --dsn(또는 CRAWL_DB_DSN)으로 벤치마크용 DB 를 반드시 지정
+  · 실행마다 병원명에 다른 salt 를 붙여 매번 전부 신규 공고로 저장됨
+  · 크롤러 딜레이는 그대로 사용 — 딜레이를 빼고 순수 처리 속도만 보려면 --no-delay
+
+실행:
+    python bench_crawl.py --dsn postgresql://localhost/bench
+    python bench_crawl.py --dsn postgresql://localhost/bench --pages 5 --latency-ms 200
+    python bench_crawl.py --dsn postgresql://localhost/bench -- --detail-workers 4 --extract-mode browser
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import mock_medigate
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PHASES = [
+    ('fetch', '요청(fetch)'),
+    ('wait',  '조건 대기'),
+    ('sleep', '딜레이'),
+    ('parse', '파싱'),
+    ('db',    'DB'),
+]
+
+# --no-delay: phase4_crawler 를 import 해 딜레이 상수만 0 으로 바꾼 뒤 main() 실행
+_NO_DELAY_RUNNER = (
+    "import sys, phase4_crawler as c; "
+    "c.DELAY_MIN = c.DELAY_MAX = c.DETAIL_DELAY_MIN = c.DETAIL_DELAY_MAX = 0; "
+    "sys.argv = ['phase4_crawler.py'] + sys.argv[1:]; c.main()"
+)
+
+
+def run_crawler(base_url, dsn, stats_path, log_path, no_delay, extra):
+    args = ['--base-url', base_url, '--from', '2000-01-01', '--no-watermark',
+            '--stats-json', stats_path, '--log-file', log_path] + extra
+    if no_delay:
+        cmd = [sys.executable, '-c', _NO_DELAY_RUNNER] + args
+    else:
+        cmd = [sys.executable, os.path.join(_SCRIPT_DIR, 'phase4_crawler.py')] + args
+    env = dict(os.environ, CRAWL_DB_DSN=dsn)
+    return subprocess.run(cmd, cwd=_SCRIPT_DIR, env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러 처리량 벤치마크 (mock_medigate 대상)')
+    parser.add_argument('--dsn', default=os.environ.get('CRAWL_DB_DSN'),
+                        help='벤치마크용 PostgreSQL DSN (운영 DB 사용 금지)')
+    parser.add_argument('--pages', type=int, default=3, help='공고가 있는 목록 페이지 수')
+    parser.add_argument('--latency-ms', type=float, default=100.0, help='대역 서버 응답 지연(ms)')
+    parser.add_argument('--jitter-ms', type=float, default=50.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='503 응답 비율')
+    parser.add_argument('--no-delay', action='store_true', help='크롤러 고정 딜레이를 0 으로')
+    parser.add_argument('--json', dest='json_out', default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('crawler_args', nargs=argparse.REMAINDER,
+                        help='-- 뒤의 인자는 phase4_crawler.py 에 그대로 전달')
+    args = parser.parse_args()
+
+    if not args.dsn:
+        print("--dsn 또는 CRAWL_DB_DSN 으로 벤치마크용 DB 를 지정하세요.")
+        sys.exit(1)
+    extra = [a for a in args.crawler_args if a != '--']
+
+    site = mock_medigate.MockSite(
+        pages=args.pages, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, salt=f"b{int(time.time())}",
+    )
+    server, base_url = mock_medigate.start_in_thread(site)
+    print(f"대역 서버 {base_url} (목록 {args.pages}페이지, 지연 {args.latency_ms:g}"
+          f"±{args.jitter_ms:g}ms, 오류율 {args.error_rate:g})")
+    print(f"크롤러 인자: {' '.join(extra) or '(기본)'}{' + 딜레이 0' if args.no_delay else ''}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_path = os.path.join(tmp, 'stats.json')
+        log_path   = os.path.join(tmp, 'crawl.jsonl')
+        t0   = time.monotonic()
+        proc = run_crawler(base_url, args.dsn, stats_path, log_path, args.no_delay, extra)
+        wall = time.monotonic() - t0
+        server.shutdown()
+
+        if proc.returncode != 0 or not os.path.exists(stats_path):
+            print(f"[FAIL] 크롤러 종료 코드 {proc.returncode}")
+            if os.path.exists(log_path):
+                with open(log_path, encoding='utf-8') as f:
+                    print(''.join(f.readlines()[-20:]))
+            print(proc.stderr[-2000:])
+            sys.exit(1)
+        with open(stats_path, encoding='utf-8') as f:
+            result = json.load(f)
+
+    crawl_s = max(result['crawl_seconds'], 1e-9)
+    stats   = result['stats']
+    timings = result['timings']
+    per_min = stats['processed'] / crawl_s * 60
+
+    print()
+    print(f"  목록 페이지   : {result['pages']}페이지")
+    print(f"  처리 / 신규   : {stats['processed']:,}건 / {stats['saved']:,}건")
+    print(f"  수집 루프     : {crawl_s:.1f}초  (로그인 포함 전체 {wall:.1f}초)")
+    print(f"  처리량        : {per_min:,.1f} 공고/분  (신규 {stats['saved'] / crawl_s * 60:,.1f}건/분)")
+    print(f"  서버 요청     : {site.counts}")
+    print()
+    print(f"  {'구간':<12} {'초':>8} {'비중':>7}")
+    print('  ' + '-' * 29)
+    accounted = 0.0
+    for key, label in PHASES:
+        secs = timings.get(key, 0.0)
+        accounted += secs
+        print(f"  {label:<12} {secs:>8.1f} {secs / crawl_s:>6.1%}")
+    other = crawl_s - accounted
+    print(f"  {'기타':<12} {other:>8.1f} {other / crawl_s:>6.1%}")
+    if accounted > crawl_s:
+        print("  (병렬 상세 수집은 스레드 시간이 합산되어 비중 합계가 100% 를 넘을 수 있음)")
+
+    if args.json_out:
+        result.update({'wall_seconds': round(wall, 3), 'posts_per_min': round(per_min, 1),
+                       'server_requests': site.counts,
+                       'mock': {'pages': args.pages, 'latency_ms': args.latency_ms,
+                                'jitter_ms': args.jitter_ms, 'error_rate': args.error_rate},
+                       'crawler_args': extra, 'no_delay': args.no_delay})
+        with open(args.json_out, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_list_parser.py — 목록 페이지 파서 속도 비교
+─────────────────────────────────────────────────
+  · 기존 : BeautifulSoup(html.parser) + extract_posts_from_soup (링크마다 부모 탐색)
+  · 신규 : extract_posts_from_html (lxml + ListParsePlan, 컨테이너 1회 탐색)
+
+저장된 페이지(recruit_page.html / new_site_page.html)를 반복 파싱해
+1회 평균 시간과 속도 향상 배율을 출력하고, 두 결과가 완전히 같은지 확인한다.
+
+실행:
+    python bench_list_parser.py            # 기본 20회 반복
+    python bench_list_parser.py -n 50
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+import phase4_crawler as crawler
+
+FIXTURES = ['recruit_page.html', 'new_site_page.html']
+
+
+def _legacy(html):
+    return crawler.extract_posts_from_soup(BeautifulSoup(html, 'html.parser'))
+
+
+def _fast(html):
+    return crawler.extract_posts_from_html(html)
+
+
+def _time_it(fn, html, repeat):
+    best = float('inf')
+    total = 0.0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(html)
+        dt = time.perf_counter() - t0
+        total += dt
+        best = min(best, dt)
+    return total / repeat, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='목록 페이지 파서 벤치마크')
+    parser.add_argument('-n', '--repeat', type=int, default=20, help='반복 횟수')
+    args = parser.parse_args()
+
+    if crawler.lxml_html is None:
+        print("lxml 미설치 — 빠른 파서를 사용할 수 없습니다. (pip install lxml)")
+        sys.exit(1)
+
+    base = os.path.dirname(os.path.abspath(__file__))
+    print(f"{'파일':<22} {'크기':>9} {'공고':>5} {'기존(ms)':>10} {'신규(ms)':>10} {'배율':>7}  결과")
+    print('-' * 78)
+
+    all_same = True
+    for name in FIXTURES:
+        path = os.path.join(base, name)
+        if not os.path.exists(path):
+            print(f"{name:<22} (없음)")
+            continue
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+
+        legacy_posts = _legacy(html)
+        fast_posts   = _fast(html)
+        same = legacy_posts == fast_posts
+        all_same &= same
+
+        legacy_avg, _ = _time_it(_legacy, html, args.repeat)
+        fast_avg, _   = _time_it(_fast, html, args.repeat)
+        speedup = legacy_avg / fast_avg if fast_avg > 0 else float('inf')
+
+        print(f"{name:<22} {len(html):>9,} {len(fast_posts):>5} "
+              f"{legacy_avg * 1000:>10.1f} {fast_avg * 1000:>10.1f} {speedup:>6.1f}x  "
+              f"{'동일' if same else '불일치!'}")
+
+    print()
+    if not all_same:
+        print("[FAIL] 기존 파서와 결과가 다릅니다.")
+        sys.exit(1)
+    print("[OK] 모든 페이지에서 기존 파서와 결과 동일")
+
+
+if __name__ == '__main__':
+    main()
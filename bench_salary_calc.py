@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_salary_calc.py — Net 실수령액 계산 스칼라 / 배열(NumPy) 속도 비교
+─────────────────────────────────────────────────
+  · 기존 : gross_monthly_to_net_monthly / calc_net_with_retirement 를 값마다 호출
+  · 신규 : gross_to_net_array / calc_net_with_retirement_array 로 배열 한 번에
+  · 역산 : estimate_gross_from_net(_array) — 위 Gross 의 Net 을 다시 Gross 로 (스칼라 / 배열)
+
+월 Gross 100만~3,000만원 무작위 값(+ 공제·세율 구간 경계 근처 값)으로
+두 방식의 시간과 배율을 출력하고, 결과가 원 단위까지 같은지 확인한다.
+역산은 추가로 '그 Net 이상이 되는 가장 작은 Gross' 인지 검사한다.
+
+실행:
+    python bench_salary_calc.py              # 기본 1,000,000건
+    python bench_salary_calc.py -n 200000
+"""
+
+import argparse
+import sys
+import time
+
+import salary_calculator as calc
+
+np = calc.np
+
+
+def _inputs(n, seed):
+    """무작위 월 Gross(원) n건 — 앞쪽은 연 총급여 구간 경계 ±100원 → (배열, 경계값 건수)"""
+    rng    = np.random.default_rng(seed)
+    rules  = calc.tax_calculator()
+    limits = rules.eid_limits + rules.credit_limits
+    edges  = [int(lim / 12) + rules.meal_nontax + d for lim in limits for d in range(-100, 101)]
+    edges  = np.array(edges[:n], dtype=np.int64)
+    rand   = rng.integers(1_000_000, 30_000_000, n - len(edges), dtype=np.int64)
+    return np.concatenate([edges, rand]), len(edges)
+
+
+def _time_it(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Net 실수령액 계산 벤치마크')
+    parser.add_argument('-n', '--count', type=int, default=1_000_000, help='입력 건수')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='배열 계산 반복 횟수 (최솟값 사용)')
+    parser.add_argument('--seed', type=int, default=20250101, help='난수 시드')
+    args = parser.parse_args()
+
+    if calc.np is None:
+        print("numpy 미설치 — 배열 계산을 사용할 수 없습니다. (pip install numpy)")
+        sys.exit(1)
+
+    gross, n_edges = _inputs(args.count, args.seed)
+    types = np.where(np.arange(len(gross)) % 2 == 0, 'gross', 'net')
+    values = gross.tolist()
+    type_list = types.tolist()
+    net_arr = calc.gross_to_net_array(gross)
+    nets = net_arr.tolist()
+
+    cases = [
+        ('gross_to_net',
+         lambda: [calc.gross_monthly_to_net_monthly(g) for g in values],
+         lambda: calc.gross_to_net_array(gross)),
+        ('calc_net_with_retirement',
+         lambda: [calc.calc_net_with_retirement(t, g) for t, g in zip(type_list, values)],
+         lambda: calc.calc_net_with_retirement_array(types, gross)),
+        ('estimate_gross_from_net',
+         lambda: [calc.estimate_gross_from_net(n) for n in nets],
+         lambda: calc.estimate_gross_from_net_array(net_arr)),
+    ]
+
+    print(f"입력 {len(gross):,}건 (구간 경계 근처 {n_edges:,}건 포함)")
+    print(f"{'함수':<26} {'스칼라(s)':>10} {'배열(ms)':>10} {'배율':>8}  결과")
+    print('-' * 70)
+
+    all_same = True
+    for name, scalar_fn, array_fn in cases:
+        scalar_t, scalar_out = _time_it(scalar_fn, 1)
+        array_t, array_out   = _time_it(array_fn, args.repeat)
+        mismatch = int(np.count_nonzero(np.asarray(scalar_out, dtype=np.int64) != array_out))
+        all_same &= mismatch == 0
+        speedup = scalar_t / array_t if array_t > 0 else float('inf')
+        print(f"{name:<26} {scalar_t:>10.2f} {array_t * 1000:>10.1f} {speedup:>7.0f}x  "
+              f"{'동일' if mismatch == 0 else f'불일치 {mismatch:,}건!'}")
+
+    # 역산 검증: g 의 Net 은 target 이상, g-1 의 Net 은 target 미만
+    est = calc.estimate_gross_from_net_array(net_arr)
+    inverse_ok = bool(np.all(calc.gross_to_net_array(est) >= net_arr)
+                      and np.all(calc.gross_to_net_array(est - 1) < net_arr))
+    all_same &= inverse_ok
+    print(f"{'역산 최소 Gross 검증':<24} {'통과' if inverse_ok else '실패!'}")
+
+    print()
+    if not all_same:
+        print("[FAIL] 스칼라 계산과 결과가 다릅니다.")
+        sys.exit(1)
+    print("[OK] 모든 입력에서 스칼라 계산과 원 단위까지 동일")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+build_withholding_table.py — 근로소득 간이세액표 CSV 생성 (withholding_table.py 가 읽는 파일)
+─────────────────────────────────────────────────
+두 가지 방법:
+  1. 국세청 배포 엑셀 변환 (권장 — 급여명세서와 원 단위까지 같음)
+       홈택스 > 근로소득 간이세액표 엑셀 내려받기 후
+       python build_withholding_table.py --from-xlsx 근로소득_간이세액표.xlsx --year 2025
+       → withholding_table_2025.csv — salary_calculator 의 해당 연도 규칙
+         withholding_table 을 이 파일로 바꾸면 근사 표 대신 사용
+  2. 소득세법 시행령 [별표 2] 작성 방법으로 직접 계산 (엑셀이 없을 때, 저장소 기본 파일)
+       python build_withholding_table.py --year 2025    → withholding_table_2025_approx.csv
+     구간 중간값 × 12 = 총급여 → 근로소득공제 · 인적공제(150만원 × 가족 수) · 연금보험료공제
+     · 특별소득공제 등(별표 2 산식) → 기본세율 → 근로소득세액공제 → ÷ 12, 10원 미만 절사
+     근사값 — 배포 표와 일부 구간에서 차이가 날 수 있음 (파일명 _approx)
+
+출력 CSV: lower,upper,d1..d11 (원, [lower, upper) 월급여액 구간, 가족 1~11명 월 소득세)
+"""
+
+import argparse
+import csv
+import os
+import sys
+from datetime import date
+
+from salary_calculator import tax_calculator
+from withholding_table import MAX_DEPENDENTS, TABLE_MAX
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 월급여액 구간 (시작, 끝, 간격) — 간이세액표 행 구성
+BRACKETS = [
+    (  770_000,  1_500_000,  5_000),
+    (1_500_000,  3_000_000, 10_000),
+    (3_000_000, TABLE_MAX,  20_000),
+]
+
+
+# ══════════════════════════════════════════════════════════════
+# 별표 2 작성 방법으로 계산
+# ══════════════════════════════════════════════════════════════
+def special_deduction(total, dependents):
+    """특별소득공제 및 특별세액공제 중 일부 (별표 2 산식, 총급여 1억2천만원 이하)"""
+    if dependents <= 2:
+        fixed = 3_100_000 if dependents == 1 else 3_600_000
+        if total <= 30_000_000:
+            return fixed + total * 0.04
+        if total <= 45_000_000:
+            return fixed + total * 0.04 - (total - 30_000_000) * 0.05
+        if total <= 70_000_000:
+            return fixed + total * 0.015
+        return fixed + total * 0.005
+    if total <= 30_000_000:
+        return 5_000_000 + total * 0.07
+    if total <= 45_000_000:
+        return (5_000_000 + total * 0.07 - (total - 30_000_000) * 0.05
+                + max(0, total - 40_000_000) * 0.04)
+    if total <= 70_000_000:
+        return 5_000_000 + total * 0.05 + (total - 40_000_000) * 0.04
+    return 5_000_000 + total * 0.03 + (total - 40_000_000) * 0.04
+
+
+def statutory_tax(calc, monthly, dependents):
+    """월급여액(구간 대표값) → 월 소득세 (10원 미만 절사)"""
+    total    = monthly * 12
+    eid      = calc._earned_income_deduction(total)
+    personal = 1_500_000 * dependents
+    pension  = min(monthly, calc.pension_cap) * calc.pension_rate * 12
+    base     = max(0, total - eid - personal - pension - special_deduction(total, dependents))
+    tax      = calc._income_tax(base)
+    annual   = max(0, tax - calc._tax_credit(tax, total))
+    return int(annual / 12) // 10 * 10
+
+
+def generate_rows(year):
+    calc = tax_calculator(year)
+    rows = []
+    for start, end, step in BRACKETS:
+        for lower in range(start, end, step):
+            mid = (lower + lower + step) / 2
+            rows.append((lower, lower + step)
+                        + tuple(statutory_tax(calc, mid, n) for n in range(1, MAX_DEPENDENTS + 1)))
+    # 정확히 1,000만원 행 (초과분 산식의 기준 세액)
+    rows.append((TABLE_MAX, TABLE_MAX + 1)
+                + tuple(statutory_tax(calc, TABLE_MAX, n) for n in range(1, MAX_DEPENDENTS + 1)))
+    return rows, f"소득세법 시행령 별표 2 작성 방법으로 계산한 근사값 ({calc.year}년 세율 규칙, 국세청 배포 표 아님)"
+
+
+# ══════════════════════════════════════════════════════════════
+# 국세청 엑셀 변환
+# ══════════════════════════════════════════════════════════════
+def read_xlsx(path):
+    """배포 엑셀(천원 단위: 이상, 미만, 가족 1~11명) → 행 목록. 숫자 행만 사용"""
+    import pandas as pd
+
+    df = pd.read_excel(path, header=None)
+    rows = []
+    for values in df.itertuples(index=False):
+        values = list(values)[:2 + MAX_DEPENDENTS]
+        try:
+            lower = int(float(str(values[0]).replace(',', '')))
+        except ValueError:
+            continue
+        # 마지막 '10,000' 행은 미만 칸이 비어 있음 → 정확히 그 금액 1원 구간
+        lower *= 1000
+        upper  = (lower + 1 if pd.isna(values[1])
+                  else int(float(str(values[1]).replace(',', ''))) * 1000)
+        taxes  = [0 if pd.isna(v) or str(v).strip() in ('', '-')
+                  else int(float(str(v).replace(',', ''))) for v in values[2:]]
+        rows.append((lower, upper) + tuple(taxes))
+    if not rows:
+        raise ValueError(f"숫자 행을 찾지 못했습니다: {path}")
+    return rows, f"국세청 간이세액표 엑셀 변환 ({os.path.basename(path)})"
+
+
+def write_csv(path, rows, source):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(f"# 근로소득 간이세액표 — {source}, 생성 {date.today().isoformat()}\n")
+        f.write("# lower 이상 upper 미만 월급여액(비과세 제외, 원) → 공제대상가족 1~11명 월 소득세(원)\n")
+        writer = csv.writer(f)
+        writer.writerow(['lower', 'upper'] + [f'd{n}' for n in range(1, MAX_DEPENDENTS + 1)])
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='근로소득 간이세액표 CSV 생성')
+    parser.add_argument('--from-xlsx', metavar='PATH', help='국세청 배포 간이세액표 엑셀')
+    parser.add_argument('--year', type=int, default=2025,
+                        help='세율 규칙 연도 — 직접 계산 기준 · 출력 파일명 (기본 2025)')
+    parser.add_argument('-o', '--output',
+                        help='출력 CSV (기본 withholding_table_<연도>.csv, 직접 계산은 _approx.csv)')
+    args = parser.parse_args()
+    if not args.output:
+        suffix = '' if args.from_xlsx else '_approx'
+        args.output = os.path.join(_DIR, f'withholding_table_{args.year}{suffix}.csv')
+
+    try:
+        rows, source = read_xlsx(args.from_xlsx) if args.from_xlsx else generate_rows(args.year)
+    except Exception as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+    write_csv(args.output, rows, source)
+    print(f"[OK] {len(rows):,}행 → {args.output}")
+    print(f"     {source}")
+
+
+if __name__ == '__main__':
+    main()
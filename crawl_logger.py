@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+crawl_logger.py — 비동기 구조화(JSON lines) 로거 + 로그 조회
+─────────────────────────────────────────────────
+log() 호출은 큐에 레코드만 넣고 바로 반환하고, 파일 쓰기·화면 출력은
+별도 스레드(logging.handlers.QueueListener)가 처리한다 → 수집 루프가 디스크 I/O 를 기다리지 않음.
+
+  · 파일   : logs/<이름>.jsonl — 1줄 = 1레코드
+             {"ts", "level", "job", "run_id", "msg", + post_id / page / url 등 추가 필드}
+  · 회전   : 크기(기본 10MB) 초과 또는 날짜 변경 시 .1, .2 … 로 밀어냄 (기본 30개 보관)
+  · 추가   : 'a' 모드 — 실행할 때마다(--info 포함) 이전 기록이 지워지지 않음
+  · 화면   : 기존처럼 msg 만 그대로 출력
+  · 레벨   : 지정하지 않으면 ⚠ / [경고] → WARNING, [오류] / [ERROR] / [FAIL] → ERROR
+
+조회:
+    python crawl_logger.py runs                                   # 실행(run_id) 목록
+    python crawl_logger.py query --run 20261017-153000-1234       # 특정 실행
+    python crawl_logger.py query --post 1211147                   # 특정 공고 관련 기록
+    python crawl_logger.py query --level WARNING --since 2026-10-01 --contains 급여
+"""
+
+import argparse
+import atexit
+import glob
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime
+
+_SCRIPT_DIR  = os.path.dirname(os.path.abspath(__file__))
+LOG_DIR      = os.path.join(_SCRIPT_DIR, 'logs')
+MAX_BYTES    = 10 * 1024 * 1024   # 파일 1개 최대 크기
+BACKUP_COUNT = 30                 # 회전 보관 개수
+
+_WARN_MARKS  = ('⚠', '[경고]', '[WARN')
+_ERROR_MARKS = ('[오류]', '[ERROR]', '[DB오류]', '[FAIL]')
+
+
+def new_run_id():
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+def guess_level(msg):
+    if any(m in msg for m in _ERROR_MARKS):
+        return logging.ERROR
+    if any(m in msg for m in _WARN_MARKS):
+        return logging.WARNING
+    return logging.INFO
+
+
+class _JsonFormatter(logging.Formatter):
+    def format(self, record):
+        data = {
+            'ts':     datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level':  record.levelname,
+            'job':    getattr(record, 'job', None),
+            'run_id': getattr(record, 'run_id', None),
+            'msg':    record.getMessage().strip('\n'),
+        }
+        data.update(getattr(record, 'fields', None) or {})
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _ConsoleHandler(logging.Handler):
+    """기존 log() 와 같은 화면 출력 (utf-8 바이트로 쓰고, 안 되면 str 로)"""
+
+    def emit(self, record):
+        text = record.getMessage() + '\n'
+        try:
+            sys.stdout.buffer.write(text.encode('utf-8'))
+            sys.stdout.buffer.flush()
+        except Exception:
+            try:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+            except Exception:
+                pass
+
+
+class SizeAndDayRotatingHandler(logging.handlers.RotatingFileHandler):
+    """크기 초과 또는 날짜가 바뀌면 회전 (RotatingFileHandler 번호 방식 그대로)"""
+
+    def __init__(self, path, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+        super().__init__(path, mode='a', maxBytes=max_bytes,
+                         backupCount=backup_count, encoding='utf-8')
+        self._day = self._file_day()
+
+    def _file_day(self):
+        try:
+            return datetime.fromtimestamp(os.path.getmtime(self.baseFilename)).date()
+        except OSError:
+            return datetime.now().date()
+
+    def shouldRollover(self, record):
+        if self.stream is not None and self.stream.tell() > 0 \
+                and datetime.fromtimestamp(record.created).date() != self._day:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self._day = datetime.now().date()
+
+
+class CrawlLogger:
+    """큐 기반 비동기 로거. log(msg, **fields) 는 큐에 넣기만 한다."""
+
+    def __init__(self, path, job, run_id=None, echo=True,
+                 max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path   = path
+        self.job    = job
+        self.run_id = run_id or new_run_id()
+
+        file_handler = SizeAndDayRotatingHandler(path, max_bytes, backup_count)
+        file_handler.setFormatter(_JsonFormatter())
+        handlers = [file_handler] + ([_ConsoleHandler()] if echo else [])
+
+        self._queue    = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(self._queue, *handlers,
+                                                        respect_handler_level=False)
+        # 이름별 logger 를 쓰지 않고 직접 레코드를 만들어 큐에 넣음 (전역 logging 설정과 무관)
+        self._logger = logging.Logger(f"crawl.{job}", logging.DEBUG)
+        self._logger.addHandler(logging.handlers.QueueHandler(self._queue))
+        self._listener.start()
+        self._closed = False
+        atexit.register(self.close)
+
+    def log(self, msg, level=None, **fields):
+        msg = str(msg)
+        if level is None:
+            level = guess_level(msg)
+        elif isinstance(level, str):
+            level = logging.getLevelName(level.upper())
+        self._logger.log(level, '%s', msg, extra={
+            'job': self.job, 'run_id': self.run_id,
+            'fields': {k: v for k, v in fields.items() if v is not None},
+        })
+
+    def close(self):
+        """큐에 남은 레코드를 모두 쓴 뒤 종료 (여러 번 호출해도 안전)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+
+
+# ============================================================
+# 조회
+# ============================================================
+def iter_records(paths):
+    """회전 파일 포함 오래된 파일부터 레코드 순회 (깨진 줄은 건너뜀)"""
+    def age_key(path):
+        suffix = path.rsplit('.', 1)[-1]
+        return -int(suffix) if suffix.isdigit() else 0
+
+    for path in sorted(paths, key=lambda p: (p.split('.jsonl')[0], age_key(p))):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def _default_paths():
+    return glob.glob(os.path.join(LOG_DIR, '*.jsonl')) + \
+        glob.glob(os.path.join(LOG_DIR, '*.jsonl.*'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON lines 로그 조회')
+    sub = parser.add_subparsers(dest='cmd', required=True)
+
+    q = sub.add_parser('query', help='조건에 맞는 레코드 출력')
+    q.add_argument('--run', help='run_id')
+    q.add_argument('--job', help='crawler / backfill / ...')
+    q.add_argument('--post', help='post_id (또는 url 에 포함된 번호)')
+    q.add_argument('--level', help='이 레벨 이상 (INFO / WARNING / ERROR)')
+    q.add_argument('--since', help='이 시각 이후 (YYYY-MM-DD[THH:MM])')
+    q.add_argument('--contains', help='msg 에 포함된 문자열')
+    q.add_argument('--json', action='store_true', help='원본 JSON 그대로 출력')
+    q.add_argument('files', nargs='*', help=f'로그 파일 (기본 {LOG_DIR}/*.jsonl*)')
+
+    r = sub.add_parser('runs', help='실행(run_id)별 시작·종료 시각과 경고/오류 수')
+    r.add_argument('files', nargs='*')
+    args = parser.parse_args()
+
+    records = iter_records(args.files or _default_paths())
+
+    if args.cmd == 'runs':
+        runs = {}
+        for rec in records:
+            key = (rec.get('job'), rec.get('run_id'))
+            info = runs.setdefault(key, {'first': rec['ts'], 'last': rec['ts'],
+                                         'n': 0, 'WARNING': 0, 'ERROR': 0})
+            info['last'] = rec['ts']
+            info['n'] += 1
+            if rec.get('level') in ('WARNING', 'ERROR'):
+                info[rec['level']] += 1
+        for (job, run_id), info in sorted(runs.items(), key=lambda kv: kv[1]['first']):
+            print(f"{info['first'][:19]} ~ {info['last'][11:19]}  {job or '-':<9} {run_id}  "
+                  f"{info['n']:>6}줄  경고 {info['WARNING']}  오류 {info['ERROR']}")
+        return
+
+    min_level = logging.getLevelName(args.level.upper()) if args.level else 0
+    for rec in records:
+        if args.run and rec.get('run_id') != args.run:
+            continue
+        if args.job and rec.get('job') != args.job:
+            continue
+        if args.post and str(rec.get('post_id')) != args.post \
+                and args.post not in str(rec.get('url', '')):
+            continue
+        if min_level and logging.getLevelName(rec.get('level', 'INFO')) < min_level:
+            continue
+        if args.since and rec.get('ts', '') < args.since:
+            continue
+        if args.contains and args.contains not in rec.get('msg', ''):
+            continue
+        if args.json:
+            print(json.dumps(rec, ensure_ascii=False))
+        else:
+            extra = {k: v for k, v in rec.items()
+                     if k not in ('ts', 'level', 'job', 'run_id', 'msg')}
+            print(f"{rec['ts'][:19]} {rec.get('level', ''):<7} {rec.get('msg', '').strip()}"
+                  f"{'  ' + json.dumps(extra, ensure_ascii=False) if extra else ''}")
+
+
+if __name__ == '__main__':
+    main()
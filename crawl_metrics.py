@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+crawl_metrics.py — 크롤러 / 급여 backfill 공용 지표 (카운터 · 히스토그램)
+─────────────────────────────────────────────────
+외부 라이브러리 없이 OpenMetrics 텍스트 형식으로 내보낸다.
+
+  · HTTP      : start_http_server(port) → http://localhost:PORT/metrics (Prometheus 수집용)
+  · textfile  : write_textfile('x.prom') — node_exporter textfile collector 용 (원자적 교체)
+  · JSON 요약 : write_json('x.json') — 실행 1회 요약 (카운터 + 히스토그램 count/sum/평균/p50/p95)
+
+사용:
+    from crawl_metrics import Metrics
+    METRICS = Metrics(job='crawler')
+    METRICS.describe('medigate_detail_page_seconds', 'histogram', '상세 페이지 처리 시간')
+    with METRICS.timer('medigate_detail_page_seconds'):
+        ...
+    METRICS.inc('medigate_retries_total', kind='detail')
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 페이지 로드 / DB 왕복 모두 담을 수 있는 초 단위 구간
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0)
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _fmt_labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def _fmt_value(v):
+    if isinstance(v, float):
+        if math.isinf(v):
+            return '+Inf'
+        return repr(round(v, 6))
+    return str(v)
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'counts', 'count', 'sum', 'min', 'max')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts  = [0] * len(buckets)
+        self.count   = 0
+        self.sum     = 0.0
+        self.min     = math.inf
+        self.max     = -math.inf
+
+    def observe(self, value):
+        self.count += 1
+        self.sum   += value
+        self.min    = min(self.min, value)
+        self.max    = max(self.max, value)
+        for i, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.counts[i] += 1
+                break
+
+    def quantile(self, q):
+        """구간 안 선형 보간으로 추정한 분위수 (관측 없으면 None).
+        추정값은 실제 관측 최솟값~최댓값 범위로 자른다.
+        """
+        if self.count == 0:
+            return None
+        target = q * self.count
+        seen   = 0
+        lower  = 0.0
+        estimate = self.max   # 최대 구간 초과분
+        for upper, n in zip(self.buckets, self.counts):
+            if n and seen + n >= target:
+                estimate = lower + (upper - lower) * (target - seen) / n
+                break
+            seen += n
+            lower = upper
+        return min(max(estimate, self.min), self.max)
+
+
+class Metrics:
+    """카운터 / 히스토그램 레지스트리 (thread-safe).
+    describe() 하지 않은 이름도 inc() 는 counter, observe() 는 histogram 으로 자동 등록된다.
+    """
+
+    def __init__(self, job, **const_labels):
+        self.job          = job
+        self.const_labels = dict(const_labels, job=job)
+        self.started_at   = datetime.now()
+        self._lock        = threading.Lock()
+        self._meta        = {}   # name → (kind, help, buckets)
+        self._counters    = {}   # name → {label_key: value}
+        self._hists       = {}   # name → {label_key: _Histogram}
+        self._server      = None
+
+    # ── 등록 / 기록 ────────────────────────────────────────
+    def describe(self, name, kind, help_text, buckets=DEFAULT_BUCKETS):
+        with self._lock:
+            self._meta[name] = (kind, help_text, tuple(buckets))
+
+    def inc(self, name, amount=1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._meta.setdefault(name, ('counter', '', DEFAULT_BUCKETS))
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            meta   = self._meta.setdefault(name, ('histogram', '', DEFAULT_BUCKETS))
+            series = self._hists.setdefault(name, {})
+            hist   = series.get(key)
+            if hist is None:
+                hist = series[key] = _Histogram(meta[2])
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """with 블록 소요 시간을 히스토그램에 기록 (예외가 나도 기록)"""
+        t0 = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(name, time.monotonic() - t0, **labels)
+
+    # ── 내보내기 ───────────────────────────────────────────
+    def render(self):
+        """OpenMetrics 텍스트"""
+        const = tuple(sorted(self.const_labels.items()))
+        lines = []
+        with self._lock:
+            for name in sorted(self._meta):
+                kind, help_text, _ = self._meta[name]
+                base = name[:-6] if kind == 'counter' and name.endswith('_total') else name
+                lines.append(f"# TYPE {base} {kind}")
+                if help_text:
+                    lines.append(f"# HELP {base} {help_text}")
+                if kind == 'counter':
+                    for key, value in sorted(self._counters.get(name, {}).items()):
+                        lines.append(f"{base}_total{_fmt_labels(const + key)} {_fmt_value(value)}")
+                    continue
+                for key, hist in sorted(self._hists.get(name, {}).items()):
+                    cumulative = 0
+                    for upper, n in zip(hist.buckets, hist.counts):
+                        cumulative += n
+                        labels = _fmt_labels(const + key + (('le', _fmt_value(float(upper))),))
+                        lines.append(f"{name}_bucket{labels} {cumulative}")
+                    labels = _fmt_labels(const + key + (('le', '+Inf'),))
+                    lines.append(f"{name}_bucket{labels} {hist.count}")
+                    lines.append(f"{name}_count{_fmt_labels(const + key)} {hist.count}")
+                    lines.append(f"{name}_sum{_fmt_labels(const + key)} {_fmt_value(hist.sum)}")
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def summary(self):
+        """실행 요약 dict — 라벨은 'a=1,b=2' 문자열 키로"""
+        def label_str(key):
+            return ','.join(f"{k}={v}" for k, v in key) or '_'
+
+        with self._lock:
+            counters = {
+                name: {label_str(k): round(v, 3) if isinstance(v, float) else v
+                       for k, v in sorted(series.items())}
+                for name, series in sorted(self._counters.items())
+            }
+            hists = {}
+            for name, series in sorted(self._hists.items()):
+                hists[name] = {}
+                for key, h in sorted(series.items()):
+                    p50, p95 = h.quantile(0.5), h.quantile(0.95)
+                    hists[name][label_str(key)] = {
+                        'count': h.count,
+                        'sum':   round(h.sum, 3),
+                        'mean':  round(h.sum / h.count, 3) if h.count else None,
+                        'p50':   round(p50, 3) if p50 is not None else None,
+                        'p95':   round(p95, 3) if p95 is not None else None,
+                    }
+        return {
+            'job':        self.job,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'ended_at':   datetime.now().isoformat(timespec='seconds'),
+            'counters':   counters,
+            'histograms': hists,
+        }
+
+    @staticmethod
+    def _atomic_write(path, text):
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    def write_textfile(self, path):
+        """node_exporter textfile collector 용 .prom 파일 (쓰는 도중 읽혀도 깨지지 않게 교체)"""
+        self._atomic_write(path, self.render())
+
+    def write_json(self, path, **extra):
+        data = self.summary()
+        data.update(extra)
+        self._atomic_write(path, json.dumps(data, ensure_ascii=False, indent=2))
+
+    def start_http_server(self, port, bind='127.0.0.1'):
+        """백그라운드 스레드로 /metrics 제공 → 실제 포트 반환 (port=0 이면 자동)"""
+        metrics = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                data = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((bind, port), _Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address[1]
+
+    def stop_http_server(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,641 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+crawl_shards.py — 목록 페이지 분할(샤드) 병렬 수집
+─────────────────────────────────────────────────
+phase4_crawler.py 의 수집 루프(range(1, last_page + 1))를 페이지 구간(샤드)으로 나눠
+여러 워커 프로세스가 DB 임대(lease) 테이블을 통해 나눠 가져가며 수집한다.
+워커는 한 PC 에 여러 개, 또는 다른 PC 에서 같은 DB 를 바라보고 실행할 수 있다.
+
+  · crawl_runs          — 실행 1회 정보 (날짜 범위, 전역 요청 예산, 총 페이지)
+  · crawl_shard_leases  — 샤드별 상태 pending → leased → done (skipped / failed)
+      - 워커는 FOR UPDATE SKIP LOCKED 로 샤드 1개를 임대하고
+        페이지마다 lease_until 을 연장(heartbeat)하며 진행 페이지(done_page)·통계를 기록
+      - 임대 만료(워커 종료·멈춤) 샤드는 다른 워커가 done_page 다음부터 이어받음
+  · 전역 요청 예산(--rate-budget, 분당 요청 수)은 crawl_runs.next_slot 하나를 모든 워커가
+    함께 쓰는 DB 요청 슬롯으로 지킴 — 목록·상세 요청마다 다음 슬롯을 60/예산 초 뒤로 미루고
+    받은 슬롯 시각까지 대기 → 워커 수·합류 시점과 무관하게 사이트가 보는 속도는 예산 이하
+  · 저장은 기존 BatchWriter(ON CONFLICT) 그대로 → 워커 간 중복 공고는 자동 스킵
+
+실행:
+    # 코디네이터: 샤드 생성 + 이 PC 에서 워커 4개 실행 + 완료 후 통계 합산
+    python crawl_shards.py coordinator --workers 4
+    python crawl_shards.py coordinator --workers 4 --from 2025-04-01 --rate-budget 40
+
+    # 다른 PC 에서 같은 실행에 워커 추가 (코디네이터 로그의 run_id 사용)
+    python crawl_shards.py worker 20261017-153000
+
+    # 진행 현황 / 중단된 실행 다시 붙기
+    python crawl_shards.py status 20261017-153000
+    python crawl_shards.py coordinator --run 20261017-153000 --workers 4
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import psycopg2
+from bs4 import BeautifulSoup
+
+import phase4_crawler as crawler
+from phase4_crawler import (
+    log, close_log, validate_date, setup_driver, open_session, load_page,
+    get_total_pages, extract_posts_from_html, extract_posts_from_driver,
+    find_start_page, ensure_unique_index, ensure_card_columns, collect_new_items,
+    save_new_items, mark_missed,
+    pause, BatchWriter, CrawlStats, RateLimiter,
+)
+
+# ============================================================
+# 설정
+# ============================================================
+SHARD_SIZE          = 20    # 샤드 1개당 목록 페이지 수
+SHARD_OVERLAP       = 1     # 샤드 끝에서 다음 샤드 첫 페이지까지 추가로 읽음 (수집 중 목록 밀림 대비)
+LEASE_SECONDS       = 300   # 임대 유효 시간 — 페이지 처리마다 연장
+MAX_SHARD_ATTEMPTS  = 3     # 샤드 임대 최대 횟수 (초과 시 failed)
+MONITOR_INTERVAL    = 15    # 코디네이터 상태 확인 간격(초)
+DEFAULT_RATE_BUDGET = 30.0  # 전역 요청 예산 (분당, 목록+상세 합산) — 단일 프로세스 수준
+MAX_RESPAWN         = 3     # 로컬 워커 슬롯당 재시작 최대 횟수
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _safe_name(name):
+    return ''.join(c if c.isalnum() or c in '-_' else '_' for c in name)
+
+
+def _use_log(name, run_id=None):
+    """프로세스마다 로그 파일을 따로 사용 (여러 프로세스가 한 파일을 회전시키지 않도록).
+    run_id 를 같게 두면 crawl_logger.py query --run 으로 전체 워커 기록을 한 번에 조회
+    """
+    safe = _safe_name(name)
+    crawler.LOG_PATH   = os.path.join(crawler.LOG_DIR, f'crawl_shard_{safe}.jsonl')
+    crawler.LOG_RUN_ID = run_id
+
+
+# ============================================================
+# DB — 실행 / 샤드 임대 테이블
+# ============================================================
+def ensure_shard_tables(conn):
+    cur = conn.cursor()
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS crawl_runs (
+            run_id      TEXT PRIMARY KEY,
+            date_from   TEXT,
+            date_to     TEXT,
+            rate_budget REAL,
+            last_page   INTEGER,
+            created_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+            finished_at TIMESTAMPTZ
+        )
+    """)
+    cur.execute("ALTER TABLE crawl_runs ADD COLUMN IF NOT EXISTS next_slot TIMESTAMPTZ")
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS crawl_shard_leases (
+            run_id      TEXT    NOT NULL REFERENCES crawl_runs(run_id) ON DELETE CASCADE,
+            shard_no    INTEGER NOT NULL,
+            page_from   INTEGER NOT NULL,
+            page_to     INTEGER NOT NULL,
+            status      TEXT    NOT NULL DEFAULT 'pending',
+            worker      TEXT,
+            lease_until TIMESTAMPTZ,
+            attempts    INTEGER NOT NULL DEFAULT 0,
+            done_page   INTEGER,
+            stats       JSONB,
+            error       TEXT,
+            updated_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (run_id, shard_no)
+        )
+    """)
+    conn.commit()
+    cur.close()
+
+
+def create_run(conn, date_from, date_to, rate_budget, start_page, last_page, shard_size):
+    """실행 1건과 샤드 목록 생성 → run_id 반환"""
+    run_id = datetime.now().strftime('%Y%m%d-%H%M%S')
+    cur = conn.cursor()
+    cur.execute("""
+        INSERT INTO crawl_runs (run_id, date_from, date_to, rate_budget, last_page)
+        VALUES (%s, %s, %s, %s, %s)
+    """, (run_id, date_from, date_to, rate_budget, last_page))
+    shard_no = 0
+    for page_from in range(start_page, last_page + 1, shard_size):
+        shard_no += 1
+        cur.execute("""
+            INSERT INTO crawl_shard_leases (run_id, shard_no, page_from, page_to)
+            VALUES (%s, %s, %s, %s)
+        """, (run_id, shard_no, page_from, min(page_from + shard_size - 1, last_page)))
+    conn.commit()
+    cur.close()
+    return run_id, shard_no
+
+
+def load_run(conn, run_id):
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT date_from, date_to, rate_budget, last_page, finished_at
+        FROM crawl_runs WHERE run_id = %s
+    """, (run_id,))
+    row = cur.fetchone()
+    cur.close()
+    if row is None:
+        return None
+    return {'date_from': row[0], 'date_to': row[1], 'rate_budget': row[2],
+            'last_page': row[3], 'finished_at': row[4]}
+
+
+def lease_shard(conn, run_id, worker):
+    """대기(또는 임대 만료) 샤드 1개를 임대. 없으면 None.
+    SKIP LOCKED 로 여러 워커가 동시에 호출해도 같은 샤드를 받지 않는다.
+    """
+    cur = conn.cursor()
+    cur.execute("""
+        UPDATE crawl_shard_leases s
+        SET status      = 'leased',
+            worker      = %s,
+            attempts    = s.attempts + 1,
+            lease_until = now() + make_interval(secs => %s),
+            updated_at  = now()
+        WHERE s.run_id = %s
+          AND s.shard_no = (
+              SELECT shard_no FROM crawl_shard_leases
+              WHERE run_id = %s
+                AND attempts < %s
+                AND (status = 'pending'
+                     OR (status = 'leased' AND lease_until < now()))
+              ORDER BY shard_no
+              LIMIT 1
+              FOR UPDATE SKIP LOCKED
+          )
+        RETURNING shard_no, page_from, page_to, done_page, stats, attempts
+    """, (worker, LEASE_SECONDS, run_id, run_id, MAX_SHARD_ATTEMPTS))
+    row = cur.fetchone()
+    conn.commit()
+    cur.close()
+    if row is None:
+        return None
+    return {'shard_no': row[0], 'page_from': row[1], 'page_to': row[2],
+            'done_page': row[3], 'stats': row[4] or {}, 'attempts': row[5]}
+
+
+def heartbeat(conn, run_id, shard_no, worker, done_page, stats):
+    """임대 연장 + 진행 페이지·통계 기록. 임대를 잃었으면(다른 워커가 회수) False"""
+    cur = conn.cursor()
+    cur.execute("""
+        UPDATE crawl_shard_leases
+        SET lease_until = now() + make_interval(secs => %s),
+            done_page   = %s,
+            stats       = %s,
+            updated_at  = now()
+        WHERE run_id = %s AND shard_no = %s AND worker = %s AND status = 'leased'
+        RETURNING 1
+    """, (LEASE_SECONDS, done_page, json.dumps(stats.as_dict()), run_id, shard_no, worker))
+    ok = cur.fetchone() is not None
+    conn.commit()
+    cur.close()
+    return ok
+
+
+def finish_shard(conn, run_id, shard_no, worker, status, stats, error=None):
+    """샤드 종료 처리. status='pending' 이면 반납(재시도 가능 횟수 초과 시 failed)"""
+    cur = conn.cursor()
+    cur.execute("""
+        UPDATE crawl_shard_leases
+        SET status      = CASE WHEN %s = 'pending' AND attempts >= %s THEN 'failed'
+                               ELSE %s END,
+            lease_until = NULL,
+            stats       = %s,
+            error       = %s,
+            updated_at  = now()
+        WHERE run_id = %s AND shard_no = %s AND worker = %s AND status = 'leased'
+    """, (status, MAX_SHARD_ATTEMPTS, status, json.dumps(stats.as_dict()),
+          error, run_id, shard_no, worker))
+    conn.commit()
+    cur.close()
+
+
+def skip_shards_after(conn, run_id, page):
+    """page 이후 구간이 --from 이전 날짜로 확인되면 남은 대기 샤드를 건너뜀"""
+    cur = conn.cursor()
+    cur.execute("""
+        UPDATE crawl_shard_leases SET status = 'skipped', updated_at = now()
+        WHERE run_id = %s AND status = 'pending' AND page_from > %s
+    """, (run_id, page))
+    n = cur.rowcount
+    conn.commit()
+    cur.close()
+    return n
+
+
+def reclaim_expired(conn, run_id):
+    """임대 만료 샤드 회수 → [(shard_no, worker, 새 상태)]"""
+    cur = conn.cursor()
+    cur.execute("""
+        UPDATE crawl_shard_leases
+        SET status      = CASE WHEN attempts >= %s THEN 'failed' ELSE 'pending' END,
+            lease_until = NULL,
+            error       = '임대 만료 (워커 응답 없음)',
+            updated_at  = now()
+        WHERE run_id = %s AND status = 'leased' AND lease_until < now()
+        RETURNING shard_no, worker, status
+    """, (MAX_SHARD_ATTEMPTS, run_id))
+    rows = cur.fetchall()
+    conn.commit()
+    cur.close()
+    return rows
+
+
+def seen_window(conn, run_id):
+    """실행 시작 이후 목록에서 본 공고의 (시작 시각, 최소 등록일, 최대 등록일)"""
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT r.created_at, MIN(p.register_date), MAX(p.register_date)
+        FROM crawl_runs r
+        LEFT JOIN recruit_posts p
+               ON p.source = 'medigate' AND p.last_seen_at >= r.created_at
+              AND p.register_date <> ''
+        WHERE r.run_id = %s
+        GROUP BY r.created_at
+    """, (run_id,))
+    row = cur.fetchone()
+    cur.close()
+    return row if row else (None, None, None)
+
+
+def shard_summary(conn, run_id):
+    """상태별 샤드 수와 전체 샤드 통계 합계"""
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT status, stats FROM crawl_shard_leases WHERE run_id = %s
+    """, (run_id,))
+    rows = cur.fetchall()
+    conn.commit()
+    cur.close()
+    counts = {}
+    total  = CrawlStats()
+    for status, stats in rows:
+        counts[status] = counts.get(status, 0) + 1
+        for name, value in (stats or {}).items():
+            if name in CrawlStats.FIELDS:
+                setattr(total, name, getattr(total, name) + int(value))
+    return counts, total
+
+
+# ============================================================
+# 워커
+# ============================================================
+class SharedRateLimiter(RateLimiter):
+    """실행의 모든 워커가 crawl_runs.next_slot 으로 요청 슬롯을 나눠 받는 전역 제한기.
+
+    acquire 마다 next_slot = max(next_slot, 지금) + 60/예산 초 로 한 칸 예약하고
+    예약한 슬롯 시각까지 대기 → 합산 속도가 예산을 넘지 않음 (DB 시계 기준).
+    수집 트랜잭션과 섞이지 않도록 전용 연결을 쓴다.
+    """
+
+    def __init__(self, conn, run_id, rate_per_min):
+        super().__init__(rate_per_min=rate_per_min)
+        self.conn   = conn
+        self.run_id = run_id
+
+    def acquire(self):
+        """다음 전역 요청 슬롯까지 대기"""
+        with self._lock:
+            cur = self.conn.cursor()
+            try:
+                cur.execute("""
+                    WITH slot AS (
+                        SELECT GREATEST(COALESCE(next_slot, clock_timestamp()),
+                                        clock_timestamp()) AS start_at
+                        FROM   crawl_runs WHERE run_id = %s FOR UPDATE
+                    )
+                    UPDATE crawl_runs r
+                    SET    next_slot = slot.start_at + make_interval(secs => %s)
+                    FROM   slot
+                    WHERE  r.run_id = %s
+                    RETURNING EXTRACT(EPOCH FROM slot.start_at - clock_timestamp())
+                """, (self.run_id, 60.0 / self.rate_per_min, self.run_id))
+                wait = float(cur.fetchone()[0])
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            finally:
+                cur.close()
+        if wait > 0:
+            pause(wait)
+
+
+def crawl_shard(conn, driver, writer, limiter, run, run_id, shard, worker):
+    """샤드 1개 수집. 정상 종료 시 'done', 임대를 잃으면 None"""
+    date_from = run['date_from']
+    date_to   = run['date_to']
+    stats     = CrawlStats(**shard['stats'])
+    first     = max(shard['page_from'], (shard['done_page'] or 0) + 1)
+    last      = min(shard['page_to'] + SHARD_OVERLAP, run['last_page'])
+
+    pages_past_range = 0
+    for page in range(first, last + 1):
+        limiter.acquire()
+        load_page(driver, page)
+        posts = extract_posts_from_driver(driver)
+
+        dates_on_page = [p['register_date'] for p in posts if p.get('register_date')]
+        if date_from and dates_on_page and max(dates_on_page) < date_from:
+            pages_past_range += 1
+            if pages_past_range >= 2 or page >= shard['page_to']:
+                n = skip_shards_after(conn, run_id, page)
+                log(f"  [샤드 {shard['shard_no']}] 페이지 {page}: 수집 범위({date_from}) 이전 → "
+                    f"샤드 종료, 이후 대기 샤드 {n}개 건너뜀")
+                break
+        else:
+            pages_past_range = 0
+
+        if posts:
+            new_items = collect_new_items(conn, posts, date_from, date_to, stats, writer)
+            save_new_items(writer, driver, None, new_items, stats, limiter=limiter)
+
+        if not heartbeat(conn, run_id, shard['shard_no'], worker, page, stats):
+            log(f"  [샤드 {shard['shard_no']}] 임대 회수됨 → 중단 (페이지 {page})")
+            return None
+        log(f"  [샤드 {shard['shard_no']}] 페이지 {page}/{last} "
+            f"| 공고 {len(posts)} | 누적 신규 {stats.saved}건 "
+            f"| 전역 {limiter.rate_per_min:g}건/분")
+
+    finish_shard(conn, run_id, shard['shard_no'], worker, 'done', stats)
+    return 'done'
+
+
+def run_worker(run_id, name=None):
+    worker = name or f"{socket.gethostname()}:{os.getpid()}"
+    _use_log(worker, run_id)
+    log("=" * 62)
+    log(f"  샤드 워커 {worker}  (run {run_id})")
+    log(f"  시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    log("=" * 62)
+
+    try:
+        conn = psycopg2.connect(**crawler.DB_CONFIG)
+    except Exception as e:
+        log(f"    DB 연결 실패: {e}")
+        sys.exit(1)
+
+    run = load_run(conn, run_id)
+    if run is None:
+        log(f"    실행 {run_id} 없음. 종료합니다.")
+        conn.close()
+        sys.exit(1)
+
+    driver = setup_driver(cache_name=f'shard_{_safe_name(worker)}')
+    if not open_session(driver):
+        log("로그인 실패. 종료합니다.")
+        driver.quit()
+        conn.close()
+        sys.exit(1)
+
+    writer  = BatchWriter(conn)
+    limiter = SharedRateLimiter(psycopg2.connect(**crawler.DB_CONFIG), run_id, run['rate_budget'])
+    n_done  = 0
+    try:
+        while True:
+            shard = lease_shard(conn, run_id, worker)
+            if shard is None:
+                break
+            resumed = (f", {shard['done_page']}페이지까지 완료분 이어받음"
+                       if shard['done_page'] else '')
+            log(f"\n[샤드 {shard['shard_no']}] 페이지 {shard['page_from']}~{shard['page_to']} 임대 "
+                f"(시도 {shard['attempts']}/{MAX_SHARD_ATTEMPTS}{resumed})")
+            try:
+                if crawl_shard(conn, driver, writer, limiter, run, run_id, shard, worker):
+                    n_done += 1
+            except Exception as e:
+                conn.rollback()
+                log(f"  ⚠ 샤드 {shard['shard_no']} 오류 → 반납: {e}")
+                finish_shard(conn, run_id, shard['shard_no'], worker, 'pending',
+                             CrawlStats(**shard['stats']), error=str(e)[:500])
+    finally:
+        driver.quit()
+        limiter.conn.close()
+        conn.close()
+        log(f"\n  워커 종료: 완료 샤드 {n_done}개")
+        close_log()
+
+
+# ============================================================
+# 코디네이터
+# ============================================================
+def _spawn_worker(run_id, name):
+    """로컬 워커 프로세스 실행. stdout/stderr 는 logs/crawl_shard_<워커>.out 에 이어 씀
+    (로거 시작 전 import 오류·트레이스백도 남도록)"""
+    os.makedirs(crawler.LOG_DIR, exist_ok=True)
+    out_path = os.path.join(crawler.LOG_DIR, f'crawl_shard_{_safe_name(name)}.out')
+    with open(out_path, 'ab') as out:
+        return subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), 'worker', run_id, '--name', name],
+            stdout=out, stderr=subprocess.STDOUT,
+        )
+
+
+def plan_pages(conn, date_to):
+    """1페이지로 총 페이지 수 확인 (+ --to 과거 구간이면 시작 페이지 이분 탐색)"""
+    driver = setup_driver(cache_name='coordinator')
+    try:
+        if not open_session(driver):
+            raise RuntimeError("로그인 실패")
+        load_page(driver, 1)
+        html1     = driver.page_source
+        last_page = get_total_pages(BeautifulSoup(html1, 'html.parser'))
+        start_page = 1
+        if date_to:
+            dates1 = [p['register_date'] for p in extract_posts_from_html(html1)
+                      if p.get('register_date')]
+            if dates1 and min(dates1) > date_to:
+                start_page = find_start_page(driver, date_to, last_page)
+        return start_page, last_page
+    finally:
+        driver.quit()
+
+
+def print_run_status(conn, run_id):
+    counts, total = shard_summary(conn, run_id)
+    n_all = sum(counts.values())
+    desc  = ' / '.join(f"{k} {v}" for k, v in sorted(counts.items()))
+    log(f"  [{datetime.now().strftime('%H:%M:%S')}] 샤드 {n_all}개: {desc} "
+        f"| 처리 {total.processed}건 | 신규 {total.saved}건 | 중복 {total.skipped}건")
+    return counts, total
+
+
+def run_coordinator(args):
+    _use_log('coordinator')
+    log("=" * 62)
+    log("  샤드 병렬 수집 코디네이터")
+    log(f"  시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    log("=" * 62)
+
+    try:
+        conn = psycopg2.connect(**crawler.DB_CONFIG)
+    except Exception as e:
+        log(f"    DB 연결 실패: {e}")
+        sys.exit(1)
+    ensure_unique_index(conn)
+    ensure_card_columns(conn)
+    ensure_shard_tables(conn)
+
+    start_time = datetime.now()
+    if args.run:
+        run_id = args.run
+        run    = load_run(conn, run_id)
+        if run is None:
+            log(f"    실행 {run_id} 없음. 종료합니다.")
+            conn.close()
+            sys.exit(1)
+        log(f"[1] 기존 실행 {run_id} 에 다시 연결")
+    else:
+        date_from = validate_date(args.date_from)
+        date_to   = validate_date(args.date_to)
+        log("[1] 총 페이지 수 확인...")
+        try:
+            start_page, last_page = plan_pages(conn, date_to)
+        except Exception as e:
+            log(f"    페이지 확인 실패: {e}")
+            conn.close()
+            sys.exit(1)
+        if args.last_page:
+            last_page = min(last_page, args.last_page)
+        run_id, n_shards = create_run(conn, date_from, date_to, args.rate_budget,
+                                      start_page, last_page, args.shard_size)
+        log(f"    run_id {run_id}: 페이지 {start_page}~{last_page} → 샤드 {n_shards}개 "
+            f"({args.shard_size}페이지씩)")
+        log(f"    수집 날짜 범위: {date_from or '제한 없음'} ~ {date_to or '제한 없음'}")
+        log(f"    전역 요청 예산: 분당 {args.rate_budget:g}건 (모든 워커가 DB 요청 슬롯 공유)")
+        log(f"    다른 PC 에서 워커 추가: python crawl_shards.py worker {run_id}")
+
+    # ── 로컬 워커 실행
+    host  = socket.gethostname()
+    slots = {}   # 이름 → [Popen, 재시작 횟수]
+    for i in range(args.workers):
+        name = f"{host}-w{i + 1}"
+        slots[name] = [_spawn_worker(run_id, name), 0]
+    log(f"\n[2] 로컬 워커 {len(slots)}개 실행 (로그: logs/crawl_shard_<워커>.jsonl · .out, "
+        f"python crawl_logger.py query --run {run_id})\n")
+
+    # ── 감시 루프: 만료 임대 회수 · 죽은 로컬 워커 재시작 · 진행 현황
+    while True:
+        time.sleep(MONITOR_INTERVAL)
+        for shard_no, worker, status in reclaim_expired(conn, run_id):
+            log(f"  ⚠ 샤드 {shard_no} 임대 만료 (워커 {worker}) → {status}")
+
+        counts, _ = print_run_status(conn, run_id)
+        remaining = counts.get('pending', 0) + counts.get('leased', 0)
+        if remaining == 0:
+            break
+
+        for name, slot in slots.items():
+            proc, respawns = slot
+            if proc.poll() is None:
+                continue
+            if counts.get('pending', 0) and respawns < MAX_RESPAWN:
+                slot[0] = _spawn_worker(run_id, name)
+                slot[1] += 1
+                log(f"  워커 {name} 종료(코드 {proc.returncode}) → 재시작 {slot[1]}/{MAX_RESPAWN}")
+
+        # 로컬 워커가 모두 끝났고 다른 PC 워커도 없으면 종료 (--workers 0 이면 계속 대기)
+        alive = [p for p, _ in slots.values() if p.poll() is None]
+        if slots and not alive and counts.get('leased', 0) == 0:
+            log("  ⚠ 실행 중인 워커 없음 — 남은 샤드는 워커를 추가하거나 --run 으로 다시 진행")
+            break
+
+    for proc, _ in slots.values():
+        proc.wait()
+
+    counts, total = shard_summary(conn, run_id)
+    if counts.get('pending', 0) + counts.get('leased', 0) == 0:
+        cur = conn.cursor()
+        cur.execute("UPDATE crawl_runs SET finished_at = now() WHERE run_id = %s", (run_id,))
+        conn.commit()
+        cur.close()
+
+    # ── 모든 샤드를 끝까지 읽은 경우에만 목록 미노출 공고 처리
+    n_missed = n_inactive = 0
+    if set(counts) <= {'done', 'skipped'}:
+        n_missed, n_inactive = mark_missed(conn, *seen_window(conn, run_id))
+
+    elapsed = (datetime.now() - start_time).seconds
+    log(f"\n{'=' * 62}")
+    log(f"  샤드 병렬 수집 {'완료' if not counts.get('pending') else '중단'}!  (run {run_id})")
+    log(f"  샤드           : " + ' / '.join(f"{k} {v}" for k, v in sorted(counts.items())))
+    log(f"  총 처리 건수   : {total.processed}건  (범위 외 스킵: {total.out_range}건, "
+        f"샤드 경계 겹침 페이지 포함)")
+    log(f"  신규 저장      : {total.saved}건")
+    log(f"  중복 스킵      : {total.skipped}건  (카드 변경 갱신 {total.changed}건)")
+    log(f"  목록 미노출    : {n_missed}건  (→ 비활성 전환 {n_inactive}건)")
+    log(f"  급여 수집      : {total.salary}건 (협의: {total.nego}건, "
+        f"없음: {total.no_salary}건, 오류: {total.sal_err}건)")
+    log(f"  소요 시간      : {elapsed // 60}분 {elapsed % 60}초")
+    log(f"{'=' * 62}")
+    conn.close()
+    close_log()
+
+
+def run_status(run_id):
+    _use_log('status')
+    conn = psycopg2.connect(**crawler.DB_CONFIG)
+    run  = load_run(conn, run_id)
+    if run is None:
+        log(f"실행 {run_id} 없음")
+    else:
+        log(f"run {run_id}: {run['date_from'] or '-'} ~ {run['date_to'] or '-'}, "
+            f"총 {run['last_page']}페이지, 예산 분당 {run['rate_budget']:g}건, "
+            f"{'완료 ' + str(run['finished_at']) if run['finished_at'] else '진행 중'}")
+        print_run_status(conn, run_id)
+    conn.close()
+    close_log()
+
+
+# ============================================================
+# 진입점
+# ============================================================
+def parse_args():
+    parser = argparse.ArgumentParser(description='메디게이트 목록 샤드 병렬 수집')
+    sub = parser.add_subparsers(dest='mode', required=True)
+
+    co = sub.add_parser('coordinator', help='샤드 생성 + 로컬 워커 실행 + 결과 합산')
+    co.add_argument('--workers', type=int, default=2, metavar='N',
+                    help='이 PC 에서 실행할 워커 프로세스 수 (0 = 다른 PC 워커만 사용)')
+    co.add_argument('--shard-size', type=int, default=SHARD_SIZE, metavar='PAGES',
+                    help=f'샤드 1개당 목록 페이지 수 (기본 {SHARD_SIZE})')
+    co.add_argument('--rate-budget', type=float, default=DEFAULT_RATE_BUDGET,
+                    metavar='REQ_PER_MIN',
+                    help=f'전체 워커 합산 분당 요청 수 (기본 {DEFAULT_RATE_BUDGET:g})')
+    co.add_argument('--from', dest='date_from', default=None, help='수집 시작일 (YYYY-MM-DD)')
+    co.add_argument('--to', dest='date_to', default=None, help='수집 종료일 (YYYY-MM-DD)')
+    co.add_argument('--last-page', type=int, default=None, help='수집할 마지막 페이지 (테스트용)')
+    co.add_argument('--run', default=None, metavar='RUN_ID',
+                    help='샤드를 새로 만들지 않고 기존 실행에 다시 연결')
+
+    wk = sub.add_parser('worker', help='샤드를 임대해 수집')
+    wk.add_argument('run_id')
+    wk.add_argument('--name', default=None, help='워커 이름 (기본 호스트:PID)')
+
+    st = sub.add_parser('status', help='실행 진행 현황')
+    st.add_argument('run_id')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.mode == 'coordinator':
+        run_coordinator(args)
+    elif args.mode == 'worker':
+        run_worker(args.run_id, args.name)
+    else:
+        run_status(args.run_id)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+db_config.py — 수집 DB 접속 정보 (크롤러 · backfill · 상세 수집 큐 · 파싱 캐시 · 재계산 공용)
+─────────────────────────────────────────────────
+phase4_crawler.py --enqueue-only 가 큐에 넣은 공고를 salary_backfill.py 워커가 가져가려면
+모든 스크립트가 같은 DB 를 봐야 하므로 접속 정보는 여기 한 곳에만 둔다.
+
+  · 기본 : Supabase pooler (운영 DB — app.py 대시보드가 읽는 DB)
+  · 벤치마크·테스트 DB 로 바꿀 때: CRAWL_DB_DSN="postgresql://user@host/dbname"
+
+사용:
+    from db_config import DB_CONFIG
+    conn = psycopg2.connect(**DB_CONFIG)
+"""
+
+import os
+
+DB_CONFIG = {
+    'host': 'aws-1-ap-northeast-1.pooler.supabase.com',
+    'port': 5432,
+    'dbname': 'postgres',
+    'user': 'postgres.mmqfmdqhujuohypcjkne',
+    'password': 'KUHOHriqT3DdiS7w',
+    'sslmode': 'require',
+}
+if os.environ.get('CRAWL_DB_DSN'):
+    DB_CONFIG = {'dsn': os.environ['CRAWL_DB_DSN']}
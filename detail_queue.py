@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+detail_queue.py — 상세 페이지 수집 작업 큐 (DB 임대 방식)
+─────────────────────────────────────────────────
+목록 수집(phase4_crawler.py --enqueue-only)은 신규 공고를 저장하면서 같은 트랜잭션으로
+이 큐에 넣기만 하고, 상세 페이지 방문은 salary_backfill.py 워커가 큐에서 가져가 처리한다.
+워커는 한 PC 에 여러 개, 또는 다른 PC 에서 같은 DB 를 바라보고 실행할 수 있다.
+
+  · detail_fetch_queue — 공고 1건 = 1행 (recruit_posts.id 기준, 중복 등록 무시)
+      - 워커는 FOR UPDATE SKIP LOCKED 로 LEASE_BATCH 건씩 임대 (lease_until 까지)
+        공고 1건을 처리하기 전마다 배치의 남은 임대를 LEASE_SECONDS 만큼 연장(extend_lease)
+        → 재시도·재로그인으로 배치가 길어져도 다른 워커가 가져가지 않음
+      - 처리 완료 시 행 삭제, 임대 만료(워커 종료·멈춤) 행은 다른 워커가 다시 임대
+      - 실패 시 실패 분류(failure)와 함께 대기로 되돌리고 next_attempt_at 까지 임대 제외
+        (지수 백오프: RETRY_BASE_SECONDS × 2^(시도-1), 최대 RETRY_MAX_SECONDS)
+      - 시도 횟수가 한도(MAX_ATTEMPTS)에 닿으면 status='dropped' 로 남겨 둠 (requeue 로 되살림)
+  · seed_unfetched() — salary_fetched 가 아닌 기존 공고를 한 번에 큐로 (SELECT → INSERT, DB 안에서)
+
+실행:
+    python detail_queue.py status      # 대기 / 임대 중 / 만료 / 재시도 대기 / 포기 건수
+    python detail_queue.py seed        # 급여 미수집 공고를 큐에 추가
+    python detail_queue.py requeue     # 포기(dropped) 작업을 시도 0회로 되돌림
+    python salary_backfill.py          # 워커 1개 (여러 번 실행하면 워커 추가)
+"""
+
+import argparse
+import os
+import socket
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+from db_config import DB_CONFIG
+
+# ============================================================
+# 설정
+# ============================================================
+LEASE_SECONDS = 300   # 임대 유효 시간 (공고 1건 처리 시간보다 넉넉하게 — 건마다 연장)
+LEASE_BATCH   = 10    # 한 번에 임대하는 건수
+
+# ── 실패 재시도 (다음 실행에서 다시 임대)
+MAX_ATTEMPTS       = 5       # 이 횟수만큼 실패하면 포기 (salary_backfill --max-attempts)
+NOT_FOUND_ATTEMPTS = 2       # 삭제된 공고(404)는 한 번만 더 확인하고 포기
+RETRY_BASE_SECONDS = 600     # 첫 재시도까지 10분, 이후 2배씩
+RETRY_MAX_SECONDS  = 86400   # 재시도 간격 상한 (1일)
+
+# 실패 분류 — salary_backfill.FetchFailure.kind
+FAILURE_KINDS = ('timeout', 'login', 'parse', 'not_found', 'error')
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+# ============================================================
+# 테이블
+# ============================================================
+def ensure_queue_table(conn):
+    cur = conn.cursor()
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS detail_fetch_queue (
+            post_db_id  INTEGER PRIMARY KEY REFERENCES recruit_posts(id) ON DELETE CASCADE,
+            post_id     TEXT,
+            url         TEXT    NOT NULL,
+            status      TEXT    NOT NULL DEFAULT 'pending',
+            worker      TEXT,
+            lease_until TIMESTAMPTZ,
+            attempts    INTEGER NOT NULL DEFAULT 0,
+            error       TEXT,
+            failure     TEXT,
+            next_attempt_at TIMESTAMPTZ,
+            enqueued_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            updated_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+    # 재시도 컬럼 이전 버전 테이블 보완
+    cur.execute("ALTER TABLE detail_fetch_queue ADD COLUMN IF NOT EXISTS failure TEXT")
+    cur.execute("ALTER TABLE detail_fetch_queue ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMPTZ")
+    conn.commit()
+    cur.close()
+
+
+# ============================================================
+# 등록
+# ============================================================
+def enqueue(cur, rows):
+    """[(recruit_posts.id, post_id, url)] 등록 — 커밋은 호출한 쪽 트랜잭션에서.
+    이미 큐에 있는 공고는 무시. 반환: 새로 등록된 건수
+    """
+    if not rows:
+        return 0
+    added = execute_values(cur, """
+        INSERT INTO detail_fetch_queue (post_db_id, post_id, url) VALUES %s
+        ON CONFLICT (post_db_id) DO NOTHING
+        RETURNING post_db_id
+    """, rows, page_size=len(rows), fetch=True)
+    return len(added)
+
+
+def seed_unfetched(conn):
+    """salary_fetched 가 아닌 메디게이트 공고를 큐에 추가 → 새로 등록된 건수"""
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            INSERT INTO detail_fetch_queue (post_db_id, post_id, url)
+            SELECT id, post_id, url
+            FROM   recruit_posts
+            WHERE  source = 'medigate'
+              AND  post_id <> ''
+              AND  (salary_fetched IS NULL OR salary_fetched = FALSE)
+            ORDER  BY id
+            ON CONFLICT (post_db_id) DO NOTHING
+        """)
+        n = cur.rowcount
+        conn.commit()
+        return n
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+
+
+# ============================================================
+# 임대 / 완료 / 반납
+# ============================================================
+def lease_batch(conn, worker, n=LEASE_BATCH):
+    """대기(또는 임대 만료) 작업 최대 n건 임대 → [(post_db_id, post_id, url, attempts, register_date)]
+    register_date 는 recruit_posts 값 (Net 환산 세율 규칙 연도용)
+    SKIP LOCKED 로 여러 워커가 동시에 호출해도 같은 행을 받지 않는다.
+    재시도 대기 중(next_attempt_at 이 아직 안 된) 작업은 건너뛴다.
+    """
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            UPDATE detail_fetch_queue q
+            SET status      = 'leased',
+                worker      = %s,
+                attempts    = q.attempts + 1,
+                lease_until = now() + make_interval(secs => %s),
+                updated_at  = now()
+            WHERE q.post_db_id IN (
+                SELECT post_db_id FROM detail_fetch_queue
+                WHERE (status = 'pending'
+                       AND (next_attempt_at IS NULL OR next_attempt_at <= now()))
+                   OR (status = 'leased' AND lease_until < now())
+                ORDER BY post_db_id
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING q.post_db_id, q.post_id, q.url, q.attempts,
+                      (SELECT p.register_date FROM recruit_posts p WHERE p.id = q.post_db_id)
+        """, (worker, LEASE_SECONDS, n))
+        rows = sorted(cur.fetchall())
+        conn.commit()
+        return rows
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+
+
+def extend_lease(conn, post_db_ids, worker):
+    """아직 처리하지 않은 임대 작업의 lease_until 연장 → 이 워커가 계속 가진 post_db_id 집합
+    (임대가 만료돼 다른 워커가 가져간 작업은 빠짐 — 그 작업은 처리하지 말 것)
+    """
+    if not post_db_ids:
+        return set()
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            UPDATE detail_fetch_queue
+            SET lease_until = now() + make_interval(secs => %s), updated_at = now()
+            WHERE post_db_id = ANY(%s) AND worker = %s AND status = 'leased'
+            RETURNING post_db_id
+        """, (LEASE_SECONDS, list(post_db_ids), worker))
+        held = {row[0] for row in cur.fetchall()}
+        conn.commit()
+        return held
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+
+
+def complete(conn, post_db_id, worker):
+    """처리 완료 → 큐에서 삭제 (다른 워커에게 넘어간 행은 건드리지 않음)"""
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            DELETE FROM detail_fetch_queue
+            WHERE post_db_id = %s AND worker = %s
+        """, (post_db_id, worker))
+        conn.commit()
+    finally:
+        cur.close()
+
+
+def release(conn, post_db_ids, worker, error=None):
+    """처리하지 못한 임대 작업 반납 (종료 시 남은 배치 등) → 다른 워커가 바로 임대 가능
+    시도하지 않은 작업이므로 임대 때 늘린 시도 횟수는 되돌린다.
+    """
+    if not post_db_ids:
+        return
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            UPDATE detail_fetch_queue
+            SET status = 'pending', worker = NULL, lease_until = NULL,
+                attempts = GREATEST(attempts - 1, 0),
+                error = COALESCE(%s, error), updated_at = now()
+            WHERE post_db_id = ANY(%s) AND worker = %s AND status = 'leased'
+        """, (error, list(post_db_ids), worker))
+        conn.commit()
+    finally:
+        cur.close()
+
+
+def retry_later(conn, post_db_id, worker, failure, error=None,
+                max_attempts=MAX_ATTEMPTS, count_attempt=True):
+    """실패한 임대 작업을 분류와 함께 기록 → 'retry' | 'dropped' (다른 워커 소유면 None)
+
+    시도 횟수(임대 시 +1)가 한도에 닿으면 'dropped', 아니면 백오프 후 다시 임대 대상.
+    count_attempt=False (로그인 만료 등 공고와 무관한 실패) 면 횟수를 되돌리고 바로 재시도.
+    """
+    if failure == 'not_found':
+        max_attempts = min(max_attempts, NOT_FOUND_ATTEMPTS)
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            UPDATE detail_fetch_queue
+            SET attempts = attempts - %(undo)s,
+                status   = CASE WHEN attempts - %(undo)s >= %(budget)s THEN 'dropped'
+                                ELSE 'pending' END,
+                next_attempt_at = now() + make_interval(secs => CASE WHEN %(undo)s = 1 THEN 0
+                    ELSE LEAST(%(base)s * power(2, GREATEST(attempts - 1, 0)), %(cap)s) END),
+                failure  = %(failure)s,
+                error    = %(error)s,
+                worker   = NULL,
+                lease_until = NULL,
+                updated_at  = now()
+            WHERE post_db_id = %(id)s AND worker = %(worker)s AND status = 'leased'
+            RETURNING status
+        """, {'undo': 0 if count_attempt else 1, 'budget': max_attempts,
+              'base': RETRY_BASE_SECONDS, 'cap': RETRY_MAX_SECONDS,
+              'failure': failure, 'error': (error or '')[:500],
+              'id': post_db_id, 'worker': worker})
+        row = cur.fetchone()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+    if row is None:
+        return None
+    return 'dropped' if row[0] == 'dropped' else 'retry'
+
+
+def requeue_dropped(conn):
+    """포기(dropped) 작업을 시도 0회 대기 상태로 되돌림 → 건수"""
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            UPDATE detail_fetch_queue
+            SET status = 'pending', attempts = 0, next_attempt_at = NULL, updated_at = now()
+            WHERE status = 'dropped'
+        """)
+        n = cur.rowcount
+        conn.commit()
+        return n
+    finally:
+        cur.close()
+
+
+def queue_summary(conn):
+    """{'pending': n, 'leased': n, 'expired': n, 'retry': n, 'dropped': n}
+    retry = 실패 후 next_attempt_at 을 기다리는 작업 (pending 에는 포함하지 않음)
+    """
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT CASE WHEN status = 'leased' AND lease_until < now() THEN 'expired'
+                    WHEN status = 'pending' AND next_attempt_at > now() THEN 'retry'
+                    ELSE status END,
+               COUNT(*)
+        FROM   detail_fetch_queue
+        GROUP  BY 1
+    """)
+    counts = dict(cur.fetchall())
+    cur.close()
+    return counts
+
+
+def retry_summary(conn):
+    """실패 분류별 [(failure, 재시도 대기, 포기, 다음 시도 시각)] — 실패 이력 있는 작업만"""
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT failure,
+               COUNT(*) FILTER (WHERE status <> 'dropped'),
+               COUNT(*) FILTER (WHERE status = 'dropped'),
+               MIN(next_attempt_at) FILTER (WHERE status = 'pending')
+        FROM   detail_fetch_queue
+        WHERE  failure IS NOT NULL
+        GROUP  BY failure
+        ORDER  BY failure
+    """)
+    rows = cur.fetchall()
+    cur.close()
+    return rows
+
+
+def format_retry_summary(rows):
+    """retry_summary() → '재시도 대기 3건 (timeout 2 / parse 1), 다음 시도 14:20 · 포기 1건'"""
+    waiting = sum(r[1] for r in rows)
+    dropped = sum(r[2] for r in rows)
+    if not waiting and not dropped:
+        return '재시도 대기 0건'
+    text = f"재시도 대기 {waiting:,}건"
+    if waiting:
+        text += ' (' + ' / '.join(f"{r[0]} {r[1]:,}" for r in rows if r[1]) + ')'
+        nexts = [r[3] for r in rows if r[3] is not None]
+        if nexts:
+            text += f", 다음 시도 {min(nexts).astimezone().strftime('%m-%d %H:%M')}"
+    if dropped:
+        text += f" · 포기 {dropped:,}건 (" + ' / '.join(
+            f"{r[0]} {r[2]:,}" for r in rows if r[2]) + ')'
+    return text
+
+
+# ============================================================
+# 진입점
+# ============================================================
+def main():
+    parser = argparse.ArgumentParser(description='상세 페이지 수집 작업 큐')
+    parser.add_argument('mode', choices=('status', 'seed', 'requeue'))
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    ensure_queue_table(conn)
+    if args.mode == 'seed':
+        print(f"큐 추가: {seed_unfetched(conn):,}건")
+    elif args.mode == 'requeue':
+        print(f"포기 작업 되돌림: {requeue_dropped(conn):,}건")
+    counts = queue_summary(conn)
+    print(f"대기 {counts.get('pending', 0):,}건 / 임대 중 {counts.get('leased', 0):,}건 / "
+          f"임대 만료 {counts.get('expired', 0):,}건")
+    print(format_retry_summary(retry_summary(conn)))
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+mock_medigate.py — 메디게이트 대역 로컬 HTTP 서버 (벤치마크·테스트용)
+─────────────────────────────────────────────────
+실제 사이트에 접속하지 않고 phase4_crawler.py 를 끝까지 돌려 보기 위해
+저장해 둔 페이지(new_site_page.html 등)를 페이지 번호별로 변형해 제공한다.
+
+  · http://localhost:PORT/recruit/list?pageNo=N
+        목록 — 페이지마다 post_id / 병원명 / 등록일을 바꿔 서로 다른 신규 공고가 되도록 변형
+        (post_id 는 페이지가 뒤로 갈수록 작아지고 등록일은 1페이지당 1일씩 과거)
+        --pages 이후 페이지는 공고 없는 빈 목록
+  · http://localhost:PORT/recruit/<id>     상세 — recruit_detail_test.html
+  · http://localhost:PORT/                 로그인 후 메인 — main_page_after_login.html
+  · 로그인: 쿠키가 없으면 http://127.0.0.1:PORT/login 으로 리다이렉트
+        (실제 사이트처럼 로그인 페이지가 다른 호스트 → 크롤러의 로그인 성공 판정이 그대로 동작)
+        usrIdT / usrPasswdT 입력 + checkLoginForm() 제출 → /sso 에서 쿠키 발급 → 원래 페이지
+
+  · --latency-ms / --jitter-ms : 요청마다 응답 지연
+  · --error-rate               : 해당 비율로 503 응답 (재시도·오류 처리 확인용)
+  · --salt                     : 병원명에 붙는 문자열 — 실행마다 바꾸면 같은 DB 에서도 전부 신규 공고
+
+실행:
+    python mock_medigate.py --port 8765 --pages 20 --latency-ms 150
+    python phase4_crawler.py --base-url http://localhost:8765 --from 2000-01-01
+"""
+
+import argparse
+import html
+import os
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BASE_HOST      = 'localhost'   # 크롤러 --base-url 은 이 호스트로 지정
+SIGN_HOST      = '127.0.0.1'   # 로그인 페이지 호스트 (실제 sign.medigate.net 역할)
+SESSION_COOKIE = 'mock_sess'
+ID_STRIDE      = 10000         # 페이지당 post_id 감소폭 (원본 id 범위보다 크게)
+POSTS_PER_PAGE = 48            # 크롤러의 POSTS_PER_PAGE 와 같게 → 총 건수로 페이지 수가 정확히 계산됨
+
+LIST_FIXTURE   = 'new_site_page.html'
+DETAIL_FIXTURE = 'recruit_detail_test.html'
+MAIN_FIXTURE   = 'main_page_after_login.html'
+
+_RE_ID       = re.compile(r'/recruit/(\d+)')
+_RE_HOSPITAL = re.compile(r'(w-\[220px\][^>]*>\s*<span[^>]*>)([^<]*)(</span>)')
+_RE_DATE     = re.compile(r'\((\d{2})/(\d{2}) 시작\)')
+_RE_TOTAL    = re.compile(r'총\s*[\d,]+\s*건')
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>로그인</title></head>
+<body>
+<form name="loginForm" method="post" action="/login">
+  <input type="hidden" name="returnUrl" value="{return_url}">
+  <input type="text" name="usrIdT">
+  <input type="password" name="usrPasswdT">
+</form>
+<script>
+function checkLoginForm() {{
+  var f = document.loginForm;
+  if (f['usrIdT'].value == '' || f['usrPasswdT'].value == '') {{ return false; }}
+  f.submit();
+}}
+</script>
+</body></html>
+"""
+
+EMPTY_LIST_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body><div>총 {total:,}건</div><div>등록된 공고가 없습니다.</div></body></html>
+"""
+
+
+def _read_fixture(name):
+    with open(os.path.join(_SCRIPT_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+class MockSite:
+    """고정 페이지를 페이지 번호별로 변형해 돌려주는 가짜 사이트 상태"""
+
+    def __init__(self, pages=20, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0,
+                 salt='', list_fixture=LIST_FIXTURE, require_login=True):
+        self.pages         = pages
+        self.latency       = latency_ms / 1000.0
+        self.jitter        = jitter_ms / 1000.0
+        self.error_rate    = error_rate
+        self.salt          = salt
+        self.require_login = require_login
+        self.list_html     = _read_fixture(list_fixture)
+        self.detail_html   = _read_fixture(DETAIL_FIXTURE)
+        self.main_html     = _read_fixture(MAIN_FIXTURE)
+        self._lock         = threading.Lock()
+        self.counts        = {'list': 0, 'detail': 0, 'error': 0, 'other': 0}
+        self.render_list   = lru_cache(maxsize=256)(self._render_list)
+
+    def count(self, kind):
+        with self._lock:
+            self.counts[kind] += 1
+
+    def delay(self):
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+    def should_fail(self):
+        return self.error_rate > 0 and random.random() < self.error_rate
+
+    def _render_list(self, page):
+        total = self.pages * POSTS_PER_PAGE
+        if page < 1 or page > self.pages:
+            return EMPTY_LIST_PAGE.format(total=total)
+
+        shift = page - 1
+        page_html = _RE_ID.sub(lambda m: f"/recruit/{int(m.group(1)) - shift * ID_STRIDE}",
+                                self.list_html)
+        if shift or self.salt:
+            suffix = f" {self.salt}{page}" if shift else f" {self.salt}"
+            page_html = _RE_HOSPITAL.sub(lambda m: m.group(1) + m.group(2) + suffix + m.group(3), page_html)
+        if shift:
+            def _older(m):
+                # 2024 = 윤년 → 02/29 도 그대로 계산 가능
+                d = date(2024, int(m.group(1)), int(m.group(2))) - timedelta(days=shift)
+                return f"({d.month:02d}/{d.day:02d} 시작)"
+            page_html = _RE_DATE.sub(_older, page_html)
+        return _RE_TOTAL.sub(f"총 {total:,}건", page_html, count=1)
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    server_version = 'MockMedigate/1.0'
+
+    @property
+    def site(self):
+        return self.server.site
+
+    def log_message(self, fmt, *args):   # 요청마다 stderr 출력하지 않음
+        pass
+
+    def _send(self, status, body='', content_type='text/html; charset=utf-8', headers=()):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(data)
+
+    def _redirect(self, location, headers=()):
+        self._send(302, '', headers=[('Location', location)] + list(headers))
+
+    def _port(self):
+        return self.server.server_address[1]
+
+    def _logged_in(self):
+        cookie = self.headers.get('Cookie', '')
+        return f"{SESSION_COOKIE}=1" in cookie
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        path  = parts.path
+
+        # ── 로그인 흐름 (지연·오류 주입 없음)
+        if path == '/login':
+            return_url = query.get('returnUrl', [f"http://{BASE_HOST}:{self._port()}/"])[0]
+            return self._send(200, LOGIN_PAGE.format(return_url=html.escape(return_url)))
+        if path == '/sso':
+            return_url = query.get('returnUrl', ['/'])[0]
+            return self._redirect(return_url, [('Set-Cookie', f"{SESSION_COOKIE}=1; Path=/")])
+
+        site = self.site
+        if site.require_login and not self._logged_in():
+            here = f"http://{BASE_HOST}:{self._port()}{self.path}"
+            return self._redirect(f"http://{SIGN_HOST}:{self._port()}/login?returnUrl={quote(here)}")
+
+        site.delay()
+        if site.should_fail():
+            site.count('error')
+            return self._send(503, '<html><body>Service Unavailable</body></html>')
+
+        if path == '/recruit/list':
+            site.count('list')
+            page = int(query.get('pageNo', ['1'])[0] or 1)
+            return self._send(200, site.render_list(page))
+        if re.fullmatch(r'/recruit/\d+', path):
+            site.count('detail')
+            return self._send(200, site.detail_html)
+        if path == '/':
+            site.count('other')
+            return self._send(200, site.main_html)
+        site.count('other')
+        self._send(404, '<html><body>Not Found</body></html>')
+
+    def do_POST(self):
+        if urlsplit(self.path).path != '/login':
+            return self._send(404, '')
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        form   = parse_qs(self.rfile.read(length).decode('utf-8'))
+        if not form.get('usrIdT') or not form.get('usrPasswdT'):
+            return self._send(200, LOGIN_PAGE.format(return_url=''))
+        return_url = form.get('returnUrl', [f"http://{BASE_HOST}:{self._port()}/"])[0]
+        self._redirect(f"http://{BASE_HOST}:{self._port()}/sso?returnUrl={quote(return_url)}")
+
+
+def make_server(site, port=0, bind='127.0.0.1'):
+    """서버 생성 (port=0 이면 빈 포트 자동 선택 → server.server_address[1])"""
+    server = ThreadingHTTPServer((bind, port), MockHandler)
+    server.daemon_threads = True
+    server.site = site
+    return server
+
+
+def start_in_thread(site, port=0):
+    """백그라운드 스레드로 서버 시작 → (server, base_url)"""
+    server = make_server(site, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{BASE_HOST}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='메디게이트 대역 로컬 서버')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--pages', type=int, default=20, help='공고가 있는 목록 페이지 수')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='요청마다 응답 지연(ms)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='추가 랜덤 지연 최대(ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='503 응답 비율 (0~1)')
+    parser.add_argument('--salt', default='', help='병원명에 붙일 문자열 (실행마다 신규 공고로)')
+    parser.add_argument('--list-fixture', default=LIST_FIXTURE,
+                        help='목록 원본 파일 (recruit_page.html = 구 사이트 구조, 공고 0건)')
+    parser.add_argument('--no-login', dest='require_login', action='store_false',
+                        help='로그인 없이 모든 페이지 제공')
+    args = parser.parse_args()
+
+    site = MockSite(pages=args.pages, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                    error_rate=args.error_rate, salt=args.salt,
+                    list_fixture=args.list_fixture, require_login=args.require_login)
+    server = make_server(site, args.port, bind='')
+    print(f"mock medigate: http://{BASE_HOST}:{args.port}  "
+          f"(목록 {args.pages}페이지, 지연 {args.latency_ms:g}ms, 오류율 {args.error_rate:g})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"요청 수: {site.counts}")
+
+
+if __name__ == '__main__':
+    main()
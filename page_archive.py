@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+page_archive.py — 수집한 원본 HTML 보관소 (내용 주소 방식)
+─────────────────────────────────────────────────
+파서(parse_card / 상세 추출)를 고쳐도 사이트를 다시 크롤링하지 않도록
+가져온 목록·상세 페이지 원본을 그대로 디스크에 보관한다.
+
+  <DIR>/objects/ab/cdef....html.gz   — 본문 (gzip, 파일명 = sha256)
+                                       같은 내용은 한 번만 저장 (재방문해도 용량 증가 없음)
+  <DIR>/index.sqlite                 — pages(url, kind, fetched_at, sha256, size)
+                                       kind = 'list' / 'detail'
+
+사용:
+    archive = PageArchive('page_archive')
+    archive.put(url, 'detail', html)
+    for url, fetched_at, sha in archive.latest('detail'):
+        html = archive.get(sha)
+"""
+
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+
+class PageArchive:
+    """여러 스레드(상세 병렬 워커)에서 동시에 put() 해도 되도록 인덱스 접근은 락으로 보호"""
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db   = sqlite3.connect(os.path.join(root, 'index.sqlite'),
+                                     check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                id         INTEGER PRIMARY KEY,
+                url        TEXT    NOT NULL,
+                kind       TEXT    NOT NULL,
+                fetched_at TEXT    NOT NULL,
+                sha256     TEXT    NOT NULL,
+                size       INTEGER NOT NULL
+            )
+        """)
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS ix_pages_kind_url ON pages (kind, url, fetched_at)"
+        )
+        self._db.commit()
+
+    def _path(self, sha):
+        return os.path.join(self.root, 'objects', sha[:2], sha[2:] + '.html.gz')
+
+    def put(self, url, kind, html):
+        """페이지 1건 보관 → sha256 반환. 본문이 이미 있으면 인덱스 행만 추가."""
+        data = html.encode('utf-8')
+        sha  = hashlib.sha256(data).hexdigest()
+        path = self._path(sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp, 'wb', compresslevel=6) as f:
+                f.write(data)
+            os.replace(tmp, path)
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO pages (url, kind, fetched_at, sha256, size) VALUES (?, ?, ?, ?, ?)",
+                (url, kind, datetime.now().isoformat(timespec='seconds'), sha, len(data)),
+            )
+            self._db.commit()
+        return sha
+
+    def get(self, sha):
+        with gzip.open(self._path(sha), 'rb') as f:
+            return f.read().decode('utf-8')
+
+    def latest(self, kind):
+        """URL 별 가장 최근 스냅샷 [(url, fetched_at, sha256)]"""
+        with self._lock:
+            # SQLite: MAX() 집계 시 나머지 컬럼은 최댓값 행의 값
+            return self._db.execute("""
+                SELECT url, MAX(fetched_at), sha256 FROM pages
+                WHERE kind = ? GROUP BY url ORDER BY url
+            """, (kind,)).fetchall()
+
+    def snapshots(self, kind):
+        """모든 스냅샷을 오래된 순으로 [(url, fetched_at, sha256)]"""
+        with self._lock:
+            return self._db.execute("""
+                SELECT url, fetched_at, sha256 FROM pages
+                WHERE kind = ? ORDER BY fetched_at, id
+            """, (kind,)).fetchall()
+
+    def summary(self):
+        """(인덱스 행 수, 고유 본문 수, 원본 합계 바이트)"""
+        with self._lock:
+            return self._db.execute("""
+                SELECT COUNT(*), COUNT(DISTINCT sha256), COALESCE(SUM(size), 0) FROM pages
+            """).fetchone()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+parse_cache.py — 급여 문구 파싱 결과 영구 캐시 (salary_parse_cache 테이블)
+─────────────────────────────────────────────────
+같은 병원이 같은 '급여' 문구를 매달 다시 올리므로 문구별 파싱 결과를 DB 에 남겨 두고
+크롤러 · backfill · 재파싱이 실행마다 다시 파싱하지 않게 한다.
+
+  · 키   : (정리된 문구의 sha256, salary_calculator.PARSER_VERSION)
+  · 값   : salary_type / salary_unit / salary_min / salary_max — 세율 규칙과 무관한 부분만
+           (Net 환산은 등록일 연도 규칙으로 그때그때 계산 → 세율 규칙을 바꿔도 캐시는 그대로)
+  · 시작 시 현재 버전 행을 한 번에 읽어 메모리에 두고, 새로 파싱한 문구는
+    FLUSH_BATCH 건씩 모아 INSERT (전용 연결 — 호출한 쪽 트랜잭션과 섞이지 않음)
+  · 파싱 규칙을 바꾸면 PARSER_VERSION 을 올림 → 이전 버전 행은 쓰지 않음 (prune 으로 삭제)
+  · DB 를 못 쓰면 경고만 남기고 메모리 캐시(LRU)만으로 계속 진행
+
+사용:
+    import parse_cache
+    parse_cache.attach(DB_CONFIG, log=log)   # 이후 parse_salary 가 자동으로 사용
+    ...
+    parse_cache.detach(log=log)              # 남은 항목 저장 + 연결 종료
+
+실행:
+    python parse_cache.py status     # 버전별 저장 문구 수
+    python parse_cache.py prune      # 현재 버전이 아닌 행 삭제
+"""
+
+import argparse
+import hashlib
+import threading
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+import salary_calculator
+from db_config import DB_CONFIG
+from salary_calculator import PARSER_VERSION
+
+# ============================================================
+# 설정
+# ============================================================
+FLUSH_BATCH = 200     # 새로 파싱한 문구를 이만큼 모아 한 번에 INSERT
+DISABLED    = False   # True 면 DB 캐시 없이 메모리 메모만 (--no-parse-cache)
+
+_STORE = None   # attach 로 연결된 ParseCache
+
+
+def text_hash(text: str) -> str:
+    """정리된 문구(normalize_salary_text 결과) → sha256 hex"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+# ============================================================
+# 테이블
+# ============================================================
+def ensure_table(conn):
+    cur = conn.cursor()
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS salary_parse_cache (
+            text_hash      TEXT    NOT NULL,
+            parser_version INTEGER NOT NULL,
+            salary_type    TEXT,
+            salary_unit    TEXT,
+            salary_min     INTEGER,
+            salary_max     INTEGER,
+            created_at     TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (text_hash, parser_version)
+        )
+    """)
+    conn.commit()
+    cur.close()
+
+
+# ============================================================
+# 캐시
+# ============================================================
+class ParseCache:
+    """salary_calculator.set_parse_store 에 넘기는 저장소 — get(text) / put(text, fields)"""
+
+    def __init__(self, conn, version=PARSER_VERSION, log=print):
+        self.conn    = conn
+        self.version = version
+        self.log     = log
+        self.entries = {}   # text_hash → (type, unit, min, max)
+        self.pending = []   # 아직 DB 에 없는 새 항목
+        self.loaded  = 0    # 시작 시 DB 에서 읽은 문구 수
+        self.hits    = 0    # DB 캐시에서 찾은 횟수
+        self.misses  = 0    # 새로 파싱한 횟수
+        self.saved   = 0
+        self._lock   = threading.Lock()
+
+    def load(self):
+        """현재 버전 행 전체를 메모리로 (문구 수는 공고 수보다 훨씬 적음)"""
+        cur = self.conn.cursor()
+        try:
+            cur.execute("""
+                SELECT text_hash, salary_type, salary_unit, salary_min, salary_max
+                FROM   salary_parse_cache
+                WHERE  parser_version = %s
+            """, (self.version,))
+            for h, *fields in cur:
+                self.entries[h] = tuple(fields)
+            self.conn.commit()
+        finally:
+            cur.close()
+        self.loaded = len(self.entries)
+        return self.loaded
+
+    def get(self, text):
+        fields = self.entries.get(text_hash(text))
+        if fields is not None:
+            self.hits += 1
+        return fields
+
+    def put(self, text, fields):
+        h = text_hash(text)
+        with self._lock:
+            self.misses += 1
+            if h in self.entries:
+                return
+            self.entries[h] = tuple(fields)
+            self.pending.append((h, self.version) + tuple(fields))
+            if len(self.pending) >= FLUSH_BATCH:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self.pending:
+            return
+        rows, self.pending = self.pending, []
+        cur = self.conn.cursor()
+        try:
+            execute_values(cur, """
+                INSERT INTO salary_parse_cache
+                    (text_hash, parser_version, salary_type, salary_unit, salary_min, salary_max)
+                VALUES %s
+                ON CONFLICT (text_hash, parser_version) DO NOTHING
+            """, rows, page_size=len(rows))
+            self.conn.commit()
+            self.saved += len(rows)
+        except Exception as e:
+            # 캐시 저장 실패는 수집을 멈출 이유가 아님 → 메모리에는 그대로 남김
+            self.conn.rollback()
+            self.log(f"  [경고] 파싱 캐시 저장 실패 ({len(rows)}건): {e}")
+        finally:
+            cur.close()
+
+    def summary(self):
+        memo = salary_calculator.parse_cache_info()
+        return (f"파싱 캐시 v{self.version}: 메모리 적중 {memo.hits:,} / DB 적중 {self.hits:,} / "
+                f"새로 파싱 {self.misses:,} (저장 {self.saved:,}, 시작 시 {self.loaded:,}문구)")
+
+
+def attach(db_config=None, log=print):
+    """전용 연결로 영구 캐시를 열어 parse_salary 에 연결 → ParseCache (DISABLED·실패 시 None)"""
+    global _STORE
+    if DISABLED:
+        return None
+    detach(log=log)
+    try:
+        conn = psycopg2.connect(**(db_config or DB_CONFIG))
+    except Exception as e:
+        log(f"  [경고] 파싱 캐시 DB 연결 실패 → 메모리 캐시만 사용: {e}")
+        return None
+    try:
+        ensure_table(conn)
+        store = ParseCache(conn, log=log)
+        store.load()
+    except Exception as e:
+        conn.rollback()
+        conn.close()
+        log(f"  [경고] 파싱 캐시 테이블 사용 불가 → 메모리 캐시만 사용: {e}")
+        return None
+    salary_calculator.set_parse_store(store)
+    _STORE = store
+    log(f"  [파싱 캐시] v{store.version} 문구 {store.loaded:,}개 읽음")
+    return store
+
+
+def flush():
+    """연결된 캐시의 새 항목을 지금 저장 (오래 도는 실행에서 진행 출력마다)"""
+    if _STORE is not None:
+        _STORE.flush()
+
+
+def detach(log=print):
+    """남은 항목 저장 후 연결 해제 (attach 하지 않았으면 아무것도 안 함)"""
+    global _STORE
+    store, _STORE = _STORE, None
+    if store is None:
+        return
+    store.flush()
+    log(f"  {store.summary()}")
+    salary_calculator.set_parse_store(None)
+    try:
+        store.conn.close()
+    except Exception:
+        pass
+
+
+# ============================================================
+# CLI
+# ============================================================
+def main():
+    parser = argparse.ArgumentParser(description='급여 문구 파싱 캐시 (salary_parse_cache)')
+    parser.add_argument('command', choices=('status', 'prune'),
+                        help='status: 버전별 문구 수 / prune: 현재 버전이 아닌 행 삭제')
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    ensure_table(conn)
+    cur = conn.cursor()
+    if args.command == 'status':
+        cur.execute("""
+            SELECT parser_version, COUNT(*), MAX(created_at)
+            FROM   salary_parse_cache
+            GROUP  BY parser_version
+            ORDER  BY parser_version
+        """)
+        rows = cur.fetchall()
+        print(f"현재 PARSER_VERSION = {PARSER_VERSION}")
+        for version, n, last in rows:
+            mark = ' ←' if version == PARSER_VERSION else ''
+            print(f"  v{version}: {n:,}문구 (마지막 추가 {last:%Y-%m-%d %H:%M}){mark}")
+        if not rows:
+            print("  (비어 있음)")
+    else:
+        cur.execute("DELETE FROM salary_parse_cache WHERE parser_version <> %s", (PARSER_VERSION,))
+        print(f"이전 버전 {cur.rowcount:,}행 삭제 (현재 v{PARSER_VERSION} 유지)")
+        conn.commit()
+    cur.close()
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
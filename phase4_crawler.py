@@ -4,9 +4,9 @@
 Phase 4: 메디게이트 전체 공고 수집 및 DB 저장 (급여 통합)
 - 대상: new.medigate.net/recruit/list
 - 페이지네이션: ?pageNo=N
-- 중복 제거: 병원명 + 지역(시도) + 등록월 (unique_key)
+- 중복 제거: 병원명 + 지역(시도) + 등록월 (unique_key, DB UNIQUE 인덱스 + ON CONFLICT)
 - DB: medigate / recruit_posts + recruit_post_specialties
-- 신규 공고만 상세 페이지 방문 → 급여 파싱 → 즉시 저장
+- 신규 공고만 상세 페이지 방문 → 급여 파싱 → 목록 페이지 단위 일괄 저장
 - 딜레이: 목록 페이지 1~2초, 상세 페이지 1.5~2.5초
 - 진행 알림: 100건마다 출력
 
@@ -23,38 +23,74 @@ Phase 4: 메디게이트 전체 공고 수집 및 DB 저장 (급여 통합)
 
   # 전체 수집 (날짜 제한 없음)
   python phase4_crawler.py
+
+  # 상세 페이지를 브라우저 4개로 병렬 수집 (전역 요청 간격은 그대로 유지)
+  python phase4_crawler.py --detail-workers 4
+
+  # 병렬 수집 + 상세 요청 속도를 분당 60건으로 지정
+  python phase4_crawler.py --detail-workers 4 --detail-rate 60
+
+  # page_source 전송 없이 페이지 안에서 필요한 값만 JSON 으로 추출
+  python phase4_crawler.py --extract-mode browser
+
+  # 가져온 목록/상세 원본 HTML 을 page_archive/ 에 보관하며 수집
+  python phase4_crawler.py --archive page_archive
+
+  # 파서 수정 후: 보관된 HTML 로 공고 필드·급여 컬럼 재구성 (네트워크 사용 안 함)
+  python phase4_crawler.py --reparse-archive --archive page_archive
+
+  # 급여 문구 파싱 결과는 salary_parse_cache 에 남겨 다음 실행에서 재사용 (parse_cache.py)
+  python phase4_crawler.py --no-parse-cache      # DB 파싱 캐시 없이 (메모리 캐시만)
+
+  # 로컬 대역 서버(mock_medigate.py) 대상 실행 — 처리량 측정은 bench_crawl.py
+  CRAWL_DB_DSN=postgresql://localhost/bench python phase4_crawler.py \
+      --base-url http://localhost:8765 --from 2000-01-01 --stats-json stats.json
 """
 
 import argparse
+import hashlib
+import json
+from urllib.parse import urlsplit
 import time
 import random
 import re
 import sys
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # ──────────────────────────────────────────────────────────
-# 로그 파일 설정 (stdout + 파일 동시 출력)
+# 로그 설정 (stdout + logs/crawl.jsonl, crawl_logger.py)
 # ──────────────────────────────────────────────────────────
+from crawl_logger import CrawlLogger, LOG_DIR
+
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-LOG_FILE = open(os.path.join(_SCRIPT_DIR, 'crawl_log.txt'), 'w', encoding='utf-8', buffering=1)
+LOG_PATH    = os.path.join(LOG_DIR, 'crawl.jsonl')
+LOG_RUN_ID  = None   # 지정하지 않으면 '시각-PID' 로 생성
+LOGGER      = None   # 첫 log() 호출 시 생성 (모듈 import 만으로는 파일을 만들지 않음)
 
-def log(msg):
-    """stdout과 로그 파일에 동시 출력"""
-    try:
-        sys.stdout.buffer.write((str(msg) + '\n').encode('utf-8'))
-        sys.stdout.buffer.flush()
-    except Exception:
-        try:
-            sys.stdout.write(str(msg) + '\n')
-            sys.stdout.flush()
-        except Exception:
-            pass
-    LOG_FILE.write(str(msg) + '\n')
-    LOG_FILE.flush()
+def log(msg, **fields):
+    """stdout + JSON lines 로그. 큐에만 넣고 바로 반환 (쓰기는 로거 스레드).
+    fields: post_id / page / url 등 조회용 추가 필드
+    """
+    global LOGGER
+    if LOGGER is None:
+        LOGGER = CrawlLogger(LOG_PATH, job='crawler', run_id=LOG_RUN_ID)
+    LOGGER.log(msg, **fields)
+
+
+def close_log():
+    """남은 로그를 모두 기록하고 로거 종료"""
+    global LOGGER
+    if LOGGER is not None:
+        LOGGER.close()
+        LOGGER = None
 
 
 import psycopg2
+from psycopg2.extras import execute_values
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -62,20 +98,25 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 
-from salary_calculator import parse_salary
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:   # lxml 미설치 시 BeautifulSoup(html.parser) 로 동작
+    etree = lxml_html = None
+
+from salary_calculator import parse_salary, tax_year_of
+from page_archive import PageArchive
+from crawl_metrics import Metrics
+from db_config import DB_CONFIG
+import session_store
+import detail_queue
+import parse_cache
 
 
 # ============================================================
 # 설정
 # ============================================================
-DB_CONFIG = {
-    'host': 'aws-1-ap-northeast-1.pooler.supabase.com',
-    'port': 5432,
-    'dbname': 'postgres',
-    'user': 'postgres.mmqfmdqhujuohypcjkne',
-    'password': 'KUHOHriqT3DdiS7w',
-    'sslmode': 'require',
-}
+# DB 접속 정보는 db_config.py (backfill·큐·파싱 캐시와 공용, CRAWL_DB_DSN 으로 교체)
 
 LOGIN_TRIGGER_URL = "https://new.medigate.net/recruit/list"
 BASE_URL          = "https://new.medigate.net"
@@ -89,10 +130,81 @@ DETAIL_DELAY_MIN  = 1.5    # 상세 페이지 최소 딜레이(초)
 DETAIL_DELAY_MAX  = 2.5    # 상세 페이지 최대 딜레이(초)
 DETAIL_RETRY      = 2      # 상세 페이지 로드 실패 시 재시도 횟수
 PROGRESS_INTERVAL = 100    # N건마다 진행상황 출력
+# --adaptive: 목록+상세 요청 속도를 AIMD 로 조정 (위 고정 딜레이 대신)
+RATE_FLOOR        = 6.0    # 분당 최소 요청 수 (10초 간격)
+RATE_CEILING      = 60.0   # 분당 최대 요청 수 (1초 간격)
+RATE_STEP         = 2.0    # 건강한 구간마다 분당 +N (가산 증가)
+RATE_BACKOFF      = 0.5    # 시간 초과 / 재시도 소진 시 ×N (승산 감소)
+RATE_WINDOW       = 10     # 요청 N건 단위로 증가 여부 판단
+RATE_SLOW_SECONDS = 3.0    # 구간 평균 로드 시간이 이보다 길면 증가 보류
+RATE_COOLDOWN     = 15.0   # 감소 후 N초 동안 추가 감소 없음 (동시 실패 여러 건 → 1회만)
 PAGE_LOAD_WAIT    = 15     # JS 렌더링 최대 대기(초)
+LIST_SETTLE_MAX   = 1.5    # 목록: readyState 이후 카드 렌더링 최대 대기(초)
+DETAIL_SETTLE_MAX = 1.2    # 상세: readyState 이후 모집개요 행(hydration) 최대 대기(초)
+SETTLE_POLL       = 0.1    # 조건 확인 간격(초)
 POSTS_PER_PAGE    = 48     # 페이지당 공고 수 (실측)
 CRAWL_YEAR        = 2026   # 등록일 연도 기준 (현재 년도)
 CURRENT_MONTH     = 3      # 현재 월 (3월 = 2025년 4~12월 / 2026년 1~3월)
+CHECKPOINT_FILE   = os.path.join(_SCRIPT_DIR, 'crawl_checkpoint.json')  # --resume 용 진행 상태
+EXTRACT_MODE      = 'html' # 'html' = page_source 파싱 / 'browser' = 페이지 내 JS 추출 (--extract-mode)
+ARCHIVE_DIR       = os.path.join(_SCRIPT_DIR, 'page_archive')  # --archive 기본 경로
+ARCHIVE           = None   # PageArchive (--archive 지정 시) — 가져온 원본 HTML 보관
+REPARSE_CHUNK     = 500    # --reparse-archive: DB 일괄 갱신 단위
+METRICS_JSON      = os.path.join(_SCRIPT_DIR, 'crawl_metrics.json')  # 실행 요약 (--metrics-json)
+METRICS_FILE      = None   # OpenMetrics textfile 경로 (--metrics-file, 페이지마다 갱신)
+RATE_CONTROL      = None   # AimdRate (--adaptive 지정 시)
+ENQUEUE_ONLY      = False  # True 면 상세 방문 없이 저장 + detail_fetch_queue 등록 (--enqueue-only)
+INACTIVE_AFTER    = 3      # 수집 범위 안에서 연속 N회 목록에 안 보인 공고 → is_active=FALSE
+LEAN_BROWSER      = True   # 이미지·폰트·미디어·외부 추적 스크립트 차단 + 디스크 캐시 (--no-lean 으로 끄기)
+CHROME_CACHE_DIR  = os.path.join(_SCRIPT_DIR, 'chrome_cache')  # JS 번들 디스크 캐시 (브라우저마다 하위 폴더)
+CHROME_CACHE_MB   = 200    # 브라우저 1개당 디스크 캐시 최대 크기
+
+# 파싱에 필요 없는 요청 — CDP Network.setBlockedURLs 패턴 (* 와일드카드)
+BLOCKED_URL_PATTERNS = [
+    # 이미지 / 폰트 / 미디어
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico', '*.bmp',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.ogg',
+    # 외부 분석·광고·추적
+    '*google-analytics.com*', '*googletagmanager.com*', '*googlesyndication.com*',
+    '*doubleclick.net*', '*facebook.net*', '*facebook.com/tr*', '*connect.facebook*',
+    '*wcs.naver.net*', '*analytics.naver.com*', '*kakao.com/pixel*', '*t1.daumcdn.net/kas*',
+    '*criteo.*', '*hotjar.com*', '*clarity.ms*', '*channel.io*',
+]
+
+# ── 지표 (crawl_metrics.py) — OpenMetrics 엔드포인트 / textfile / 실행 요약 JSON
+METRICS = Metrics(job='crawler')
+METRICS.describe('medigate_list_page_seconds', 'histogram',
+                 '목록 페이지 로드 시간 (요청 + readyState + 카드 렌더링 대기)')
+METRICS.describe('medigate_detail_page_seconds', 'histogram',
+                 '상세 페이지 처리 시간 (요청 ~ 급여 행 추출, 성공 1건 기준)')
+METRICS.describe('medigate_db_write_seconds', 'histogram', '페이지 단위 일괄 저장(flush) 시간')
+METRICS.describe('medigate_db_query_seconds', 'histogram', '기존 unique_key 조회 시간')
+METRICS.describe('medigate_requests_total', 'counter', '페이지 요청 수 (kind=list|detail)')
+METRICS.describe('medigate_retries_total', 'counter', '재시도 수')
+METRICS.describe('medigate_request_errors_total', 'counter', '재시도 후에도 실패한 요청 수')
+METRICS.describe('medigate_parse_failures_total', 'counter',
+                 '파싱 실패 분류 (list_empty / no_salary_row / salary_unparsed / fetch_error)')
+METRICS.describe('medigate_posts_total', 'counter', '목록 공고 처리 결과 (saved / skipped / out_range)')
+METRICS.describe('medigate_phase_seconds_total', 'counter',
+                 '구간별 누적 시간 (fetch / wait / sleep / parse / db)')
+METRICS.describe('medigate_rate_changes_total', 'counter',
+                 '--adaptive 요청 속도 변경 횟수 (direction=up|down)')
+METRICS.describe('medigate_page_bytes', 'histogram',
+                 '페이지 1개 전송량 (문서 + 하위 리소스 transferSize, 캐시 적중분 제외, kind=list|detail)',
+                 buckets=(10e3, 50e3, 100e3, 250e3, 500e3, 1e6, 2e6, 5e6, 10e6))
+METRICS.describe('medigate_page_requests', 'histogram', '페이지 1개 네트워크 요청 수 (kind=list|detail)',
+                 buckets=(1, 5, 10, 20, 40, 80, 160))
+METRICS.describe('medigate_page_load_seconds', 'histogram',
+                 '브라우저 기준 문서 로드 시간 (navigation 시작 ~ load, kind=list|detail)')
+
+
+def set_base_url(base_url):
+    """접속 대상 사이트 변경 (--base-url, 예: 로컬 mock_medigate.py)"""
+    global BASE_URL, RECRUIT_URL, LOGIN_TRIGGER_URL
+    BASE_URL          = base_url.rstrip('/')
+    RECRUIT_URL       = f"{BASE_URL}/recruit/list"
+    LOGIN_TRIGGER_URL = RECRUIT_URL
 
 
 # ============================================================
@@ -108,6 +220,14 @@ def parse_args():
   python phase4_crawler.py --from 2026-02-19 --to 2026-02-23
   python phase4_crawler.py --from 2026-02-19              # 해당일 이후 전부
   python phase4_crawler.py                                 # 전체 수집
+  python phase4_crawler.py --detail-workers 4              # 상세 페이지 병렬 수집
+  python phase4_crawler.py --resume                        # 중단된 수집 이어서
+  python phase4_crawler.py --no-watermark                  # 날짜 규칙만으로 증분 종료
+  python phase4_crawler.py --archive page_archive          # 원본 HTML 보관하며 수집
+  python phase4_crawler.py --reparse-archive               # 보관 HTML 로 DB 재구성
+  python phase4_crawler.py --no-lean                       # 리소스 차단·디스크 캐시 없이 (용량 비교용)
+  python phase4_crawler.py --adaptive --rate-ceiling 40    # 요청 속도 자동 조정 (AIMD)
+  python phase4_crawler.py --enqueue-only                  # 목록만 수집, 상세는 salary_backfill 워커가
         """
     )
     parser.add_argument(
@@ -124,6 +244,94 @@ def parse_args():
         '--info', action='store_true',
         help='DB 현황만 확인하고 종료 (크롤링 없음)',
     )
+    parser.add_argument(
+        '--detail-workers', dest='detail_workers', type=int, default=1,
+        metavar='N',
+        help='상세 페이지 동시 수집 브라우저 수 (기본 1 = 기존 순차 방식)',
+    )
+    parser.add_argument(
+        '--detail-rate', dest='detail_rate', type=float, default=None,
+        metavar='REQ_PER_MIN',
+        help='전체 워커 합산 상세 요청 속도(건/분). 미지정 시 '
+             f'요청 간격 {DETAIL_DELAY_MIN}~{DETAIL_DELAY_MAX}초 유지',
+    )
+    parser.add_argument(
+        '--enqueue-only', dest='enqueue_only', action='store_true',
+        help='상세 페이지를 방문하지 않고 신규 공고를 detail_fetch_queue 에 등록만 함 '
+             '(상세는 salary_backfill.py 워커가 처리)',
+    )
+    parser.add_argument(
+        '--adaptive', action='store_true',
+        help='고정 딜레이 대신 응답 상태에 따라 요청 속도 자동 조정 '
+             '(정상이면 분당 +%g, 시간 초과·재시도 소진 시 ×%g)' % (RATE_STEP, RATE_BACKOFF),
+    )
+    parser.add_argument(
+        '--rate-floor', dest='rate_floor', type=float, default=RATE_FLOOR, metavar='REQ_PER_MIN',
+        help=f'--adaptive 최소 속도 (분당, 기본 {RATE_FLOOR:g})',
+    )
+    parser.add_argument(
+        '--rate-ceiling', dest='rate_ceiling', type=float, default=RATE_CEILING, metavar='REQ_PER_MIN',
+        help=f'--adaptive 최대 속도 (분당, 기본 {RATE_CEILING:g})',
+    )
+    parser.add_argument(
+        '--no-watermark', dest='no_watermark', action='store_true',
+        help='증분 수집에서 post_id 워터마크 조기 종료를 끄고 날짜 규칙만 사용',
+    )
+    parser.add_argument(
+        '--resume', action='store_true',
+        help='중단된 실행의 체크포인트(crawl_checkpoint.json)부터 이어서 수집',
+    )
+    parser.add_argument(
+        '--extract-mode', dest='extract_mode', choices=['html', 'browser'],
+        default=EXTRACT_MODE,
+        help="html: page_source 를 받아 파싱 (기본) / "
+             "browser: 페이지 안에서 필요한 값만 JSON 으로 추출 (비면 html 로 대체)",
+    )
+    parser.add_argument(
+        '--archive', nargs='?', const=ARCHIVE_DIR, default=None, metavar='DIR',
+        help='가져온 목록/상세 원본 HTML 을 DIR 에 gzip 보관 (기본 page_archive/). '
+             '보관하려면 원본이 필요하므로 --extract-mode browser 보다 우선',
+    )
+    parser.add_argument(
+        '--reparse-archive', dest='reparse_archive', action='store_true',
+        help='크롤링 없이 보관된 HTML 로 공고 필드·급여 컬럼을 다시 파싱해 DB 갱신',
+    )
+    parser.add_argument(
+        '--base-url', dest='base_url', default=None, metavar='URL',
+        help=f'접속할 사이트 주소 (기본 {BASE_URL}, 예: http://localhost:8765 = mock_medigate.py)',
+    )
+    parser.add_argument(
+        '--log-file', dest='log_file', default=None, metavar='PATH',
+        help='로그 파일 경로 (기본 logs/crawl.jsonl, JSON lines)',
+    )
+    parser.add_argument(
+        '--stats-json', dest='stats_json', default=None, metavar='PATH',
+        help='종료 시 통계·구간별 소요 시간을 JSON 으로 저장 (bench_crawl.py 용)',
+    )
+    parser.add_argument(
+        '--metrics-port', dest='metrics_port', type=int, default=None, metavar='PORT',
+        help='OpenMetrics 엔드포인트 http://127.0.0.1:PORT/metrics 제공 (실행 중에만)',
+    )
+    parser.add_argument(
+        '--metrics-file', dest='metrics_file', default=None, metavar='PATH',
+        help='OpenMetrics textfile(.prom) 을 목록 페이지마다 갱신 (node_exporter textfile collector 용)',
+    )
+    parser.add_argument(
+        '--fresh-login', dest='fresh_login', action='store_true',
+        help='저장된 로그인 세션(session_state.json)을 쓰지 않고 새로 로그인',
+    )
+    parser.add_argument(
+        '--no-parse-cache', dest='no_parse_cache', action='store_true',
+        help='급여 문구 파싱 캐시(salary_parse_cache 테이블)를 쓰지 않음 (메모리 캐시만)',
+    )
+    parser.add_argument(
+        '--no-lean', dest='lean', action='store_false',
+        help='이미지·폰트·미디어·추적 스크립트 차단과 디스크 캐시를 끄고 실행 (페이지 용량 비교용)',
+    )
+    parser.add_argument(
+        '--metrics-json', dest='metrics_json', default=METRICS_JSON, metavar='PATH',
+        help='실행 요약 JSON (카운터 + 지연 p50/p95) 저장 경로 (기본 crawl_metrics.json)',
+    )
     return parser.parse_args()
 
 
@@ -194,7 +402,11 @@ def show_db_summary(conn):
 # ============================================================
 # 브라우저 설정 & 로그인
 # ============================================================
-def setup_driver():
+def setup_driver(cache_name='main'):
+    """헤드리스 Chrome 생성.
+    LEAN_BROWSER 이면 CHROME_CACHE_DIR/<cache_name> 디스크 캐시(JS 번들 재사용)와
+    BLOCKED_URL_PATTERNS 요청 차단을 적용한다. 동시에 뜨는 브라우저는 cache_name 을 다르게 줄 것.
+    """
     options = Options()
     options.add_argument('--headless=new')
     options.add_argument('--no-sandbox')
@@ -209,13 +421,32 @@ def setup_driver():
         'AppleWebKit/537.36 (KHTML, like Gecko) '
         'Chrome/120.0.0.0 Safari/537.36'
     )
+    if LEAN_BROWSER:
+        options.add_argument(f'--disk-cache-dir={os.path.join(CHROME_CACHE_DIR, cache_name)}')
+        options.add_argument(f'--disk-cache-size={CHROME_CACHE_MB * 1024 * 1024}')
     driver = webdriver.Chrome(options=options)
     driver.set_page_load_timeout(20)
+    if LEAN_BROWSER:
+        block_resources(driver)
     return driver
 
 
+def block_resources(driver, patterns=None):
+    """CDP 로 이미지·폰트·미디어·추적 스크립트 요청 차단 (페이지 이동 후에도 유지)"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs',
+                               {'urls': list(patterns or BLOCKED_URL_PATTERNS)})
+        return True
+    except Exception as e:
+        log(f"    ⚠ 리소스 차단 설정 실패 (차단 없이 진행): {e}")
+        return False
+
+
 def login(driver):
-    """new.medigate.net으로 접근 → 로그인 리다이렉트 → 로그인 완료"""
+    """new.medigate.net으로 접근 → 로그인 리다이렉트 → 로그인 완료
+    (로그인 페이지는 다른 호스트이므로 BASE_URL 호스트로 돌아오면 성공)
+    """
     log("[LOGIN] 로그인 중...")
     driver.get(LOGIN_TRIGGER_URL)
     time.sleep(4)
@@ -237,7 +468,7 @@ def login(driver):
         driver.execute_script("checkLoginForm();")
         time.sleep(6)
 
-        if 'new.medigate.net' in driver.current_url:
+        if urlsplit(driver.current_url).netloc == urlsplit(BASE_URL).netloc:
             log(f"[OK] 로그인 성공 -> {driver.current_url}")
             return True
         else:
@@ -249,22 +480,214 @@ def login(driver):
         return False
 
 
+def open_session(driver):
+    """저장된 로그인 세션 재사용 (session_store.py), 만료됐으면 login() 후 저장"""
+    return session_store.ensure_login(driver, login, RECRUIT_URL, log=log)
+
+
 # ============================================================
 # 페이지 로딩
 # ============================================================
+# 조건이 충족되면 즉시 반환 (고정 sleep 은 최대 대기 시간으로만 사용)
+LIST_READY_JS = """
+    return document.querySelector('a[href^="/recruit/"]') !== null
+        && document.querySelector('div[class*="w-[220px]"]') !== null;
+"""
+DETAIL_READY_JS = """
+    return document.querySelector('div.my-qjvukt span.my-1daa3uy') !== null;
+"""
+
+
+class WaitStats:
+    """readyState 이후 조건 대기 시간 집계 (thread-safe).
+    kind 별로 페이지 단위 / 전체 누적을 따로 유지하고, 고정 sleep 대비 절약 시간을 계산한다.
+    """
+
+    FIXED = {'list': LIST_SETTLE_MAX, 'detail': DETAIL_SETTLE_MAX}
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._page  = {}
+        self._total = {}
+
+    def record(self, kind, seconds, met):
+        with self._lock:
+            for bucket in (self._page, self._total):
+                n, total, timeouts = bucket.get(kind, (0, 0.0, 0))
+                bucket[kind] = (n + 1, total + seconds, timeouts + (0 if met else 1))
+
+    @staticmethod
+    def _describe(bucket):
+        parts = []
+        for kind, label in (('list', '목록'), ('detail', '상세')):
+            if kind not in bucket:
+                continue
+            n, total, timeouts = bucket[kind]
+            saved = n * WaitStats.FIXED[kind] - total
+            parts.append(f"{label} {n}회 평균 {total / n:.2f}초 "
+                         f"(시간초과 {timeouts}, 고정대기 대비 -{saved:.1f}초)")
+        return ' / '.join(parts) if parts else '기록 없음'
+
+    def page_summary(self):
+        """이번 페이지 집계 문자열 반환 후 페이지 집계 초기화"""
+        with self._lock:
+            text, self._page = self._describe(self._page), {}
+        return text
+
+    def total_summary(self):
+        with self._lock:
+            return self._describe(self._total)
+
+
+WAIT_STATS = WaitStats()
+
+
+class RunTimings:
+    """구간별 누적 소요 시간(초) (thread-safe) — --stats-json / bench_crawl.py 용.
+      fetch = 페이지 요청 + readyState / wait = 렌더링 조건 대기
+      sleep = 딜레이·요청 간격·재시도 대기 / parse = 공고 추출 / db = 조회·저장
+    병렬 상세 수집 시 워커 스레드 시간이 합산되므로 합계가 실제 경과 시간보다 클 수 있다.
+    """
+
+    def __init__(self):
+        self._lock   = threading.Lock()
+        self._totals = {}
+
+    def add(self, name, seconds):
+        with self._lock:
+            self._totals[name] = self._totals.get(name, 0.0) + seconds
+        METRICS.inc('medigate_phase_seconds_total', seconds, phase=name)
+
+    def as_dict(self):
+        with self._lock:
+            return {k: round(v, 3) for k, v in self._totals.items()}
+
+
+TIMINGS = RunTimings()
+
+
+def pause(seconds):
+    """time.sleep + TIMINGS['sleep'] 기록"""
+    if seconds > 0:
+        time.sleep(seconds)
+        TIMINGS.add('sleep', seconds)
+
+
+def export_metrics():
+    """--metrics-file 지정 시 OpenMetrics textfile 갱신 (실패해도 수집은 계속)"""
+    if not METRICS_FILE:
+        return
+    try:
+        METRICS.write_textfile(METRICS_FILE)
+    except Exception as e:
+        log(f"    ⚠ 지표 파일 저장 실패: {e}")
+
+
+def latency_summary():
+    """목록/상세/DB 지연 p50·p95 한 줄 요약"""
+    hists = METRICS.summary()['histograms']
+    parts = []
+    for name, label in (('medigate_list_page_seconds', '목록'),
+                        ('medigate_detail_page_seconds', '상세'),
+                        ('medigate_db_write_seconds', 'DB저장')):
+        h = hists.get(name, {}).get('_')
+        if h and h['count']:
+            parts.append(f"{label} {h['p50']:.2f}/{h['p95']:.2f}초")
+    return ' · '.join(parts) if parts else '기록 없음'
+
+
+# 문서 + 하위 리소스 전송량 / 요청 수 / 로드 시간 (Resource Timing API).
+# 차단된 요청은 목록에 나타나지 않고, 디스크 캐시 적중은 transferSize 0,
+# Timing-Allow-Origin 이 없는 외부 리소스는 크기 0 으로 집계된다.
+PAGE_WEIGHT_JS = """
+    const nav = performance.getEntriesByType('navigation')[0];
+    const res = performance.getEntriesByType('resource');
+    let bytes = nav ? nav.transferSize : 0;
+    for (const r of res) { bytes += r.transferSize || 0; }
+    const end = nav ? (nav.loadEventEnd || nav.domContentLoadedEventEnd) : 0;
+    return {bytes: bytes, requests: res.length + 1,
+            load_ms: nav && end ? end - nav.startTime : null};
+"""
+
+
+def record_page_weight(driver, kind):
+    """현재 페이지 용량·요청 수·로드 시간을 METRICS 에 기록 (실패해도 수집에는 영향 없음)"""
+    try:
+        info = driver.execute_script(PAGE_WEIGHT_JS)
+    except Exception:
+        return
+    if not isinstance(info, dict):
+        return
+    METRICS.observe('medigate_page_bytes', info.get('bytes') or 0, kind=kind)
+    METRICS.observe('medigate_page_requests', info.get('requests') or 0, kind=kind)
+    if info.get('load_ms'):
+        METRICS.observe('medigate_page_load_seconds', info['load_ms'] / 1000.0, kind=kind)
+
+
+def page_weight_summary():
+    """목록/상세 페이지 평균 전송량·요청 수·로드 시간 한 줄 요약"""
+    hists = METRICS.summary()['histograms']
+    parts = []
+    for kind, label in (('list', '목록'), ('detail', '상세')):
+        size = hists.get('medigate_page_bytes', {}).get(f'kind={kind}')
+        if not size or not size['count']:
+            continue
+        reqs = hists.get('medigate_page_requests', {}).get(f'kind={kind}', {})
+        load = hists.get('medigate_page_load_seconds', {}).get(f'kind={kind}')
+        text = f"{label} 평균 {size['mean'] / 1024:,.0f}KB · 요청 {reqs.get('mean') or 0:.0f}개"
+        if load and load['count']:
+            text += f" · 로드 {load['mean']:.2f}초"
+        parts.append(text)
+    if not parts:
+        return '기록 없음'
+    return ' / '.join(parts) + f"  ({'리소스 차단+캐시' if LEAN_BROWSER else '--no-lean'})"
+
+
+def wait_for_content(driver, script, timeout, kind):
+    """script 가 true 를 반환할 때까지 최대 timeout 초 대기하고 WAIT_STATS 에 기록"""
+    t0  = time.monotonic()
+    met = True
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=SETTLE_POLL).until(
+            lambda d: d.execute_script(script)
+        )
+    except Exception:
+        met = False
+    waited = time.monotonic() - t0
+    WAIT_STATS.record(kind, waited, met)
+    TIMINGS.add('wait', waited)
+    return met
+
+
 def load_page(driver, page_no):
+    with METRICS.timer('medigate_list_page_seconds'):
+        _load_page(driver, page_no)
+    METRICS.inc('medigate_requests_total', kind='list')
+
+
+def _load_page(driver, page_no):
     url = f"{RECRUIT_URL}?sorter=regDate&pageNo={page_no}"
+    t0  = time.monotonic()
+    ok  = True
     try:
         driver.get(url)
     except Exception as e:
+        ok = False
         log(f"    ⚠ 페이지 {page_no} 로드 시간 초과 발생")
     try:
         WebDriverWait(driver, PAGE_LOAD_WAIT).until(
             lambda d: d.execute_script("return document.readyState") == "complete"
         )
     except Exception:
-        pass
-    time.sleep(1.5)
+        ok = False
+    TIMINGS.add('fetch', time.monotonic() - t0)
+    if RATE_CONTROL is not None:
+        if ok:
+            RATE_CONTROL.record(time.monotonic() - t0)
+        else:
+            RATE_CONTROL.penalize('목록 시간 초과')
+    wait_for_content(driver, LIST_READY_JS, LIST_SETTLE_MAX, 'list')
+    record_page_weight(driver, 'list')
 
 
 # ============================================================
@@ -334,53 +757,30 @@ def extract_posts_from_soup(soup):
     return posts
 
 
-def parse_card(card, href):
+def _card_parts(children_texts, joined_text):
+    """카드 칼럼의 (첫 값, 둘째 값). 자식 태그 텍스트가 없으면 '/' 구분 전체 텍스트로 대체."""
+    parts = [t for t in children_texts if t]
+    if not parts:
+        parts = joined_text.split('/', 1)
+    first  = parts[0] if parts else ''
+    second = parts[1] if len(parts) > 1 else ''
+    return first, second
+
+
+def _build_post(href, col220, col130, col120, specialties, title):
+    """카드에서 뽑은 칼럼 값 → 공고 dict (BeautifulSoup/lxml 파서 공용)"""
     post_id = re.search(r'/recruit/(\d+)', href)
     post_id = post_id.group(1) if post_id else ''
     url     = BASE_URL + href
 
-    w220 = card.select_one('div[class*="w-[220px]"]')
-    hospital_name = hospital_type = ''
-    if w220:
-        parts = [s.get_text(strip=True) for s in w220.find_all(
-            ['span', 'p', 'div'], recursive=False
-        ) if s.get_text(strip=True)]
-        if not parts:
-            parts = w220.get_text(separator='/', strip=True).split('/', 1)
-        hospital_name = parts[0] if parts else ''
-        hospital_type = parts[1] if len(parts) > 1 else ''
-
-    w130 = card.select_one('div[class*="w-[130px]"]')
-    employment_type = region = ''
-    if w130:
-        parts130 = [s.get_text(strip=True) for s in w130.find_all(
-            ['span', 'p'], recursive=False
-        ) if s.get_text(strip=True)]
-        if not parts130:
-            parts130 = w130.get_text(separator='/', strip=True).split('/', 1)
-        employment_type = parts130[0] if parts130 else ''
-        region          = parts130[1] if len(parts130) > 1 else ''
-
-    w120 = card.select_one('div[class*="w-[120px]"]')
+    hospital_name, hospital_type = col220 or ('', '')
+    employment_type, region      = col130 or ('', '')
     deadline = register_date = ''
-    if w120:
-        parts120 = [s.get_text(strip=True) for s in w120.find_all(
-            ['span', 'p'], recursive=False
-        ) if s.get_text(strip=True)]
-        if not parts120:
-            parts120 = w120.get_text(separator='/', strip=True).split('/', 1)
-        deadline_raw  = parts120[0] if parts120 else ''
-        date_raw      = parts120[1] if len(parts120) > 1 else ''
-        deadline      = deadline_raw
+    if col120:
+        deadline, date_raw = col120
         register_date = parse_register_date(date_raw)
 
-    spec_spans  = card.select('span.my-1n83qxm')
-    specialties = [s.get_text(strip=True) for s in spec_spans if s.get_text(strip=True)]
-
-    btn   = card.select_one('button')
-    title = btn.get_text(strip=True) if btn else ''
-    title = clean_title(title, specialties)
-
+    title       = clean_title(title, specialties)
     region_sido = region.split()[0] if region else ''
 
     if not hospital_name and not title:
@@ -401,6 +801,340 @@ def parse_card(card, href):
     }
 
 
+def parse_card(card, href):
+    def column(width, tags):
+        div = card.select_one(f'div[class*="w-[{width}px]"]')
+        if not div:
+            return None
+        return _card_parts(
+            [c.get_text(strip=True) for c in div.find_all(tags, recursive=False)],
+            div.get_text(separator='/', strip=True),
+        )
+
+    col220 = column(220, ['span', 'p', 'div'])
+    col130 = column(130, ['span', 'p'])
+    col120 = column(120, ['span', 'p'])
+
+    spec_spans  = card.select('span.my-1n83qxm')
+    specialties = [s.get_text(strip=True) for s in spec_spans if s.get_text(strip=True)]
+
+    btn   = card.select_one('button')
+    title = btn.get_text(strip=True) if btn else ''
+
+    return _build_post(href, col220, col130, col120, specialties, title)
+
+
+# ============================================================
+# 빠른 목록 파서 (lxml)
+# ============================================================
+# extract_posts_from_soup 는 링크마다 부모를 최대 8단계 올라가며 형제 수를 세므로
+# 48카드 페이지에서 사실상 O(n²) 이다. 여기서는 카드 컨테이너를 페이지당 한 번만
+# 찾고(카드 class 는 ListParsePlan 에 캐시), 카드 전체를 한 번에 훑는다.
+# 결과는 parse_card 와 동일하다 (bench_list_parser.py 로 검증).
+_RECRUIT_HREF = re.compile(r'^/recruit/\d+$')
+
+if lxml_html is not None:
+    _X_LINKS     = etree.XPath('//a[starts-with(@href, "/recruit/")]')
+    _X_CARD_LINK = etree.XPath('.//a[starts-with(@href, "/recruit/")]')
+    _X_COL = {
+        w: etree.XPath(f'.//div[contains(@class, "w-[{w}px]")]')
+        for w in (220, 130, 120)
+    }
+    _X_SPEC   = etree.XPath(
+        './/span[contains(concat(" ", normalize-space(@class), " "), " my-1n83qxm ")]'
+    )
+    _X_BUTTON = etree.XPath('.//button')
+
+
+def _lx_texts(el):
+    return [t.strip() for t in el.itertext() if t.strip()]
+
+
+def _lx_text(el):
+    return ''.join(_lx_texts(el))
+
+
+def _lx_classes(el):
+    """BeautifulSoup 의 el.get('class') 와 같은 비교용 값 (공백 분리 리스트 / None)"""
+    cls = el.get('class')
+    return cls.split() if cls is not None else None
+
+
+def _lx_find_card(link):
+    """extract_posts_from_soup 와 같은 규칙: 같은 class 형제가 10개 이상인 조상"""
+    card = link
+    for _ in range(8):
+        card = card.getparent()
+        if card is None or card.tag in ('html', 'body'):
+            return None
+        parent = card.getparent()
+        if parent is None:
+            return None
+        cls = _lx_classes(card)
+        sibling_count = sum(
+            1 for sib in parent
+            if isinstance(sib.tag, str) and _lx_classes(sib) == cls
+        )
+        if sibling_count >= 10:
+            return card
+    return card
+
+
+def _lx_parse_card(card, href):
+    def column(width, tags):
+        found = _X_COL[width](card)
+        if not found:
+            return None
+        div = found[0]
+        return _card_parts(
+            [_lx_text(c) for c in div if c.tag in tags],
+            '/'.join(_lx_texts(div)),
+        )
+
+    col220 = column(220, ('span', 'p', 'div'))
+    col130 = column(130, ('span', 'p'))
+    col120 = column(120, ('span', 'p'))
+
+    specialties = [t for t in (_lx_text(s) for s in _X_SPEC(card)) if t]
+
+    btns  = _X_BUTTON(card)
+    title = _lx_text(btns[0]) if btns else ''
+
+    return _build_post(href, col220, col130, col120, specialties, title)
+
+
+class ListParsePlan:
+    """목록 페이지 파싱 계획.
+
+    첫 페이지에서 카드 컨테이너를 찾으면 그 위치(XPath)와 카드 class 를 기억해 두고,
+    다음 페이지부터는 링크→부모 탐색 없이 컨테이너의 자식 카드를 바로 얻는다.
+    레이아웃이 달라 기억한 위치가 맞지 않으면 다시 탐색한다.
+    """
+
+    def __init__(self):
+        self.container_path = None
+        self.card_class     = None
+
+    def _cards_in(self, container):
+        return [c for c in container
+                if isinstance(c.tag, str) and _lx_classes(c) == self.card_class]
+
+    def _locate_cards(self, root, links):
+        if self.container_path is not None:
+            found = root.getroottree().xpath(self.container_path)
+            if found:
+                cards = self._cards_in(found[0])
+                if len(cards) >= 10:
+                    return cards
+
+        for link in links:
+            card = _lx_find_card(link)
+            if card is None or card.getparent() is None:
+                continue
+            container = card.getparent()
+            self.container_path = container.getroottree().getpath(container)
+            self.card_class     = _lx_classes(card)
+            cards = self._cards_in(container)
+            # 형제 10개 미만이면 기존 규칙과 같은 카드라는 보장이 없으므로 사용하지 않음
+            return cards if len(cards) >= 10 else []
+        return []
+
+    def extract(self, html):
+        root  = lxml_html.fromstring(html)
+        links = [a for a in _X_LINKS(root) if _RECRUIT_HREF.match(a.get('href', ''))]
+        if not links:
+            return []
+
+        # 카드별 링크 → (href, card). 컨테이너 밖 링크는 기존 규칙으로 카드 탐색
+        card_of = {}
+        for card in self._locate_cards(root, links):
+            for a in _X_CARD_LINK(card):
+                href = a.get('href', '')
+                if _RECRUIT_HREF.match(href):
+                    card_of.setdefault(href, card)
+
+        posts      = []
+        seen_hrefs = set()
+        for link in links:
+            href = link.get('href', '')
+            if href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
+
+            card = card_of.get(href)
+            if card is None:
+                card = _lx_find_card(link)
+            if card is None:
+                continue
+            try:
+                post = _lx_parse_card(card, href)
+                if post:
+                    posts.append(post)
+            except Exception:
+                continue
+        return posts
+
+
+_LIST_PLAN = ListParsePlan()
+
+
+def extract_posts_from_html(html):
+    """목록 페이지 HTML → 공고 리스트. lxml 이 있으면 빠른 파서, 없으면 BeautifulSoup."""
+    if lxml_html is not None:
+        return _LIST_PLAN.extract(html)
+    return extract_posts_from_soup(BeautifulSoup(html, 'html.parser'))
+
+
+# ============================================================
+# 브라우저 내 추출 (--extract-mode browser)
+# ============================================================
+# driver.page_source 는 목록 페이지 기준 1MB 가 넘는 HTML 을 WebDriver 로 넘겨받아
+# 다시 파싱해야 한다. 아래 스크립트는 페이지 안에서 필요한 값만 뽑아 작은 JSON 으로
+# 돌려준다. 카드 탐색 규칙과 텍스트 규칙(get_text(strip=True) = 공백 제거한 텍스트 노드
+# 이어붙이기)은 BeautifulSoup 경로와 같고, 최종 dict 는 _build_post 로 만든다.
+_JS_TEXTS = r"""
+function texts(el) {
+    const out = [];
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    let node;
+    while ((node = walker.nextNode())) {
+        const p = node.parentNode && node.parentNode.nodeName;
+        if (p === 'SCRIPT' || p === 'STYLE') continue;
+        const t = node.nodeValue.trim();
+        if (t) out.push(t);
+    }
+    return out;
+}
+"""
+
+LIST_EXTRACT_JS = _JS_TEXTS + r"""
+const HREF = /^\/recruit\/\d+$/;
+function cls(el) {
+    const c = el.getAttribute('class');
+    return c === null ? null : c.trim().split(/\s+/).filter(Boolean).join(' ');
+}
+function findCard(link) {
+    let card = link;
+    for (let i = 0; i < 8; i++) {
+        card = card.parentElement;
+        if (!card || card.nodeName === 'HTML' || card.nodeName === 'BODY') return null;
+        const parent = card.parentElement;
+        if (!parent) return null;
+        const c = cls(card);
+        let n = 0;
+        for (const sib of parent.children) if (cls(sib) === c) n++;
+        if (n >= 10) return card;
+    }
+    return card;
+}
+function column(card, width, tags) {
+    const div = card.querySelector('div[class*="w-[' + width + 'px]"]');
+    if (!div) return null;
+    const children = [];
+    for (const c of div.children) {
+        if (tags.includes(c.nodeName)) children.push(texts(c).join(''));
+    }
+    return {children: children, joined: texts(div).join('/')};
+}
+const out = [];
+const seen = new Set();
+for (const a of document.querySelectorAll('a[href^="/recruit/"]')) {
+    const href = a.getAttribute('href');
+    if (!HREF.test(href) || seen.has(href)) continue;
+    seen.add(href);
+    const card = findCard(a);
+    if (!card) continue;
+    const btn = card.querySelector('button');
+    out.push({
+        href: href,
+        c220: column(card, 220, ['SPAN', 'P', 'DIV']),
+        c130: column(card, 130, ['SPAN', 'P']),
+        c120: column(card, 120, ['SPAN', 'P']),
+        specs: Array.from(card.querySelectorAll('span.my-1n83qxm'))
+                    .map(s => texts(s).join('')).filter(Boolean),
+        title: btn ? texts(btn).join('') : '',
+    });
+}
+return out;
+"""
+
+DETAIL_EXTRACT_JS = _JS_TEXTS + r"""
+const rows = [];
+for (const row of document.querySelectorAll('div.my-qjvukt')) {
+    const label = row.querySelector('span.my-1daa3uy');
+    if (!label) continue;
+    const val = row.querySelector('div[class*="flex-[1_0_0]"]');
+    if (!val) continue;
+    const t = texts(val);
+    rows.push([texts(label).join(''), t.join(' '), t.join('')]);
+}
+return rows;
+"""
+
+
+def _js_column(col):
+    if not col:
+        return None
+    return _card_parts(col.get('children') or [], col.get('joined') or '')
+
+
+def extract_posts_in_browser(driver):
+    """LIST_EXTRACT_JS 실행 → 공고 리스트. 실패/빈 결과면 [] (호출 측에서 HTML 파서로 대체)"""
+    try:
+        cards = driver.execute_script(LIST_EXTRACT_JS) or []
+    except Exception as e:
+        log(f"    ⚠ 브라우저 내 목록 추출 실패: {e}")
+        return []
+    posts = []
+    for c in cards:
+        try:
+            post = _build_post(
+                c['href'],
+                _js_column(c.get('c220')),
+                _js_column(c.get('c130')),
+                _js_column(c.get('c120')),
+                list(c.get('specs') or []),
+                c.get('title') or '',
+            )
+            if post:
+                posts.append(post)
+        except Exception:
+            continue
+    return posts
+
+
+def extract_detail_rows_in_browser(driver):
+    """DETAIL_EXTRACT_JS 실행 → 모집개요 행 리스트. 실패 시 []"""
+    try:
+        rows = driver.execute_script(DETAIL_EXTRACT_JS) or []
+        return [tuple(r) for r in rows]
+    except Exception:
+        return []
+
+
+def extract_posts_from_driver(driver):
+    """현재 목록 페이지의 공고 추출. browser 모드는 JSON 이 비면 page_source 로 대체.
+    보관(--archive) 중이면 원본을 받아 보관한 뒤 그 원본을 파싱한다.
+    """
+    t0 = time.monotonic()
+    try:
+        return _extract_posts_from_driver(driver)
+    finally:
+        TIMINGS.add('parse', time.monotonic() - t0)
+
+
+def _extract_posts_from_driver(driver):
+    if ARCHIVE is not None:
+        html = driver.page_source
+        ARCHIVE.put(driver.current_url, 'list', html)
+        return extract_posts_from_html(html)
+    if EXTRACT_MODE == 'browser':
+        posts = extract_posts_in_browser(driver)
+        if posts:
+            return posts
+    return extract_posts_from_html(driver.page_source)
+
+
 # ============================================================
 # 페이지 수 계산
 # ============================================================
@@ -434,49 +1168,99 @@ def get_total_pages(soup):
 # ============================================================
 # 상세 페이지 급여 + 초빙과목 추출
 # ============================================================
-def extract_detail_info(driver, url: str):
+def _detail_from_rows(rows):
+    """모집개요 행 [(라벨, 값(공백 구분), 값(붙임)), ...] → 급여 텍스트 + 초빙과목"""
+    salary_text        = None
+    detail_specialties = []
+    for label_text, value_spaced, value_joined in rows:
+        if label_text == '급여':
+            salary_text = value_spaced
+        elif label_text == '초빙과목':
+            detail_specialties = [
+                s.strip() for s in value_joined.split(',')
+                if s.strip() and len(s.strip()) >= 2
+            ]
+    return {'salary': salary_text, 'specialties': detail_specialties}
+
+
+def _detail_rows_from_soup(soup):
+    rows = []
+    for row in soup.find_all('div', class_='my-qjvukt'):
+        label = row.find('span', class_='my-1daa3uy')
+        if not label:
+            continue
+        val_div = row.find(
+            'div',
+            class_=lambda c: c and 'flex-[1_0_0]' in c
+        )
+        if not val_div:
+            continue
+        rows.append((
+            label.get_text(strip=True),
+            val_div.get_text(separator=' ', strip=True),
+            val_div.get_text(strip=True),
+        ))
+    return rows
+
+
+def _detail_rows_from_driver(driver, url):
+    if ARCHIVE is not None:
+        html = driver.page_source
+        ARCHIVE.put(url, 'detail', html)
+        return _detail_rows_from_soup(BeautifulSoup(html, 'html.parser'))
+    rows = []
+    if EXTRACT_MODE == 'browser':
+        rows = extract_detail_rows_in_browser(driver)
+    if not rows:
+        rows = _detail_rows_from_soup(BeautifulSoup(driver.page_source, 'html.parser'))
+    return rows
+
+
+def extract_detail_info(driver, url: str, limiter=None):
     """상세 페이지에서 급여 텍스트 + 초빙과목 리스트를 동시에 추출.
+    limiter 가 주어지면 요청(재시도 포함) 직전마다 limiter.acquire() 로 대기.
+    EXTRACT_MODE == 'browser' 이면 페이지 안에서 행만 JSON 으로 받고,
+    행이 하나도 없을 때만 page_source + BeautifulSoup 으로 대체한다.
     반환: {'salary': str|None, 'specialties': list}
     """
     for attempt in range(DETAIL_RETRY + 1):
+        started = time.monotonic()   # acquire 전 예외에서도 except 블록이 읽을 수 있게
         try:
+            if limiter is not None:
+                limiter.acquire()
+            METRICS.inc('medigate_requests_total', kind='detail')
+            started = t0 = time.monotonic()
             driver.get(url)
             WebDriverWait(driver, 12).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
-            time.sleep(1.2)
-
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            salary_text       = None
-            detail_specialties = []
-
-            for row in soup.find_all('div', class_='my-qjvukt'):
-                label = row.find('span', class_='my-1daa3uy')
-                if not label:
-                    continue
-                label_text = label.get_text(strip=True)
-                val_div = row.find(
-                    'div',
-                    class_=lambda c: c and 'flex-[1_0_0]' in c
-                )
-                if not val_div:
-                    continue
-
-                if label_text == '급여':
-                    salary_text = val_div.get_text(separator=' ', strip=True)
-                elif label_text == '초빙과목':
-                    raw = val_div.get_text(strip=True)
-                    detail_specialties = [
-                        s.strip() for s in raw.split(',')
-                        if s.strip() and len(s.strip()) >= 2
-                    ]
+            TIMINGS.add('fetch', time.monotonic() - t0)
+            if RATE_CONTROL is not None:
+                RATE_CONTROL.record(time.monotonic() - t0)
+            wait_for_content(driver, DETAIL_READY_JS, DETAIL_SETTLE_MAX, 'detail')
+            record_page_weight(driver, 'detail')
 
-            return {'salary': salary_text, 'specialties': detail_specialties}
+            t0 = time.monotonic()
+            try:
+                detail = _detail_from_rows(_detail_rows_from_driver(driver, url))
+            finally:
+                TIMINGS.add('parse', time.monotonic() - t0)
+            METRICS.observe('medigate_detail_page_seconds', time.monotonic() - started)
+            return detail
 
         except Exception as e:
+            if RATE_CONTROL is not None:
+                if type(e).__name__ == 'TimeoutException':
+                    RATE_CONTROL.penalize('상세 시간 초과')
+                elif attempt == DETAIL_RETRY:
+                    RATE_CONTROL.penalize('상세 재시도 소진')
+                else:
+                    RATE_CONTROL.record(time.monotonic() - started, ok=False)
             if attempt < DETAIL_RETRY:
-                time.sleep(3)
+                METRICS.inc('medigate_retries_total', kind='detail')
+                pause(3)
             else:
+                METRICS.inc('medigate_request_errors_total', kind='detail')
                 raise
 
 
@@ -485,15 +1269,252 @@ def extract_salary_text(driver, url: str):
     return extract_detail_info(driver, url).get('salary')
 
 
+# ============================================================
+# 상세 페이지 병렬 수집 (--detail-workers)
+# ============================================================
+class AimdRate:
+    """AIMD(가산 증가 / 승산 감소) 요청 속도 제어기 (thread-safe, --adaptive).
+
+    요청 window 건마다 평균 로드 시간이 slow 초 이하이고 실패가 없으면 분당 step 만큼 올리고,
+    시간 초과·재시도 소진(penalize) 시 backoff 배로 내린다. 속도는 [floor, ceiling] 범위이며
+    바뀔 때마다 '[속도]' 로그(rate_per_min 필드)와 history 에 남는다.
+    """
+
+    def __init__(self, rate, floor=RATE_FLOOR, ceiling=RATE_CEILING, step=RATE_STEP,
+                 backoff=RATE_BACKOFF, window=RATE_WINDOW, slow=RATE_SLOW_SECONDS,
+                 cooldown=RATE_COOLDOWN):
+        self.floor    = floor
+        self.ceiling  = max(ceiling, floor)
+        self.step     = step
+        self.backoff  = backoff
+        self.window   = window
+        self.slow     = slow
+        self.cooldown = cooldown
+        self.rate     = min(max(rate, self.floor), self.ceiling)
+        self.history  = [(datetime.now().isoformat(timespec='seconds'), self.rate, '시작')]
+        self._lock    = threading.Lock()
+        self._cut_at  = -cooldown
+        self._reset_window()
+
+    def _reset_window(self):
+        self._n, self._sum, self._errors = 0, 0.0, 0
+
+    def record(self, seconds, ok=True):
+        """요청 1건 결과 (로드 시간, 성공 여부)"""
+        with self._lock:
+            self._n   += 1
+            self._sum += seconds
+            if not ok:
+                self._errors += 1
+            if self._n < self.window:
+                return
+            avg, errors = self._sum / self._n, self._errors
+            self._reset_window()
+            if errors or avg > self.slow or self.rate >= self.ceiling:
+                return
+            self._set(min(self.rate + self.step, self.ceiling),
+                      f"정상 {self.window}건 평균 {avg:.2f}초")
+
+    def penalize(self, reason):
+        """시간 초과 / 재시도 소진 → 즉시 감소 (cooldown 안의 추가 실패는 무시)"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._cut_at < self.cooldown:
+                return
+            self._cut_at = now
+            self._reset_window()
+            if self.rate > self.floor:
+                self._set(max(self.rate * self.backoff, self.floor), reason)
+
+    def _set(self, rate, reason):
+        old, self.rate = self.rate, rate
+        self.history.append((datetime.now().isoformat(timespec='seconds'), round(rate, 2), reason))
+        METRICS.inc('medigate_rate_changes_total', direction='up' if rate > old else 'down')
+        log(f"    [속도] 분당 {old:.1f} → {rate:.1f}건 ({reason})",
+            rate_per_min=round(rate, 2), reason=reason)
+
+    def summary(self):
+        rates = [r for _, r, _ in self.history]
+        ups   = sum(1 for a, b in zip(rates, rates[1:]) if b > a)
+        return (f"분당 {rates[0]:.1f} → {self.rate:.1f}건 (범위 {min(rates):.1f}~{max(rates):.1f}, "
+                f"증가 {ups}회 / 감소 {len(rates) - 1 - ups}회)")
+
+
+class RateLimiter:
+    """여러 워커가 공유하는 전역 요청 간격 제한기 (thread-safe).
+
+    controller(AimdRate) 지정 시 그 시점의 속도로,
+    rate_per_min 지정 시 60/rate 초 고정 간격,
+    미지정 시 순차 방식과 같은 DETAIL_DELAY_MIN~MAX 랜덤 간격으로
+    요청 '시작 시각'을 배분한다. 워커 수와 무관하게 사이트가 보는
+    전체 요청 속도는 동일하게 유지된다.
+    """
+
+    def __init__(self, rate_per_min=None,
+                 delay_min=DETAIL_DELAY_MIN, delay_max=DETAIL_DELAY_MAX, controller=None):
+        self.rate_per_min = rate_per_min
+        self.delay_min    = delay_min
+        self.delay_max    = delay_max
+        self.controller   = controller
+        self._lock        = threading.Lock()
+        self._next_at     = 0.0
+
+    def _interval(self):
+        if self.controller is not None:
+            return 60.0 / self.controller.rate
+        if self.rate_per_min:
+            return 60.0 / self.rate_per_min
+        return random.uniform(self.delay_min, self.delay_max)
+
+    def acquire(self):
+        """다음 요청 슬롯까지 대기"""
+        with self._lock:
+            now   = time.monotonic()
+            start = max(now, self._next_at)
+            self._next_at = start + self._interval()
+        if start > now:
+            pause(start - now)
+
+
+class DetailFetchPool:
+    """로그인된 Chrome 여러 개로 상세 페이지를 동시에 수집.
+
+    드라이버는 큐로 관리하며 한 번에 한 스레드만 사용한다.
+    DB 연결은 스레드 간 공유하지 않으므로 결과 저장은 호출한 쪽(메인 스레드)에서 한다.
+    """
+
+    def __init__(self, n_workers, limiter):
+        self.limiter  = limiter
+        self._drivers = queue.Queue()
+        self._all     = []
+        self._executor = ThreadPoolExecutor(max_workers=n_workers)
+
+        # 로그인은 고정 대기가 길어서 병렬로 진행
+        for driver in self._executor.map(self._start_driver, range(n_workers)):
+            if driver is not None:
+                self._drivers.put(driver)
+                self._all.append(driver)
+        if not self._all:
+            self._executor.shutdown()
+            raise RuntimeError("상세 수집용 브라우저 로그인 전부 실패")
+        log(f"    상세 수집 워커 {len(self._all)}/{n_workers}개 준비 완료")
+
+    @staticmethod
+    def _start_driver(idx):
+        driver = None
+        try:
+            driver = setup_driver(cache_name=f'detail{idx + 1}')
+            if open_session(driver):
+                return driver
+            log(f"    ⚠ 상세 워커 #{idx + 1} 로그인 실패 → 제외")
+        except Exception as e:
+            log(f"    ⚠ 상세 워커 #{idx + 1} 시작 오류: {e}")
+        if driver is not None:
+            driver.quit()
+        return None
+
+    def _fetch(self, url):
+        driver = self._drivers.get()
+        try:
+            return extract_detail_info(driver, url, limiter=self.limiter)
+        finally:
+            self._drivers.put(driver)
+
+    def fetch_many(self, urls):
+        """urls 순서대로 상세 결과(dict) 또는 발생한 Exception 리스트 반환"""
+        futures = [self._executor.submit(self._fetch, u) for u in urls]
+        results = []
+        for f in futures:
+            try:
+                results.append(f.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for driver in self._all:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
 # ============================================================
 # DB 처리
 # ============================================================
-def load_existing_keys(conn):
+def ensure_unique_index(conn):
+    """(source, unique_key) UNIQUE 인덱스가 없으면 생성.
+    중복 판단을 DB(ON CONFLICT)에 맡기므로 시작 시 전체 키를 읽어올 필요가 없다.
+    기존 데이터에 중복 키가 있으면 생성이 실패하므로 경고만 출력한다.
+    """
     cur = conn.cursor()
-    cur.execute("SELECT unique_key FROM recruit_posts WHERE source='medigate'")
-    keys = {row[0] for row in cur.fetchall()}
-    cur.close()
-    return keys
+    try:
+        cur.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS uq_recruit_posts_source_ukey
+            ON recruit_posts (source, unique_key)
+        """)
+        conn.commit()
+        return True
+    except Exception as e:
+        conn.rollback()
+        log(f"    ⚠ unique_key 인덱스 생성 실패 (기존 중복 키 정리 필요): {e}")
+        return False
+    finally:
+        cur.close()
+
+
+def ensure_card_columns(conn):
+    """목록 카드 변경 감지용 컬럼 추가 (없을 때만)
+    card_fingerprint — 카드 표시 필드 해시 / last_seen_at — 마지막으로 목록에서 본 시각
+    missed_runs      — 수집 범위 안이었는데 목록에 없던 연속 횟수
+    """
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            ALTER TABLE recruit_posts
+                ADD COLUMN IF NOT EXISTS card_fingerprint TEXT,
+                ADD COLUMN IF NOT EXISTS last_seen_at     TIMESTAMPTZ,
+                ADD COLUMN IF NOT EXISTS missed_runs      INTEGER NOT NULL DEFAULT 0
+        """)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        log(f"    ⚠ 카드 지문 컬럼 추가 실패: {e}")
+    finally:
+        cur.close()
+
+
+def card_fingerprint(post):
+    """목록 카드에서 바뀔 수 있는 표시 필드의 해시 (unique_key 구성 필드는 제외).
+    변경 시 갱신하는 필드만 넣음 — 초빙과목은 상세 페이지 값이 우선이라 카드 전공은 제외
+    """
+    text = '\x1f'.join([
+        post.get('title') or '', post.get('deadline') or '',
+        post.get('hospital_type') or '', post.get('employment_type') or '',
+        post.get('region') or '',
+    ])
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def fetch_known_cards(conn, ukeys):
+    """주어진 unique_key 중 이미 저장된 공고 {unique_key: (id, post_id, card_fingerprint)}
+    (페이지 단위, 인덱스 조회)
+    """
+    if not ukeys:
+        return {}
+    t0  = time.monotonic()
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            SELECT unique_key, id, post_id, card_fingerprint FROM recruit_posts
+            WHERE source = 'medigate' AND unique_key = ANY(%s)
+        """, (list(ukeys),))
+        return {row[0]: row[1:] for row in cur.fetchall()}
+    finally:
+        cur.close()
+        TIMINGS.add('db', time.monotonic() - t0)
+        METRICS.observe('medigate_db_query_seconds', time.monotonic() - t0)
 
 
 def make_unique_key(hospital_name, region_sido, register_date):
@@ -507,133 +1528,713 @@ def make_unique_key(hospital_name, region_sido, register_date):
     return f"{h}|{r}|{month}"
 
 
-def save_to_db(conn, post, existing_keys):
-    """신규 공고 저장. 신규이면 new_id(int) 반환, 중복/오류이면 None 반환."""
-    ukey = make_unique_key(
-        post['hospital_name'], post['region_sido'], post['register_date']
-    )
-    if ukey in existing_keys:
-        return None
+def resolve_detail(db_label, detail, post_id=None, register_date=None):
+    """상세 수집 결과(dict 또는 Exception) → (raw_text, parsed, specialties, status).
+    status: 'salary' | 'nego' | 'none' | 'error'  (진행 통계 분류용)
+    register_date 가 있으면 그 연도 세율 규칙으로 Net 환산 (없으면 DEFAULT_TAX_YEAR 규칙)
+    """
+    if isinstance(detail, Exception):
+        log(f"    ⚠ 상세 수집 오류 ({db_label}): {detail}", post_id=post_id)
+        METRICS.inc('medigate_parse_failures_total', kind='fetch_error')
+        return None, {}, [], 'error'
+
+    raw_text    = detail.get('salary')
+    parsed      = parse_salary(raw_text, tax_year_of(register_date)) if raw_text else {}
+    specialties = detail.get('specialties', [])
+
+    if parsed.get('salary_net_min') is not None:
+        status = 'salary'
+    elif raw_text and parsed.get('salary_type') is None:
+        status = 'nego'
+    else:
+        status = 'none'
+        METRICS.inc('medigate_parse_failures_total',
+                    kind='salary_unparsed' if raw_text else 'no_salary_row')
+    return raw_text, parsed, specialties, status
 
-    cur = conn.cursor()
-    try:
-        cur.execute("""
-            INSERT INTO recruit_posts
-                (source, post_id, unique_key, hospital_name, hospital_type,
-                 title, employment_type, region, region_sido, deadline,
-                 register_date, url, is_active, crawled_at, created_at, updated_at)
-            VALUES (%s,%s,%s,%s,%s, %s,%s,%s,%s,%s, %s,%s,%s,%s,%s,%s)
-            RETURNING id
-        """, (
-            'medigate',
-            post['post_id']         or '',
-            ukey,
-            post['hospital_name']   or '',
-            post['hospital_type']   or '',
-            post['title']           or '',
-            post['employment_type'] or '',
-            post['region']          or '',
-            post['region_sido']     or '',
-            post['deadline']        or '',
-            post['register_date']   or '',
-            post['url']             or '',
-            True,
-            datetime.now(), datetime.now(), datetime.now(),
-        ))
-        new_id = cur.fetchone()[0]
 
-        for sp in post.get('specialty_list', []):
-            if sp and len(sp) >= 2:
+# ============================================================
+# 일괄 저장 (write-behind)
+# ============================================================
+_POST_COLS = (
+    'source, post_id, unique_key, hospital_name, hospital_type, '
+    'title, employment_type, region, region_sido, deadline, '
+    'register_date, url, is_active, crawled_at, created_at, updated_at, '
+    'salary_raw, salary_type, salary_unit, salary_min, salary_max, '
+    'salary_net_min, salary_net_max, salary_fetched, '
+    'card_fingerprint, last_seen_at'
+)
+
+
+class BatchWriter:
+    """목록 페이지 단위 write-behind 저장기.
+
+    add_post() / add_salary() / add_seen() 으로 모아 두었다가 flush() 에서 한 트랜잭션으로
+    다중 행 INSERT/UPDATE (execute_values) 를 실행한다.
+    공고 1건마다 커밋하던 방식보다 원격 DB 왕복 횟수가 페이지당 몇 번으로 줄어든다.
+    일괄 저장이 실패하면 롤백 후 건별로 다시 저장해 실패한 행만 로그에 남긴다.
+    """
+
+    def __init__(self, conn):
+        self.conn     = conn
+        self._posts   = []   # 신규 공고 (급여 포함)
+        self._salary  = []   # 이미 저장된 공고의 급여/초빙과목 갱신
+        self._seen    = []   # 목록에서 다시 본 기존 공고 (last_seen_at, 카드 변경 시 표시 필드)
+
+    def add_post(self, post, ukey, raw_text, parsed, specialties, queue=False):
+        """신규 공고 + 상세 수집 결과 추가. specialties 가 비면 목록의 전공 사용.
+        queue=True 면 상세 미수집(salary_fetched=FALSE)으로 저장하고 같은 트랜잭션에서
+        detail_fetch_queue 에 등록한다.
+        """
+        self._posts.append({
+            'post':        post,
+            'ukey':        ukey,
+            'raw_text':    raw_text,
+            'parsed':      parsed or {},
+            'specialties': specialties or post.get('specialty_list', []),
+            'queue':       queue,
+        })
+
+    def add_salary(self, db_id, raw_text, parsed, specialties):
+        """기존 공고(id)의 급여 결과 추가. specialties 가 있으면 교체."""
+        self._salary.append({
+            'id':          db_id,
+            'raw_text':    raw_text,
+            'parsed':      parsed or {},
+            'specialties': specialties or [],
+        })
+
+    def add_seen(self, db_id, post, fingerprint, changed):
+        """기존 공고를 목록에서 다시 봄. changed 면 제목·마감일 등 카드 필드도 갱신."""
+        self._seen.append({
+            'id':          db_id,
+            'post':        post,
+            'fingerprint': fingerprint,
+            'changed':     changed,
+        })
+
+    def pending(self):
+        return len(self._posts) + len(self._salary) + len(self._seen)
+
+    def flush(self):
+        """모아 둔 행을 한 트랜잭션으로 저장. 반환: {unique_key: 신규 id}"""
+        t0 = time.monotonic()
+        try:
+            return self._flush()
+        finally:
+            TIMINGS.add('db', time.monotonic() - t0)
+            METRICS.observe('medigate_db_write_seconds', time.monotonic() - t0)
+
+    def _flush(self):
+        posts, self._posts   = self._posts, []
+        salary, self._salary = self._salary, []
+        seen, self._seen     = self._seen, []
+        if not posts and not salary and not seen:
+            return {}
+
+        try:
+            ids = self._write(posts, salary, seen)
+            self.conn.commit()
+            return ids
+        except Exception as e:
+            self.conn.rollback()
+            log(f"    ⚠ 일괄 저장 실패 ({len(posts) + len(salary) + len(seen)}건) → 건별 재시도: {e}")
+
+        ids = {}
+        for row in posts:
+            try:
+                ids.update(self._write([row], []))
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                log(f"    ⚠ DB 저장 오류 ({row['ukey']} / {row['post'].get('url')}): {e}",
+                    post_id=row['post'].get('post_id'))
+        for row in salary:
+            try:
+                self._write([], [row])
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                log(f"    ⚠ 급여 저장 오류 id={row['id']}: {e}", db_id=row['id'])
+        if seen:
+            try:
+                self._write([], [], seen)
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                log(f"    ⚠ 목록 재확인 갱신 오류 ({len(seen)}건): {e}")
+        return ids
+
+    def _write(self, posts, salary, seen=()):
+        cur = self.conn.cursor()
+        try:
+            ids       = {}
+            spec_rows = []
+            replace   = []
+
+            if posts:
+                now = datetime.now()
+                values = []
+                for row in posts:
+                    post, parsed = row['post'], row['parsed']
+                    values.append((
+                        'medigate',
+                        post['post_id']         or '',
+                        row['ukey'],
+                        post['hospital_name']   or '',
+                        post['hospital_type']   or '',
+                        post['title']           or '',
+                        post['employment_type'] or '',
+                        post['region']          or '',
+                        post['region_sido']     or '',
+                        post['deadline']        or '',
+                        post['register_date']   or '',
+                        post['url']             or '',
+                        True, now, now, now,
+                        row['raw_text'],
+                        parsed.get('salary_type'),
+                        parsed.get('salary_unit'),
+                        parsed.get('salary_min'),
+                        parsed.get('salary_max'),
+                        parsed.get('salary_net_min'),
+                        parsed.get('salary_net_max'),
+                        not row.get('queue'),
+                        card_fingerprint(post),
+                    ))
+                # 이미 있는 키(다른 크롤러 인스턴스가 먼저 저장한 경우 포함)는
+                # DB 가 건너뛰고, 실제로 삽입된 행만 RETURNING 으로 돌아온다.
+                # last_seen_at 은 재확인 갱신·mark_missed 와 같은 DB 시계로 기록
+                returned = execute_values(
+                    cur,
+                    f"INSERT INTO recruit_posts ({_POST_COLS}) VALUES %s "
+                    "ON CONFLICT DO NOTHING "
+                    "RETURNING id, unique_key",
+                    values, page_size=len(values), fetch=True,
+                    template='(' + ', '.join(['%s'] * len(values[0])) + ', clock_timestamp())',
+                )
+                ids = {ukey: new_id for new_id, ukey in returned}
+                queued = []
+                for row in posts:
+                    new_id = ids.get(row['ukey'])
+                    if new_id is None:
+                        continue
+                    spec_rows += [(new_id, sp) for sp in row['specialties']
+                                  if sp and len(sp) >= 2]
+                    if row.get('queue'):
+                        queued.append((new_id, row['post']['post_id'], row['post']['url']))
+                detail_queue.enqueue(cur, queued)
+
+            if salary:
+                execute_values(cur, """
+                    UPDATE recruit_posts AS rp SET
+                        salary_raw     = v.salary_raw,
+                        salary_type    = v.salary_type,
+                        salary_unit    = v.salary_unit,
+                        salary_min     = v.salary_min,
+                        salary_max     = v.salary_max,
+                        salary_net_min = v.salary_net_min,
+                        salary_net_max = v.salary_net_max,
+                        salary_fetched = TRUE
+                    FROM (VALUES %s) AS v(id, salary_raw, salary_type, salary_unit,
+                                          salary_min, salary_max,
+                                          salary_net_min, salary_net_max)
+                    WHERE rp.id = v.id
+                """, [(
+                    row['id'],
+                    row['raw_text'],
+                    row['parsed'].get('salary_type'),
+                    row['parsed'].get('salary_unit'),
+                    row['parsed'].get('salary_min'),
+                    row['parsed'].get('salary_max'),
+                    row['parsed'].get('salary_net_min'),
+                    row['parsed'].get('salary_net_max'),
+                ) for row in salary],
+                    template='(%s::int, %s::text, %s::varchar, %s::varchar, '
+                             '%s::int, %s::int, %s::int, %s::int)',
+                    page_size=len(salary),
+                )
+                for row in salary:
+                    specs = [sp for sp in row['specialties'] if sp and len(sp) >= 2]
+                    if specs:
+                        replace.append(row['id'])
+                        spec_rows += [(row['id'], sp) for sp in specs]
+
+            if seen:
+                cur.execute("""
+                    UPDATE recruit_posts
+                    SET last_seen_at = clock_timestamp(), missed_runs = 0, is_active = TRUE
+                    WHERE id = ANY(%s)
+                """, ([row['id'] for row in seen],))
+                changed = [row for row in seen if row['changed']]
+                if changed:
+                    execute_values(cur, """
+                        UPDATE recruit_posts AS rp SET
+                            title            = v.title,
+                            deadline         = v.deadline,
+                            hospital_type    = v.hospital_type,
+                            employment_type  = v.employment_type,
+                            region           = v.region,
+                            card_fingerprint = v.card_fingerprint,
+                            updated_at       = now()
+                        FROM (VALUES %s) AS v(id, title, deadline, hospital_type,
+                                              employment_type, region, card_fingerprint)
+                        WHERE rp.id = v.id
+                    """, [(
+                        row['id'],
+                        row['post']['title']           or '',
+                        row['post']['deadline']        or '',
+                        row['post']['hospital_type']   or '',
+                        row['post']['employment_type'] or '',
+                        row['post']['region']          or '',
+                        row['fingerprint'],
+                    ) for row in changed],
+                        template='(%s::int, %s, %s, %s, %s, %s, %s)',
+                        page_size=len(changed),
+                    )
+
+            if replace:
                 cur.execute(
-                    "INSERT INTO recruit_post_specialties (post_id, specialty) VALUES (%s,%s)",
-                    (new_id, sp)
+                    "DELETE FROM recruit_post_specialties WHERE post_id = ANY(%s)",
+                    (replace,)
+                )
+            if spec_rows:
+                execute_values(
+                    cur,
+                    "INSERT INTO recruit_post_specialties (post_id, specialty) VALUES %s",
+                    spec_rows, page_size=len(spec_rows),
                 )
+            return ids
+        finally:
+            cur.close()
 
-        conn.commit()
-        existing_keys.add(ukey)
-        return new_id
 
-    except Exception as e:
-        conn.rollback()
-        log(f"    ⚠ DB 저장 오류: {e}")
-        return None
+# ============================================================
+# 수집 통계 / 상세 수집 공통 처리
+# ============================================================
+class CrawlStats:
+    """실행 누적 통계. 체크포인트에 그대로 저장했다가 --resume 시 복원한다."""
+
+    FIELDS = ('processed', 'saved', 'skipped', 'out_range',
+              'salary', 'nego', 'no_salary', 'sal_err', 'changed', 'queued')
+
+    def __init__(self, **saved):
+        for name in self.FIELDS:
+            setattr(self, name, int(saved.get(name, 0)))
+
+    def tally(self, status):
+        """resolve_detail 의 status 를 급여 통계에 반영"""
+        if status == 'salary':
+            self.salary += 1
+        elif status == 'nego':
+            self.nego += 1
+        else:
+            self.no_salary += 1
+        if status == 'error':
+            self.sal_err += 1
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+def collect_new_items(conn, posts, date_from, date_to, stats, writer=None):
+    """목록 공고 중 날짜 범위 안의 신규 공고만 [(unique_key, post)] 로 반환.
+    writer 가 주어지면 이미 저장된 공고는 writer.add_seen() 으로 last_seen_at 을 갱신하고,
+    카드 지문이 달라졌으면 제목·마감일 등 표시 필드도 갱신한다 (상세 페이지 방문 없음).
+    """
+    new_items  = []
+    page_keys  = set()
+    seen_ids   = set()
+    known      = fetch_known_cards(conn, {
+        make_unique_key(p['hospital_name'], p['region_sido'], p['register_date'])
+        for p in posts
+    })
+    for post in posts:
+        reg_date = post.get('register_date', '')
+
+        ukey = make_unique_key(
+            post['hospital_name'], post['region_sido'], post['register_date']
+        )
+        row = known.get(ukey)
+        # 같은 unique_key 의 다른 공고(post_id 가 다름)는 건드리지 않음
+        if writer is not None and row is not None and row[0] not in seen_ids \
+                and (not row[1] or not post['post_id'] or row[1] == post['post_id']):
+            seen_ids.add(row[0])
+            fingerprint = card_fingerprint(post)
+            changed     = fingerprint != row[2]
+            if changed and row[2] is not None:
+                stats.changed += 1
+                METRICS.inc('medigate_posts_total', result='changed')
+            writer.add_seen(row[0], post, fingerprint, changed)
+
+        # ── 날짜 범위 필터
+        if date_to and reg_date and reg_date > date_to:
+            stats.out_range += 1
+            METRICS.inc('medigate_posts_total', result='out_range')
+            continue  # 종료일 이후 → 스킵
+        if date_from and reg_date and reg_date < date_from:
+            stats.out_range += 1
+            METRICS.inc('medigate_posts_total', result='out_range')
+            continue  # 시작일 이전 → 스킵
+
+        stats.processed += 1
+
+        if ukey in known or ukey in page_keys:
+            stats.skipped += 1
+            METRICS.inc('medigate_posts_total', result='skipped')
+        else:
+            page_keys.add(ukey)
+            new_items.append((ukey, post))
+    return new_items
+
+
+def fetch_details(driver, pool, urls, limiter=None):
+    """urls 순서대로 상세 결과(dict 또는 Exception).
+    pool 이 없으면 순차 수집 — limiter 가 있으면 그 간격을, 없으면 고정 딜레이를 따른다.
+    """
+    if pool is not None:
+        return pool.fetch_many(urls)
+    results = []
+    for url in urls:
+        try:
+            results.append(extract_detail_info(driver, url, limiter=limiter))
+        except Exception as e:
+            results.append(e)
+        if limiter is None:
+            pause(random.uniform(DETAIL_DELAY_MIN, DETAIL_DELAY_MAX))
+    return results
+
+
+def save_new_items(writer, driver, pool, new_items, stats, limiter=None):
+    """신규 공고 [(unique_key, post)] 상세 수집 → 한 트랜잭션 저장 → 통계 반영
+    ENQUEUE_ONLY 이면 상세 방문 없이 저장 + 상세 수집 큐 등록만 한다.
+    """
+    if ENQUEUE_ONLY:
+        return enqueue_new_items(writer, new_items, stats)
+    details  = fetch_details(driver, pool, [post['url'] for _, post in new_items],
+                             limiter=limiter)
+    statuses = {}
+    for (ukey, post), detail in zip(new_items, details):
+        raw_text, parsed, specialties, status = resolve_detail(
+            post['url'], detail, post_id=post['post_id'],
+            register_date=post.get('register_date'))
+        writer.add_post(post, ukey, raw_text, parsed, specialties)
+        statuses[ukey] = status
+
+    saved_ids = writer.flush()
+    stats.saved   += len(saved_ids)
+    stats.skipped += len(new_items) - len(saved_ids)   # 동시 저장된 중복 / 저장 오류
+    METRICS.inc('medigate_posts_total', len(saved_ids), result='saved')
+    METRICS.inc('medigate_posts_total', len(new_items) - len(saved_ids), result='skipped')
+    for ukey in saved_ids:
+        stats.tally(statuses[ukey])
+    return saved_ids
+
+
+def db_now(conn):
+    """DB 서버 시각 (last_seen_at 과 같은 시계로 비교하기 위해) — ISO 문자열"""
+    cur = conn.cursor()
+    try:
+        cur.execute("SELECT clock_timestamp()")
+        return cur.fetchone()[0].isoformat()
     finally:
         cur.close()
 
 
-def update_specialties(conn, db_id: int, specialties: list):
-    """상세 페이지 초빙과목으로 specialty 교체 (기존 삭제 후 재삽입)."""
+def mark_missed(conn, since, oldest_date, newest_date):
+    """이번 실행(since 이후)에 목록에서 보지 못한 공고의 missed_runs 증가,
+    INACTIVE_AFTER 회 이상이면 is_active=FALSE. 반환: (증가 건수, 비활성 전환 건수)
+
+    목록을 끝까지 훑은 등록일 구간만 대상 — 양 끝 날짜는 일부만 읽었을 수 있어 제외.
+    """
+    if not oldest_date or not newest_date or oldest_date >= newest_date:
+        return 0, 0
     cur = conn.cursor()
     try:
-        cur.execute("DELETE FROM recruit_post_specialties WHERE post_id = %s", (db_id,))
-        for sp in specialties:
-            if sp and len(sp) >= 2:
-                cur.execute(
-                    "INSERT INTO recruit_post_specialties (post_id, specialty) VALUES (%s,%s)",
-                    (db_id, sp)
-                )
+        cur.execute("""
+            UPDATE recruit_posts
+            SET missed_runs = missed_runs + 1,
+                is_active   = (missed_runs + 1 < %s),
+                updated_at  = now()
+            WHERE source = 'medigate' AND is_active
+              AND register_date > %s AND register_date < %s
+              AND (last_seen_at IS NULL OR last_seen_at < %s)
+            RETURNING is_active
+        """, (INACTIVE_AFTER, oldest_date, newest_date, since))
+        rows = cur.fetchall()
         conn.commit()
+        return len(rows), sum(1 for (active,) in rows if not active)
     except Exception as e:
         conn.rollback()
-        log(f"    ⚠ specialty 업데이트 오류 (id={db_id}): {e}")
+        log(f"  ⚠ 미노출 공고 처리 실패: {e}")
+        return 0, 0
     finally:
         cur.close()
 
 
-def save_salary(conn, db_id: int, raw_text, parsed: dict):
-    """급여 파싱 결과를 DB에 저장. salary_fetched=TRUE 항상 설정."""
+def enqueue_new_items(writer, new_items, stats):
+    """신규 공고를 목록 정보만으로 저장하고 detail_fetch_queue 에 등록 (--enqueue-only)"""
+    for ukey, post in new_items:
+        writer.add_post(post, ukey, None, None, None, queue=True)
+    saved_ids = writer.flush()
+    stats.saved   += len(saved_ids)
+    stats.queued  += len(saved_ids)
+    stats.skipped += len(new_items) - len(saved_ids)
+    METRICS.inc('medigate_posts_total', len(saved_ids), result='queued')
+    METRICS.inc('medigate_posts_total', len(new_items) - len(saved_ids), result='skipped')
+    return saved_ids
+
+
+def load_post_id_watermark(conn):
+    """이미 저장된 메디게이트 post_id 의 최댓값 (없으면 None)"""
+    cur = conn.cursor()
+    try:
+        cur.execute(r"""
+            SELECT MAX(post_id::bigint) FROM recruit_posts
+            WHERE  source = 'medigate' AND post_id ~ '^\d+$'
+        """)
+        row = cur.fetchone()
+        return row[0] if row else None
+    finally:
+        cur.close()
+
+
+def page_register_dates(driver, page_no, limiter=None):
+    """목록 페이지 하나를 열어 등록일 목록 반환 (페이지 탐색용)
+    limiter 가 주어지면 수집 루프처럼 요청 전 limiter.acquire() (--adaptive 속도 제어 반영)
+    """
+    if limiter is not None:
+        limiter.acquire()
+        load_page(driver, page_no)
+    else:
+        load_page(driver, page_no)
+        pause(random.uniform(DELAY_MIN, DELAY_MAX))
+    return [p['register_date'] for p in extract_posts_from_driver(driver)
+            if p.get('register_date')]
+
+
+def find_start_page(driver, date_to, last_page, limiter=None):
+    """등록일 내림차순 목록에서 date_to 이하 공고가 처음 나오는 페이지를 이분 탐색.
+    조건 '페이지의 가장 오래된 등록일 <= date_to' 는 페이지 번호에 대해 단조이므로
+    과거 구간 backfill 도 log2(페이지 수) 번의 목록 요청으로 시작 위치를 찾는다.
+    """
+    lo, hi = 1, last_page
+    probes = 0
+    while lo < hi:
+        mid   = (lo + hi) // 2
+        dates = page_register_dates(driver, mid, limiter)
+        probes += 1
+        # 빈 페이지(마지막 페이지 이후)도 '충분히 과거' 쪽으로 취급
+        if not dates or min(dates) <= date_to:
+            hi = mid
+        else:
+            lo = mid + 1
+    log(f"    [탐색] --to {date_to} 시작 페이지 = {lo} (목록 {probes}회 조회)")
+    return lo
+
+
+def fetch_unfetched(conn, date_lo, date_hi):
+    """저장은 됐지만 급여 수집이 끝나지 않은 공고 (id, url, register_date) — 체크포인트 날짜 범위 내"""
     cur = conn.cursor()
     try:
         cur.execute("""
-            UPDATE recruit_posts SET
-                salary_raw     = %s,
-                salary_type    = %s,
-                salary_unit    = %s,
-                salary_min     = %s,
-                salary_max     = %s,
-                salary_net_min = %s,
-                salary_net_max = %s,
-                salary_fetched = TRUE
-            WHERE id = %s
-        """, (
-            raw_text,
-            parsed.get('salary_type'),
-            parsed.get('salary_unit'),
-            parsed.get('salary_min'),
-            parsed.get('salary_max'),
-            parsed.get('salary_net_min'),
-            parsed.get('salary_net_max'),
-            db_id,
-        ))
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        log(f"    ⚠ 급여 저장 오류 id={db_id}: {e}")
+            SELECT id, url, register_date FROM recruit_posts
+            WHERE  source = 'medigate'
+              AND  url <> ''
+              AND  (salary_fetched IS NULL OR salary_fetched = FALSE)
+              AND  register_date >= %s AND register_date <= %s
+            ORDER  BY id
+        """, (date_lo, date_hi))
+        return cur.fetchall()
     finally:
         cur.close()
 
 
+# ============================================================
+# 체크포인트 (--resume)
+# ============================================================
+def load_checkpoint():
+    try:
+        with open(CHECKPOINT_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log(f"  [경고] 체크포인트 읽기 실패 → 처음부터 수집: {e}")
+        return None
+
+
+def save_checkpoint(state):
+    """페이지 처리 단위로 호출. 임시 파일에 쓴 뒤 교체해 중간에 죽어도 파일이 깨지지 않게 한다."""
+    state = dict(state, updated_at=datetime.now().isoformat(timespec='seconds'))
+    tmp = CHECKPOINT_FILE + '.tmp'
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, CHECKPOINT_FILE)
+    except Exception as e:
+        log(f"    ⚠ 체크포인트 저장 실패: {e}")
+
+
+def clear_checkpoint():
+    try:
+        os.remove(CHECKPOINT_FILE)
+    except FileNotFoundError:
+        pass
+
+
+# ============================================================
+# 보관 HTML 재파싱 (--reparse-archive)
+# ============================================================
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def reparse_archive(conn, archive):
+    """보관된 HTML 로 DB 재구성 (네트워크 사용 안 함).
+
+    · 목록 스냅샷(오래된 순 → 최신 값이 남음) → url 이 같은 공고의 표시 필드 갱신
+      (register_date 는 연도 추정이 실행 시점 기준이라 유지, unique_key 는 바뀐 병원명·시도와
+       저장된 등록일로 다시 계산 — 다른 공고와 키가 겹치면 그 공고는 갱신하지 않음)
+    · URL 별 최신 상세 페이지 → 급여 컬럼 + 초빙과목 재계산 (BatchWriter.add_salary)
+      상세 파싱 오류·급여 행 없는 페이지는 기존 급여 값을 지우지 않도록 건너뜀
+    """
+    t0 = time.time()
+
+    # ── 목록 페이지 → 공고 필드
+    latest_posts = {}
+    snapshots = archive.snapshots('list')
+    for _, _, sha in snapshots:
+        for post in extract_posts_from_html(archive.get(sha)):
+            if post.get('url'):
+                latest_posts[post['url']] = post
+    log(f"  목록 스냅샷 {len(snapshots)}개 → 공고 {len(latest_posts)}건")
+
+    n_posts = n_conflict = 0
+    cur = conn.cursor()
+    for chunk in _chunks(list(latest_posts.values()), REPARSE_CHUNK):
+        cur.execute("""
+            SELECT url, register_date FROM recruit_posts
+            WHERE source = 'medigate' AND url = ANY(%s)
+        """, ([post['url'] for post in chunk],))
+        stored = dict(cur.fetchall())
+        rows, ukeys = [], set()
+        for post in chunk:
+            if post['url'] not in stored:
+                continue
+            ukey = make_unique_key(post['hospital_name'], post['region_sido'], stored[post['url']])
+            if ukey in ukeys:   # 같은 청크의 다른 공고와 키가 겹침
+                n_conflict += 1
+                continue
+            ukeys.add(ukey)
+            rows.append((post, ukey))
+        if not rows:
+            continue
+        updated = execute_values(cur, """
+            UPDATE recruit_posts AS rp SET
+                post_id         = v.post_id,
+                unique_key      = v.unique_key,
+                hospital_name   = v.hospital_name,
+                hospital_type   = v.hospital_type,
+                title           = v.title,
+                employment_type = v.employment_type,
+                region          = v.region,
+                region_sido     = v.region_sido,
+                deadline        = v.deadline,
+                updated_at      = now()
+            FROM (VALUES %s) AS v(url, post_id, unique_key, hospital_name, hospital_type, title,
+                                  employment_type, region, region_sido, deadline)
+            WHERE rp.source = 'medigate' AND rp.url = v.url
+              AND NOT EXISTS (SELECT 1 FROM recruit_posts o
+                              WHERE o.source = 'medigate' AND o.unique_key = v.unique_key
+                                AND o.id <> rp.id)
+            RETURNING rp.id
+        """, [(
+            post['url'],
+            post['post_id']         or '',
+            ukey,
+            post['hospital_name']   or '',
+            post['hospital_type']   or '',
+            post['title']           or '',
+            post['employment_type'] or '',
+            post['region']          or '',
+            post['region_sido']     or '',
+            post['deadline']        or '',
+        ) for post, ukey in rows], page_size=len(rows), fetch=True)
+        conn.commit()
+        n_posts    += len(updated)
+        n_conflict += len(rows) - len(updated)
+    cur.close()
+    log(f"  공고 필드 갱신: {n_posts}건"
+        + (f"  (다른 공고와 unique_key 가 겹쳐 유지 {n_conflict}건)" if n_conflict else ""))
+
+    # ── 상세 페이지 → 급여 + 초빙과목
+    details = archive.latest('detail')
+    writer  = BatchWriter(conn)
+    stats   = CrawlStats()
+    n_match = 0
+    for chunk in _chunks(details, REPARSE_CHUNK):
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT url, id, register_date FROM recruit_posts
+            WHERE source = 'medigate' AND url = ANY(%s)
+        """, ([url for url, _, _ in chunk],))
+        ids = {url: (db_id, register_date) for url, db_id, register_date in cur.fetchall()}
+        cur.close()
+        for url, _, sha in chunk:
+            if url not in ids:
+                continue
+            db_id, register_date = ids[url]
+            try:
+                soup   = BeautifulSoup(archive.get(sha), 'html.parser')
+                detail = _detail_from_rows(_detail_rows_from_soup(soup))
+            except Exception as e:
+                detail = e
+            raw_text, parsed, specialties, status = resolve_detail(
+                f"id={db_id}", detail, register_date=register_date)
+            stats.tally(status)
+            n_match += 1
+            if status == 'error' or not raw_text:
+                continue   # 파싱 실패·급여 행 없음 → 저장된 급여 값 유지
+            writer.add_salary(db_id, raw_text, parsed, specialties)
+        writer.flush()
+    log(f"  상세 페이지 {len(details)}건 중 DB 일치 {n_match}건 급여 재계산 "
+        f"(급여 {stats.salary} / 협의 {stats.nego} / 없음 {stats.no_salary} / 오류 {stats.sal_err})")
+    log(f"  소요 시간: {time.time() - t0:.1f}초")
+
+
 # ============================================================
 # 메인
 # ============================================================
 def main():
+    global EXTRACT_MODE, ARCHIVE, LOG_PATH, METRICS_FILE, LEAN_BROWSER, RATE_CONTROL, ENQUEUE_ONLY
     args = parse_args()
+    EXTRACT_MODE = args.extract_mode
+    LEAN_BROWSER = args.lean
+    ENQUEUE_ONLY = args.enqueue_only
+    session_store.DISABLED = args.fresh_login
+    parse_cache.DISABLED   = args.no_parse_cache
+    if args.log_file:
+        LOG_PATH = args.log_file
+    if args.base_url:
+        set_base_url(args.base_url)
+    METRICS_FILE = args.metrics_file
     date_from = validate_date(args.date_from)
     date_to   = validate_date(args.date_to)
 
     log("=" * 62)
     log("  Phase 4: 메디게이트 전체 공고 수집 & DB 저장 (급여 통합)")
     log(f"  시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    log(f"  run_id: {LOGGER.run_id}  (로그: {LOG_PATH})")
     log("=" * 62)
 
     # ── DB 연결 & 현황 출력
     log("\n[1] PostgreSQL 연결...")
     try:
         conn = psycopg2.connect(**DB_CONFIG)
-        existing_keys = load_existing_keys(conn)
-        log(f"    기존 저장 건수: {len(existing_keys):,}건")
     except Exception as e:
-        log(f"    DB 연결 실패: {e}")
+        log(f"    DB 연결 실패: {e}", level='ERROR')
+        close_log()
         sys.exit(1)
 
     # DB 현황 항상 출력
@@ -642,11 +2243,47 @@ def main():
     # --info 옵션이면 여기서 종료
     if args.info:
         conn.close()
-        LOG_FILE.close()
+        close_log()
         return
 
+    if args.archive or args.reparse_archive:
+        ARCHIVE = PageArchive(args.archive or ARCHIVE_DIR)
+        n_rows, n_objects, n_bytes = ARCHIVE.summary()
+        log(f"  [보관소] {ARCHIVE.root}: 스냅샷 {n_rows}개 / 고유 본문 {n_objects}개 "
+            f"/ 원본 {n_bytes / 1e6:.1f}MB")
+
+    # --reparse-archive: 보관된 HTML 만으로 DB 재구성 후 종료
+    if args.reparse_archive:
+        log("\n[보관 HTML 재파싱]")
+        parse_cache.attach(DB_CONFIG, log=log)
+        reparse_archive(conn, ARCHIVE)
+        parse_cache.detach(log=log)
+        ARCHIVE.close()
+        conn.close()
+        close_log()
+        return
+
+    # 중복 방지는 DB UNIQUE 인덱스 + ON CONFLICT 로 처리
+    ensure_unique_index(conn)
+    ensure_card_columns(conn)
+    if ENQUEUE_ONLY:
+        detail_queue.ensure_queue_table(conn)
+    else:
+        parse_cache.attach(DB_CONFIG, log=log)   # 상세 급여 파싱 시 문구 캐시
+
+    # --resume: 체크포인트의 날짜 범위/페이지/통계를 그대로 이어받음
+    checkpoint = load_checkpoint() if args.resume else None
+    if args.resume and checkpoint is None:
+        log("  [resume] 체크포인트 없음 → 처음부터 수집")
+    if checkpoint:
+        date_from = checkpoint.get('date_from')
+        date_to   = checkpoint.get('date_to')
+        log(f"  [resume] {checkpoint.get('updated_at')} 체크포인트: "
+            f"페이지 {checkpoint.get('page', 0)}까지 완료, "
+            f"상세 대기 {len(checkpoint.get('pending', []))}건")
+
     # --from 미지정 시 DB 최신 날짜를 자동으로 시작일로 사용 (1일 중복)
-    if date_from is None:
+    if date_from is None and checkpoint is None:
         try:
             cur = conn.cursor()
             cur.execute("""
@@ -662,6 +2299,17 @@ def main():
         except Exception as e:
             log(f"  [경고] 자동 시작일 조회 실패: {e}")
 
+    # 증분 수집(--from 미지정)은 저장된 최대 post_id 를 워터마크로 사용
+    watermark = None
+    if args.date_from is None and checkpoint is None and not args.no_watermark:
+        try:
+            watermark = load_post_id_watermark(conn)
+        except Exception as e:
+            conn.rollback()
+            log(f"  [경고] post_id 워터마크 조회 실패: {e}")
+        if watermark is not None:
+            log(f"  [자동] post_id 워터마크 {watermark} → 새 공고가 없는 페이지에서 종료")
+
     # 수집 날짜 범위 출력
     log("  수집 날짜 범위:")
     log(f"    시작일 : {date_from if date_from else '제한 없음 (전체)'}")
@@ -670,23 +2318,99 @@ def main():
 
     start_time = datetime.now()
 
+    if args.metrics_port is not None:
+        try:
+            port = METRICS.start_http_server(args.metrics_port)
+            log(f"  [지표] http://127.0.0.1:{port}/metrics")
+        except Exception as e:
+            log(f"  [경고] 지표 엔드포인트 시작 실패: {e}")
+
     # ── 브라우저 & 로그인
     log("[2] Chrome 브라우저 시작...")
     driver = setup_driver()
 
-    if not login(driver):
-        log("로그인 실패. 종료합니다.")
+    if not open_session(driver):
+        log("로그인 실패. 종료합니다.", level='ERROR')
         driver.quit()
         conn.close()
+        close_log()
         sys.exit(1)
 
+    # ── --adaptive: 목록+상세 요청을 하나의 AIMD 속도로 배분 (고정 딜레이 대신)
+    limiter = None
+    if args.adaptive:
+        # 시작 속도 = --detail-rate 또는 기존 상세 딜레이 평균에 해당하는 속도
+        start_rate   = args.detail_rate or (120.0 / (DETAIL_DELAY_MIN + DETAIL_DELAY_MAX)
+                                            if DETAIL_DELAY_MAX else args.rate_ceiling)
+        RATE_CONTROL = AimdRate(start_rate, floor=args.rate_floor, ceiling=args.rate_ceiling)
+        limiter      = RateLimiter(controller=RATE_CONTROL)
+        log(f"    요청 속도 자동 조정: 분당 {RATE_CONTROL.rate:.1f}건에서 시작 "
+            f"(범위 {RATE_CONTROL.floor:g}~{RATE_CONTROL.ceiling:g})")
+
+    # ── 상세 수집 병렬 워커 (--detail-workers 2 이상일 때만)
+    pool = None
+    if args.detail_workers > 1 and not ENQUEUE_ONLY:
+        pool_limiter = limiter or RateLimiter(rate_per_min=args.detail_rate)
+        rate_desc = ("자동 조정" if limiter is not None
+                     else f"{args.detail_rate:g}건/분" if args.detail_rate
+                     else f"요청 간격 {DETAIL_DELAY_MIN}~{DETAIL_DELAY_MAX}초")
+        log(f"    상세 수집 병렬 워커 {args.detail_workers}개 시작 (전역 {rate_desc})...")
+        try:
+            pool = DetailFetchPool(args.detail_workers, pool_limiter)
+        except Exception as e:
+            log(f"    ⚠ 병렬 워커 준비 실패 → 순차 수집으로 진행: {e}")
+
+    writer = BatchWriter(conn)
+    stats  = CrawlStats(**(checkpoint or {}).get('stats', {}))
+
+    # 체크포인트 상태 (페이지 처리마다 저장)
+    state = {
+        'date_from':   date_from,
+        'date_to':     date_to,
+        'page':        0,
+        'newest_date': None,
+        'oldest_date': None,
+        'pending':     [],
+        'stats':       stats.as_dict(),
+        'started_at':  db_now(conn),   # 이 시각 이후 last_seen_at = 이번 실행에서 본 공고
+    }
+    start_page = 1
+    if checkpoint:
+        state.update({k: checkpoint.get(k)
+                      for k in ('page', 'newest_date', 'oldest_date', 'started_at')})
+        state['started_at'] = state['started_at'] or db_now(conn)
+        state['page'] = state['page'] or 0
+        start_page    = state['page'] + 1
+
+        # ── 중단 시점에 상세 수집 대기 중이던 공고 먼저 처리 (1페이지 로드 전에)
+        pending = [(ukey, post) for ukey, post in checkpoint.get('pending', [])]
+        if pending:
+            log(f"\n[resume] 미완료 상세 수집 {len(pending)}건 처리...")
+            save_new_items(writer, driver, pool, pending, stats, limiter=limiter)
+
+        # ── 저장됐지만 salary_fetched 가 아닌 공고 (체크포인트 날짜 범위, 큐 모드는 워커 몫)
+        if state['oldest_date'] and state['newest_date'] and not ENQUEUE_ONLY:
+            rows = fetch_unfetched(conn, state['oldest_date'], state['newest_date'])
+            if rows:
+                log(f"[resume] 급여 미수집 공고 {len(rows)}건 상세 수집...")
+                details = fetch_details(driver, pool, [url for _, url, _ in rows], limiter=limiter)
+                for (db_id, url, register_date), detail in zip(rows, details):
+                    raw_text, parsed, specialties, _ = resolve_detail(
+                        f"id={db_id}", detail, register_date=register_date)
+                    writer.add_salary(db_id, raw_text, parsed, specialties)
+                writer.flush()
+
+        state['pending'] = []
+        state['stats']   = stats.as_dict()
+        save_checkpoint(state)
+
     # ── 1페이지 로드 & 총 페이지 수 파악
     log(f"\n[3] 1페이지 로드...")
     load_page(driver, 1)
-    soup1 = BeautifulSoup(driver.page_source, 'html.parser')
-    last_page = get_total_pages(soup1)
+    html1 = driver.page_source
+    last_page = get_total_pages(BeautifulSoup(html1, 'html.parser'))
 
-    first_posts = extract_posts_from_soup(soup1)
+    first_posts = extract_posts_from_html(html1)
     log(f"    1페이지 파싱: {len(first_posts)}건")
     if first_posts:
         p = first_posts[0]
@@ -698,40 +2422,52 @@ def main():
             f.write(driver.page_source)
         log("    debug_page.html 저장 완료")
         driver.quit()
+        if pool is not None:
+            pool.close()
         conn.close()
         sys.exit(1)
 
+    # ── --to 지정 과거 구간은 시작 페이지를 이분 탐색으로 바로 찾음
+    if date_to and start_page == 1:
+        dates1 = [p['register_date'] for p in first_posts if p.get('register_date')]
+        if dates1 and min(dates1) > date_to:
+            start_page = find_start_page(driver, date_to, last_page, limiter=limiter)
+            state['page'] = start_page - 1
+
     # ── 수집 루프
-    log(f"\n[4] 수집 시작! (총 예상 페이지: {last_page})\n"
-        f"    목록 딜레이 {DELAY_MIN}~{DELAY_MAX}초 "
-        f"/ 상세(급여) 딜레이 {DETAIL_DELAY_MIN}~{DETAIL_DELAY_MAX}초\n")
-
-    total_saved     = 0
-    total_skipped   = 0
-    total_out_range = 0   # 날짜 범위 밖 스킵
-    total_processed = 0
-    cnt_salary      = 0
-    cnt_nego        = 0
-    cnt_no_salary   = 0
-    cnt_sal_err     = 0
+    log(f"\n[4] 수집 시작! (총 예상 페이지: {last_page}"
+        f"{f', {start_page}페이지부터' if start_page > 1 else ''})\n"
+        + (f"    요청 속도 자동 조정 (분당 {RATE_CONTROL.rate:.1f}건부터)\n" if RATE_CONTROL else
+           f"    목록 딜레이 {DELAY_MIN}~{DELAY_MAX}초 "
+           f"/ 상세(급여) 딜레이 {DETAIL_DELAY_MIN}~{DETAIL_DELAY_MAX}초\n"))
+
     consec_empty    = 0
     stop_crawl      = False
+    pages_read      = 0
+    crawl_t0        = time.monotonic()
 
     # 날짜 범위 이전 페이지가 연속으로 나오면 종료하기 위한 카운터
     pages_past_range = 0
 
-    for page in range(1, last_page + 1):
+    # 재개 시 그 사이 올라온 신규 공고만큼 목록이 뒤로 밀리므로 이미 본 공고가
+    # 다시 나올 뿐 누락은 없다 (중복은 unique_key 로 스킵).
+    for page in range(start_page, last_page + 1):
         if stop_crawl:
             break
 
         if page > 1:
-            load_page(driver, page)
-            time.sleep(random.uniform(DELAY_MIN, DELAY_MAX))
+            if limiter is not None:
+                limiter.acquire()
+                load_page(driver, page)
+            else:
+                load_page(driver, page)
+                pause(random.uniform(DELAY_MIN, DELAY_MAX))
 
-        soup  = BeautifulSoup(driver.page_source, 'html.parser')
-        posts = extract_posts_from_soup(soup)
+        posts = extract_posts_from_driver(driver)
+        pages_read += 1
 
         if not posts:
+            METRICS.inc('medigate_parse_failures_total', kind='list_empty')
             consec_empty += 1
             if consec_empty >= 3:
                 log(f"  → 3페이지 연속 공고 없음 (페이지 {page}). 수집 완료 판단.")
@@ -740,13 +2476,21 @@ def main():
         else:
             consec_empty = 0
 
+        # ── 워터마크 조기 종료: 이 페이지에 저장된 최대 post_id 보다 큰 공고가 없으면 종료
+        # (재등록된 과거 공고가 위로 올라올 수 있어 '첫 번째 기존 id' 가 아닌 페이지 단위로 판단)
+        if watermark is not None:
+            ids_on_page = [int(p['post_id']) for p in posts if p['post_id'].isdigit()]
+            if ids_on_page and max(ids_on_page) <= watermark:
+                log(f"  → 페이지 {page}: 워터마크(post_id {watermark}) 이후 신규 공고 없음. 종료합니다.")
+                break
+
         # ── 이 페이지의 날짜 범위 조기 종료 판단
         # 공고가 모두 date_from 이전이면 더 이상 진행 불필요
+        dates_on_page = [
+            p['register_date'] for p in posts
+            if p.get('register_date')
+        ]
         if date_from:
-            dates_on_page = [
-                p['register_date'] for p in posts
-                if p.get('register_date')
-            ]
             if dates_on_page and max(dates_on_page) < date_from:
                 pages_past_range += 1
                 if pages_past_range >= 2:
@@ -757,84 +2501,104 @@ def main():
             else:
                 pages_past_range = 0
 
-        for post in posts:
-            reg_date = post.get('register_date', '')
-
-            # ── 날짜 범위 필터
-            if date_to and reg_date and reg_date > date_to:
-                total_out_range += 1
-                continue  # 종료일 이후 → 스킵
-            if date_from and reg_date and reg_date < date_from:
-                total_out_range += 1
-                continue  # 시작일 이전 → 스킵
-
-            total_processed += 1
+        # ── 1단계: 신규 공고만 상세 수집 대상으로 모음
+        prev_processed = stats.processed
+        new_items      = collect_new_items(conn, posts, date_from, date_to, stats, writer)
+
+        # 상세 수집 전에 대기 목록을 기록 → 중간에 죽어도 --resume 으로 이어서 처리
+        if dates_on_page:
+            state['newest_date'] = max([d for d in (state['newest_date'],) if d] + dates_on_page)
+            state['oldest_date'] = min([d for d in (state['oldest_date'],) if d] + dates_on_page)
+        # (stats 는 마지막 완료 페이지 기준 유지 — 재개 시 이 페이지를 다시 읽으므로)
+        state['pending'] = new_items
+        save_checkpoint(state)
+
+        # ── 2~3단계: 신규 공고 상세 수집 → 페이지 단위 일괄 저장 (한 트랜잭션)
+        save_new_items(writer, driver, pool, new_items, stats, limiter=limiter)
+
+        state['page']    = page
+        state['pending'] = []
+        state['stats']   = stats.as_dict()
+        save_checkpoint(state)
+
+        if stats.processed // PROGRESS_INTERVAL > prev_processed // PROGRESS_INTERVAL:
+            elapsed = max(1, (datetime.now() - start_time).seconds)
+            speed   = stats.processed / elapsed * 60
+            log(
+                f"  [{stats.processed:>5}건 처리] "
+                f"신규 {stats.saved}건 (급여 {stats.salary} / 협의 {stats.nego} / 없음 {stats.no_salary}) "
+                f"| 중복 {stats.skipped}건 | {speed:.0f}건/분"
+            )
 
-            new_id = save_to_db(conn, post, existing_keys)
+        log(f"    [대기 p{page}] {WAIT_STATS.page_summary()}", page=page)
+        export_metrics()
 
-            if new_id is None:
-                total_skipped += 1
-            else:
-                # 신규 — 상세 페이지 방문하여 급여 + 초빙과목 수집
-                total_saved += 1
-                raw_text          = None
-                parsed            = {}
-                detail_specialties = []
-                try:
-                    detail             = extract_detail_info(driver, post['url'])
-                    raw_text           = detail.get('salary')
-                    parsed             = parse_salary(raw_text) if raw_text else {}
-                    detail_specialties = detail.get('specialties', [])
-                except Exception as e:
-                    log(f"    ⚠ 상세 수집 오류 (id={new_id}): {e}")
-                    cnt_sal_err += 1
-
-                save_salary(conn, new_id, raw_text, parsed)
-                if detail_specialties:
-                    update_specialties(conn, new_id, detail_specialties)
-
-                if parsed.get('salary_net_min') is not None:
-                    cnt_salary += 1
-                elif raw_text and parsed.get('salary_type') is None:
-                    cnt_nego += 1
-                else:
-                    cnt_no_salary += 1
+        if page % 10 == 0 or page == 1:
+            log(f"  [페이지 {page}/{last_page}] 이 페이지 {len(posts)}건 | "
+                  f"누적 {stats.processed}건 (신규 {stats.saved} / 중복 {stats.skipped} "
+                  f"/ 범위외 {stats.out_range})", page=page)
 
-                time.sleep(random.uniform(DETAIL_DELAY_MIN, DETAIL_DELAY_MAX))
+    crawl_seconds = time.monotonic() - crawl_t0
 
-            if total_processed % PROGRESS_INTERVAL == 0:
-                elapsed = max(1, (datetime.now() - start_time).seconds)
-                speed   = total_processed / elapsed * 60
-                log(
-                    f"  [{total_processed:>5}건 처리] "
-                    f"신규 {total_saved}건 (급여 {cnt_salary} / 협의 {cnt_nego} / 없음 {cnt_no_salary}) "
-                    f"| 중복 {total_skipped}건 | {speed:.0f}건/분"
-                )
+    # ── 읽은 등록일 구간에서 이번에 보이지 않은 공고 → missed_runs / is_active
+    n_missed, n_inactive = mark_missed(conn, state['started_at'],
+                                       state['oldest_date'], state['newest_date'])
 
-        if page % 10 == 0 or page == 1:
-            log(f"  [페이지 {page}/{last_page}] 이 페이지 {len(posts)}건 | "
-                  f"누적 {total_processed}건 (신규 {total_saved} / 중복 {total_skipped} "
-                  f"/ 범위외 {total_out_range})")
+    # 정상 종료 → 체크포인트 삭제
+    clear_checkpoint()
 
     # ── 최종 결과
     elapsed_total = max(1, (datetime.now() - start_time).seconds)
     log("\n" + "=" * 62)
     log("  수집 완료!")
     log(f"  날짜 범위    : {date_from or '전체'} ~ {date_to or '전체'}")
-    log(f"  총 처리 건수 : {total_processed:,}건  (범위 외 스킵: {total_out_range}건)")
-    log(f"  신규 저장    : {total_saved:,}건")
-    log(f"    ├ 급여 파싱 성공  : {cnt_salary:,}건")
-    log(f"    ├ 협의/미정       : {cnt_nego:,}건")
-    log(f"    ├ 급여 행 없음    : {cnt_no_salary:,}건")
-    log(f"    └ 급여 수집 오류  : {cnt_sal_err:,}건")
-    log(f"  중복 스킵    : {total_skipped:,}건")
+    log(f"  총 처리 건수 : {stats.processed:,}건  (범위 외 스킵: {stats.out_range}건)")
+    log(f"  신규 저장    : {stats.saved:,}건"
+        + (f"  (상세 수집 큐 등록 {stats.queued:,}건 → salary_backfill.py 워커)" if ENQUEUE_ONLY else ""))
+    log(f"    ├ 급여 파싱 성공  : {stats.salary:,}건")
+    log(f"    ├ 협의/미정       : {stats.nego:,}건")
+    log(f"    ├ 급여 행 없음    : {stats.no_salary:,}건")
+    log(f"    └ 급여 수집 오류  : {stats.sal_err:,}건")
+    log(f"  중복 스킵    : {stats.skipped:,}건  (카드 변경 갱신 {stats.changed:,}건)")
+    log(f"  목록 미노출  : {n_missed:,}건  (→ 비활성 전환 {n_inactive:,}건, {INACTIVE_AFTER}회 연속 기준)")
     log(f"  소요 시간    : {elapsed_total // 60}분 {elapsed_total % 60}초")
+    log(f"  조건 대기    : {WAIT_STATS.total_summary()}")
+    log(f"  지연 p50/p95 : {latency_summary()}")
+    log(f"  페이지 용량  : {page_weight_summary()}")
+    if RATE_CONTROL is not None:
+        log(f"  요청 속도    : {RATE_CONTROL.summary()}")
+    parse_cache.detach(log=log)
     log(f"  종료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     log("=" * 62)
 
     driver.quit()
+    if pool is not None:
+        pool.close()
+    if ARCHIVE is not None:
+        n_rows, n_objects, _ = ARCHIVE.summary()
+        log(f"  원본 보관    : 스냅샷 {n_rows:,}개 / 고유 본문 {n_objects:,}개 ({ARCHIVE.root})")
+        ARCHIVE.close()
+    if args.stats_json:
+        with open(args.stats_json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'base_url':      BASE_URL,
+                'pages':         pages_read,
+                'crawl_seconds': round(crawl_seconds, 3),
+                'total_seconds': elapsed_total,
+                'stats':         stats.as_dict(),
+                'timings':       TIMINGS.as_dict(),
+            }, f, ensure_ascii=False, indent=2)
+    export_metrics()
+    if args.metrics_json:
+        try:
+            METRICS.write_json(args.metrics_json, stats=stats.as_dict(),
+                               date_from=date_from, date_to=date_to, pages=pages_read,
+                               rate_history=RATE_CONTROL.history if RATE_CONTROL else None)
+        except Exception as e:
+            log(f"  [경고] 실행 요약 저장 실패: {e}")
+    METRICS.stop_http_server()
     conn.close()
-    LOG_FILE.close()
+    close_log()
 
 
 if __name__ == '__main__':
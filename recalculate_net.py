@@ -6,25 +6,41 @@ recalculate_net.py — salary_net_min / salary_net_max 재계산
 변경 정책:
   · Net  공고 : 공고 기재 Net 그대로 저장 (퇴직금 미합산)
   · Gross 공고 : 세후 실수령 + Gross ÷ 12  (기존과 동일)
+  · 세율 규칙 : 공고 등록일(register_date) 연도의 규칙 (salary_calculator.TAX_RULES,
+                해당 연도가 없으면 직전 연도 규칙 / 등록일이 없으면 DEFAULT_TAX_YEAR —
+                크롤러 · backfill 과 같은 규칙)
+                → 새 연도 규칙을 추가해도 이전 연도 공고 금액은 바뀌지 않음
+  · 소득세 방식 : salary_calculator.WITHHOLDING_TABLE (크롤러 · backfill 과 같은 설정)
+                  True 면 국세청 간이세액표(withholding_table.py) 기준 실수령액
+                  → 설정을 바꾼 뒤 이 스크립트로 전체를 다시 맞춤
 
 재크롤링 없이 DB 에 저장된 salary_min / salary_max / salary_type /
 salary_unit 값만으로 salary_net_min · salary_net_max 를 업데이트합니다.
+전체 행을 NumPy 배열로 한 번에 계산하고 값이 바뀐 행만 일괄 UPDATE 합니다.
 
 실행:
     python recalculate_net.py
 """
 
+import argparse
 import sys
+
+import numpy as np
 import psycopg2
-from salary_calculator import calc_net_with_retirement
+from psycopg2.extras import execute_values
 
-DB_CONFIG = {
-    'host': 'localhost', 'port': 5432,
-    'dbname': 'medigate', 'user': 'postgres', 'password': 'postgres',
-}
+import salary_calculator
+from db_config import DB_CONFIG
+from salary_calculator import calc_net_with_retirement_array, tax_rule_year
+UPDATE_PAGE = 2000   # execute_values 한 번에 보내는 행 수
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description='salary_net_min / salary_net_max 재계산 '
+                    '(소득세 방식은 salary_calculator.WITHHOLDING_TABLE)')
+    parser.parse_args()
+
     try:
         conn = psycopg2.connect(**DB_CONFIG)
     except Exception as e:
@@ -35,7 +51,10 @@ def main():
 
     # 급여 파싱 완료 + 숫자가 있는 공고만 대상
     cur.execute("""
-        SELECT id, salary_type, salary_unit, salary_min, salary_max
+        SELECT id, salary_type, salary_unit, salary_min, salary_max,
+               salary_net_min, salary_net_max,
+               -- tax_year_of 와 같은 규칙 (앞 공백 허용, 못 읽으면 NULL → DEFAULT_TAX_YEAR)
+               SUBSTRING(register_date FROM '^[[:space:]]*([0-9]{4})')::int AS tax_year
         FROM   recruit_posts
         WHERE  salary_type IS NOT NULL
           AND  salary_min  IS NOT NULL
@@ -44,58 +63,65 @@ def main():
     rows = cur.fetchall()
     total = len(rows)
     print(f"재계산 대상: {total:,}건\n")
-
-    updated = skipped = errors = 0
-
-    for db_id, s_type, s_unit, s_min, s_max in rows:
-        s_max = s_max if s_max is not None else s_min
-
-        # 연봉 → 월급 환산 (만원 단위 유지)
-        if s_unit == 'annual':
-            m_min = s_min / 12.0
-            m_max = s_max / 12.0
-        else:
-            m_min = float(s_min)
-            m_max = float(s_max)
-
-        try:
-            if s_type == 'net':
-                # 공고 기재 Net 그대로 (만원)
-                net_min = round(m_min)
-                net_max = round(m_max)
-
-            elif s_type == 'gross':
-                # 세후 실수령 + Gross/12 (원 → 만원 변환)
-                net_min = round(
-                    calc_net_with_retirement('gross', int(m_min * 10_000)) / 10_000
-                )
-                net_max = round(
-                    calc_net_with_retirement('gross', int(m_max * 10_000)) / 10_000
-                )
-
-            else:
-                skipped += 1
-                continue
-
-        except Exception as e:
-            print(f"  [오류] id={db_id}: {e}")
-            errors += 1
-            continue
-
-        cur.execute(
-            "UPDATE recruit_posts SET salary_net_min = %s, salary_net_max = %s WHERE id = %s",
-            (net_min, net_max, db_id),
-        )
-        updated += 1
-
+    if not rows:
+        conn.close()
+        return
+
+    ids, s_type, s_unit, s_min, s_max, old_min, old_max, years = zip(*rows)
+    ids    = np.array(ids, dtype=np.int64)
+    s_type = np.array(s_type, dtype=object)
+    s_min  = np.array(s_min, dtype=float)
+    s_max  = np.array([mx if mx is not None else mn for mn, mx in zip(s_min, s_max)], dtype=float)
+    years  = np.array(years, dtype=float)   # None → NaN → DEFAULT_TAX_YEAR 규칙
+
+    # 연봉 → 월급 환산 (만원 단위 유지)
+    annual = np.array(s_unit, dtype=object) == 'annual'
+    m_min  = np.where(annual, s_min / 12.0, s_min)
+    m_max  = np.where(annual, s_max / 12.0, s_max)
+
+    # net / gross 외 (salary_type 불명확) 는 건너뜀
+    valid   = np.isin(s_type, ('net', 'gross'))
+    skipped = int((~valid).sum())
+
+    # Net: 기재값 그대로 / Gross: 실수령 + Gross/12 (원 → 만원 변환)
+    is_net  = s_type == 'net'
+    won_min = (m_min * 10_000).astype(np.int64)
+    won_max = (m_max * 10_000).astype(np.int64)
+    gross_t = np.where(valid, s_type, 'net').astype(str)
+    net_min = np.where(is_net, np.round(m_min),
+                       np.round(calc_net_with_retirement_array(gross_t, won_min, years) / 10_000))
+    net_max = np.where(is_net, np.round(m_max),
+                       np.round(calc_net_with_retirement_array(gross_t, won_max, years) / 10_000))
+    net_min = net_min.astype(np.int64)
+    net_max = net_max.astype(np.int64)
+
+    old_min = np.array([v if v is not None else -1 for v in old_min], dtype=np.int64)
+    old_max = np.array([v if v is not None else -1 for v in old_max], dtype=np.int64)
+    changed = valid & ((net_min != old_min) | (net_max != old_max))
+    updates = list(zip(ids[changed].tolist(), net_min[changed].tolist(), net_max[changed].tolist()))
+
+    execute_values(cur, """
+        UPDATE recruit_posts p
+        SET    salary_net_min = v.net_min, salary_net_max = v.net_max
+        FROM   (VALUES %s) AS v (id, net_min, net_max)
+        WHERE  p.id = v.id
+    """, updates, page_size=UPDATE_PAGE)
     conn.commit()
     cur.close()
     conn.close()
 
+    # 세율 규칙 연도별 건수
+    rule_years = {}
+    for y in years[valid]:
+        ry = tax_rule_year(None if np.isnan(y) else int(y))
+        rule_years[ry] = rule_years.get(ry, 0) + 1
+
     print("=" * 50)
-    print(f"  업데이트 완료 : {updated:,}건")
+    print(f"  재계산 완료   : {int(valid.sum()):,}건  (값 변경 {len(updates):,}건 UPDATE)")
     print(f"  건너뜀        : {skipped}건  (salary_type 불명확)")
-    print(f"  오류          : {errors}건")
+    print(f"  적용 세율     : " + ' / '.join(f"{y}년 규칙 {n:,}건"
+                                           for y, n in sorted(rule_years.items())))
+    print(f"  소득세 방식   : {'간이세액표 (월 원천징수)' if salary_calculator.WITHHOLDING_TABLE else '연봉 환산 누진세'}")
     print("=" * 50)
 
 
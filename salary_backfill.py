@@ -5,41 +5,68 @@ salary_backfill.py — 기존 DB 공고에 급여 데이터 추가
 ─────────────────────────────────────────────────────
 처리 흐름:
   1. recruit_posts 테이블에 급여 컬럼 7개 추가 (없으면)
-  2. salary_fetched = FALSE 인 공고만 선택
-  3. 각 공고 상세 페이지 방문 → 모집개요 '급여' 행 파싱
-  4. salary_calculator.py 로 Net 환산 → DB UPDATE
+  2. salary_fetched = FALSE 인 공고를 상세 수집 큐(detail_fetch_queue)에 등록 (DB 안에서)
+  3. 큐에서 LEASE_BATCH 건씩 임대 → 상세 페이지 방문 → 모집개요 '급여' 행 파싱
+  4. salary_calculator.py 로 Net 환산 → DB UPDATE → 큐에서 삭제
+     실패는 분류(timeout / login / parse / not_found / error)해 큐에 남기고
+     다음 실행에서 지수 백오프로 재시도, --max-attempts 회 실패하면 포기(dropped)
+
+  --reparse : 브라우저 없이 이미 저장된 salary_raw 를 현재 parse_salary 로 다시 파싱
+     서버 측 커서로 REPARSE_CHUNK 건씩 읽어 같은 문자열은 한 번만 파싱,
+     바뀐 행만 salary_* 컬럼 일괄 UPDATE (청크당 1 트랜잭션) → 전/후 비교 요약 출력
+
+  파싱 결과는 parse_cache.py 의 salary_parse_cache 에 (문구 해시, PARSER_VERSION) 로 남겨
+  다음 실행·재파싱에서 같은 문구를 다시 파싱하지 않음 (--no-parse-cache 로 끔)
+
+  큐는 FOR UPDATE SKIP LOCKED 로 임대하므로 여러 번 실행하면 그만큼 워커가 늘어난다.
+  phase4_crawler.py --enqueue-only 가 등록한 신규 공고도 같은 큐로 들어온다.
 
 실행:
   python salary_backfill.py
+  python salary_backfill.py --follow                         # 큐가 비어도 대기하며 계속 처리
+  python salary_backfill.py --max-attempts 8                 # 실패 공고 포기 전 시도 횟수
+  python salary_backfill.py --reparse --dry-run              # 파서 개선 후 바뀔 내용만 확인
+  python salary_backfill.py --reparse                        # 저장된 salary_raw 재파싱 반영
+  python salary_backfill.py --metrics-port 9110              # OpenMetrics 엔드포인트
+  python salary_backfill.py --metrics-file backfill.prom     # textfile collector 용
 
 로그:
-  salary_backfill_log.txt (실시간)
+  logs/salary_backfill_<호스트>_<PID>.jsonl (JSON lines, 워커 프로세스마다 따로 — 회전이 서로 겹치지 않음,
+    python crawl_logger.py query --job backfill 로 전체 조회)
+  salary_backfill_metrics.json (실행 요약: 카운터 + 지연 p50/p95)
 """
 
+import argparse
 import time
 import random
 import sys
 import os
 import re
+import socket
 from datetime import datetime
+from urllib.parse import urlsplit
 
 import psycopg2
+from psycopg2.extras import execute_values
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
 
-from salary_calculator import parse_salary
+from salary_calculator import parse_salary, tax_rule_year, tax_year_of
+from crawl_metrics import Metrics
+from crawl_logger import CrawlLogger, LOG_DIR
+from db_config import DB_CONFIG
+import detail_queue
+import parse_cache
+import session_store
 
 # ══════════════════════════════════════════════════════════════
 # 설정
 # ══════════════════════════════════════════════════════════════
-DB_CONFIG = {
-    'host': 'localhost', 'port': 5432,
-    'dbname': 'medigate', 'user': 'postgres', 'password': 'postgres',
-}
 LOGIN_URL  = "https://new.medigate.net/recruit/list"
 USER_ID    = "bassdoctor"
 USER_PW    = "!q2w3e4r5t"
@@ -47,21 +74,39 @@ USER_PW    = "!q2w3e4r5t"
 DELAY_MIN  = 1.5   # 페이지 간 최소 딜레이(초)
 DELAY_MAX  = 2.5   # 페이지 간 최대 딜레이(초)
 PROGRESS_N = 50    # N건마다 진행 출력
-MAX_RETRY  = 2     # 페이지 로드 실패 시 재시도 횟수
+FOLLOW_POLL = 30   # --follow: 큐가 비었을 때 다시 확인하는 간격(초)
+MAX_RETRY  = 2     # 페이지 로드 실패 시 재시도 횟수 (같은 방문 안에서)
+REPARSE_CHUNK = 2000   # --reparse: 한 번에 읽고 UPDATE 하는 행 수 (= 트랜잭션 1개)
+
+# 삭제·마감 처리된 공고 페이지 문구 → not_found (재시도해도 소용없음)
+NOT_FOUND_MARKERS = ('존재하지 않는 공고', '삭제된 공고', '삭제되었거나', '페이지를 찾을 수 없')
+
+# ── 지표 (crawl_metrics.py, 이름은 phase4_crawler 와 공통 / job="backfill")
+METRICS = Metrics(job='backfill')
+METRICS.describe('medigate_detail_page_seconds', 'histogram',
+                 '상세 페이지 처리 시간 (요청 ~ 급여 행 추출, 성공 1건 기준)')
+METRICS.describe('medigate_db_write_seconds', 'histogram', '급여 UPDATE 시간 (1건)')
+METRICS.describe('medigate_requests_total', 'counter', '페이지 요청 수')
+METRICS.describe('medigate_retries_total', 'counter', '재시도 수')
+METRICS.describe('medigate_request_errors_total', 'counter', '재시도 후에도 실패한 요청 수')
+METRICS.describe('medigate_parse_failures_total', 'counter',
+                 '파싱 실패 분류 (no_salary_row / salary_unparsed / fetch_error)')
+METRICS.describe('medigate_fetch_failures_total', 'counter',
+                 '상세 수집 실패 분류 (failure=timeout/login/parse/not_found/error, '
+                 'outcome=retry/dropped)')
 
 # ── 로그 설정 ─────────────────────────────────────────────────
-_DIR = os.path.dirname(os.path.abspath(__file__))
-_LOG = open(os.path.join(_DIR, 'salary_backfill_log.txt'), 'w',
-            encoding='utf-8', buffering=1)
+_DIR     = os.path.dirname(os.path.abspath(__file__))
+# 워커(프로세스)마다 파일을 따로 — 한 파일을 여러 프로세스가 각자 회전시키면 백업이 덮어써짐
+LOG_PATH = os.path.join(LOG_DIR, f'salary_backfill_{socket.gethostname()}_{os.getpid()}.jsonl')
+_LOGGER  = None   # 첫 log() 호출 시 생성
 
-def log(msg: str):
-    try:
-        sys.stdout.buffer.write((str(msg) + '\n').encode('utf-8'))
-        sys.stdout.buffer.flush()
-    except Exception:
-        pass
-    _LOG.write(str(msg) + '\n')
-    _LOG.flush()
+def log(msg: str, **fields):
+    """stdout + JSON lines 로그 (비동기, crawl_logger.py)"""
+    global _LOGGER
+    if _LOGGER is None:
+        _LOGGER = CrawlLogger(LOG_PATH, job='backfill')
+    _LOGGER.log(msg, **fields)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -103,24 +148,21 @@ def ensure_columns(conn):
         log("  [DB] 급여 컬럼 이미 존재")
 
 
-def fetch_pending(conn):
-    """아직 급여 수집을 하지 않은 공고 목록 반환"""
-    cur = conn.cursor()
-    cur.execute("""
-        SELECT id, post_id, url
-        FROM   recruit_posts
-        WHERE  source = 'medigate'
-          AND  post_id <> ''
-          AND  (salary_fetched IS NULL OR salary_fetched = FALSE)
-        ORDER  BY id
-    """)
-    rows = cur.fetchall()
-    cur.close()
-    return rows
+def seed_queue(conn):
+    """아직 급여 수집을 하지 않은 공고를 상세 수집 큐에 등록 → 새로 등록된 건수
+    (전체 목록을 메모리로 읽지 않고 DB 안에서 INSERT ... SELECT)
+    """
+    detail_queue.ensure_queue_table(conn)
+    return detail_queue.seed_unfetched(conn)
 
 
 def save_salary(conn, db_id: int, raw_text, parsed: dict):
     """급여 파싱 결과를 DB에 저장"""
+    with METRICS.timer('medigate_db_write_seconds'):
+        _save_salary(conn, db_id, raw_text, parsed)
+
+
+def _save_salary(conn, db_id, raw_text, parsed):
     cur = conn.cursor()
     try:
         cur.execute("""
@@ -154,6 +196,7 @@ def save_salary(conn, db_id: int, raw_text, parsed: dict):
 
 def mark_fetched(conn, db_id: int):
     """급여 정보 없는 공고도 '방문 완료' 표시 (재시도 방지)"""
+    t0  = time.monotonic()
     cur = conn.cursor()
     try:
         cur.execute(
@@ -163,6 +206,130 @@ def mark_fetched(conn, db_id: int):
         conn.commit()
     finally:
         cur.close()
+        METRICS.observe('medigate_db_write_seconds', time.monotonic() - t0)
+
+
+# ══════════════════════════════════════════════════════════════
+# 저장된 salary_raw 재파싱 (--reparse, 브라우저 없음)
+# ══════════════════════════════════════════════════════════════
+_PARSED_COLS = ('salary_type', 'salary_unit', 'salary_min', 'salary_max',
+                'salary_net_min', 'salary_net_max')
+
+
+def _salary_kind(values) -> str:
+    """(type, unit, min, max, net_min, net_max) → 'salary' | 'nego' | 'unparsed' (요약용)"""
+    if values[4] is not None:
+        return 'salary'
+    return 'nego' if values[0] is None else 'unparsed'
+
+
+def reparse_stored(conn, chunk=REPARSE_CHUNK, dry_run=False):
+    """salary_raw 가 있는 공고 전체를 다시 파싱해 바뀐 행만 UPDATE → 요약 dict
+
+    Net 환산은 등록일 연도의 세율 규칙 (salary_calculator.TAX_RULES).
+    읽기는 WITH HOLD 서버 측 커서 — 청크마다 커밋해도 커서가 유지되고
+    전체 행을 클라이언트 메모리로 가져오지 않는다.
+    """
+    stats = {'rows': 0, 'distinct': 0, 'changed': 0, 'errors': 0,
+             'columns': {c: 0 for c in _PARSED_COLS}, 'transitions': {}, 'samples': []}
+    cache = {}   # (salary_raw, 세율 규칙 연도) → 파싱 결과 튜플 (같은 문구가 많음)
+
+    read = conn.cursor(name='salary_reparse', withhold=True)
+    read.itersize = chunk
+    read.execute("""
+        SELECT id, register_date, salary_raw, salary_type, salary_unit, salary_min, salary_max,
+               salary_net_min, salary_net_max
+        FROM   recruit_posts
+        WHERE  salary_raw IS NOT NULL
+        ORDER  BY id
+    """)
+    try:
+        while True:
+            rows = read.fetchmany(chunk)
+            if not rows:
+                break
+            updates = []
+            for db_id, register_date, raw, *old in rows:
+                stats['rows'] += 1
+                key = (raw, tax_rule_year(tax_year_of(register_date)))
+                if key not in cache:
+                    try:
+                        parsed = parse_salary(raw, key[1])
+                        cache[key] = tuple(parsed[c] for c in _PARSED_COLS)
+                    except Exception as e:
+                        cache[key] = None
+                        log(f"  [파싱 오류] id={db_id} {raw[:40]!r}: {e}", db_id=db_id)
+                new = cache[key]
+                if new is None:
+                    stats['errors'] += 1
+                    continue
+                old = tuple(old)
+                if new == old:
+                    continue
+
+                stats['changed'] += 1
+                for col, a, b in zip(_PARSED_COLS, old, new):
+                    if a != b:
+                        stats['columns'][col] += 1
+                key = (_salary_kind(old), _salary_kind(new))
+                stats['transitions'][key] = stats['transitions'].get(key, 0) + 1
+                if len(stats['samples']) < 5:
+                    stats['samples'].append((db_id, raw, old, new))
+                updates.append((db_id,) + new)
+
+            if updates and not dry_run:
+                _bulk_update_salary(conn, updates)
+            log(f"  [{stats['rows']:>7,}행] 변경 {stats['changed']:,}건 / "
+                f"파싱 {len(cache):,}회")
+    finally:
+        read.close()
+        conn.commit()   # WITH HOLD 커서 정리 + dry-run 읽기 트랜잭션 종료
+    stats['distinct'] = len(cache)
+    return stats
+
+
+def _bulk_update_salary(conn, updates):
+    """[(id, type, unit, min, max, net_min, net_max)] 일괄 UPDATE — 1 트랜잭션"""
+    t0  = time.monotonic()
+    cur = conn.cursor()
+    try:
+        execute_values(cur, """
+            UPDATE recruit_posts p SET
+                salary_type    = v.salary_type,
+                salary_unit    = v.salary_unit,
+                salary_min     = v.salary_min,
+                salary_max     = v.salary_max,
+                salary_net_min = v.salary_net_min,
+                salary_net_max = v.salary_net_max
+            FROM (VALUES %s) AS v (id, salary_type, salary_unit, salary_min, salary_max,
+                                   salary_net_min, salary_net_max)
+            WHERE p.id = v.id
+        """, updates, template='(%s, %s::text, %s::text, %s::int, %s::int, %s::int, %s::int)',
+            page_size=len(updates))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+        METRICS.observe('medigate_db_write_seconds', time.monotonic() - t0)
+
+
+def report_reparse(stats, dry_run=False):
+    log("\n" + "=" * 62)
+    log(f"  재파싱 {'미리보기 (DB 변경 없음)' if dry_run else '완료'}")
+    log(f"  대상        : {stats['rows']:,}건 (파싱 {stats['distinct']:,}회 — 같은 문구·세율 연도는 1회)")
+    log(f"  변경        : {stats['changed']:,}건")
+    log(f"  파싱 오류   : {stats['errors']:,}건  (기존 값 유지)")
+    changed_cols = [f"{c} {n:,}" for c, n in stats['columns'].items() if n]
+    if changed_cols:
+        log(f"  컬럼별 변경 : {' / '.join(changed_cols)}")
+    for (before, after), n in sorted(stats['transitions'].items(), key=lambda kv: -kv[1]):
+        log(f"    {before:>8} → {after:<8} {n:,}건")
+    for db_id, raw, old, new in stats['samples']:
+        log(f"    예) id={db_id} {raw[:40]!r}: "
+            f"Net {old[4]}~{old[5]} → {new[4]}~{new[5]} ({old[0]}/{old[1]} → {new[0]}/{new[1]})")
+    log("=" * 62)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -203,6 +370,22 @@ def login(driver) -> bool:
 # ══════════════════════════════════════════════════════════════
 # 상세 페이지에서 급여 텍스트 추출
 # ══════════════════════════════════════════════════════════════
+class FetchFailure(Exception):
+    """분류된 상세 수집 실패 — kind 는 detail_queue.FAILURE_KINDS 중 하나"""
+
+    def __init__(self, kind, message):
+        super().__init__(message)
+        self.kind = kind
+
+
+def classify_failure(exc) -> str:
+    if isinstance(exc, FetchFailure):
+        return exc.kind
+    if isinstance(exc, TimeoutException) or 'timed out' in str(exc).lower():
+        return 'timeout'
+    return 'error'
+
+
 def extract_salary_text(driver, url: str) -> str | None:
     """
     공고 상세 페이지 방문 → 모집개요 '급여' 행 텍스트 반환
@@ -210,6 +393,7 @@ def extract_salary_text(driver, url: str) -> str | None:
     """
     for attempt in range(MAX_RETRY + 1):
         try:
+            METRICS.inc('medigate_requests_total', kind='detail')
             driver.get(url)
             # JS 렌더링 대기
             WebDriverWait(driver, 12).until(
@@ -217,6 +401,10 @@ def extract_salary_text(driver, url: str) -> str | None:
             )
             time.sleep(1.2)   # React hydration 추가 대기
 
+            # 로그인 호스트로 보내졌으면 세션 만료 (재시도해도 같은 결과)
+            if urlsplit(driver.current_url).netloc != urlsplit(url).netloc:
+                raise FetchFailure('login', f"로그인 페이지로 이동됨: {driver.current_url[:80]}")
+
             soup = BeautifulSoup(driver.page_source, 'html.parser')
 
             # 모집개요 행: div.my-qjvukt
@@ -229,20 +417,128 @@ def extract_salary_text(driver, url: str) -> str | None:
                     )
                     if val_div:
                         return val_div.get_text(separator=' ', strip=True)
+            page_text = soup.get_text(' ', strip=True)
+            if any(m in page_text for m in NOT_FOUND_MARKERS):
+                raise FetchFailure('not_found', '삭제되었거나 존재하지 않는 공고')
             return None   # 급여 행 없음
 
+        except FetchFailure:
+            METRICS.inc('medigate_request_errors_total', kind='detail')
+            raise
         except Exception as e:
             if attempt < MAX_RETRY:
                 log(f"  [재시도 {attempt+1}/{MAX_RETRY}] {url[:60]}... ({e})")
+                METRICS.inc('medigate_retries_total', kind='detail')
                 time.sleep(3)
             else:
+                METRICS.inc('medigate_request_errors_total', kind='detail')
                 raise
 
 
 # ══════════════════════════════════════════════════════════════
 # 메인
 # ══════════════════════════════════════════════════════════════
+def parse_args():
+    parser = argparse.ArgumentParser(description='기존 DB 공고 급여 backfill')
+    parser.add_argument('--metrics-port', type=int, default=None, metavar='PORT',
+                        help='OpenMetrics 엔드포인트 http://127.0.0.1:PORT/metrics 제공')
+    parser.add_argument('--metrics-file', default=None, metavar='PATH',
+                        help=f'OpenMetrics textfile(.prom) 을 {PROGRESS_N}건마다 갱신')
+    parser.add_argument('--metrics-json', default=os.path.join(_DIR, 'salary_backfill_metrics.json'),
+                        metavar='PATH', help='실행 요약 JSON 경로')
+    parser.add_argument('--follow', action='store_true',
+                        help=f'큐가 비어도 종료하지 않고 {FOLLOW_POLL}초마다 다시 확인 '
+                             '(phase4_crawler.py --enqueue-only 와 함께 사용)')
+    parser.add_argument('--no-seed', dest='seed', action='store_false',
+                        help='급여 미수집 공고를 큐에 추가하지 않고 이미 등록된 작업만 처리')
+    parser.add_argument('--fresh-login', action='store_true',
+                        help='저장된 로그인 세션(session_state.json)을 쓰지 않고 새로 로그인')
+    parser.add_argument('--max-attempts', type=int, default=detail_queue.MAX_ATTEMPTS,
+                        metavar='N',
+                        help=f'실패한 공고를 포기하기 전 최대 시도 횟수 '
+                             f'(기본 {detail_queue.MAX_ATTEMPTS}, 재시도 간격은 '
+                             f'{detail_queue.RETRY_BASE_SECONDS // 60}분부터 2배씩)')
+    parser.add_argument('--reparse', action='store_true',
+                        help='브라우저 없이 저장된 salary_raw 를 다시 파싱해 salary_* 컬럼 갱신')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='--reparse 와 함께: DB 는 바꾸지 않고 전/후 비교만 출력')
+    parser.add_argument('--no-parse-cache', action='store_true',
+                        help='salary_parse_cache 테이블을 쓰지 않고 매 실행 새로 파싱 (메모리 캐시만)')
+    return parser.parse_args()
+
+
+def process_post(conn, driver, db_id, post_id, url, register_date=None):
+    """공고 1건 상세 방문 → 급여 저장. 반환: 'salary' | 'nego' | 'none'
+    Net 환산은 등록일 연도의 세율 규칙 (salary_calculator.TAX_RULES)
+    실패는 FetchFailure 로 올린다 (salary_fetched 는 그대로 — 큐에서 재시도)
+    """
+    try:
+        with METRICS.timer('medigate_detail_page_seconds'):
+            raw = extract_salary_text(driver, url)
+    except Exception as e:
+        # selenium 메시지는 스택트레이스가 붙어 길다 → 첫 줄만
+        message = (getattr(e, 'msg', None) or str(e)).strip()
+        message = (message.splitlines() or [type(e).__name__])[0][:200]
+        raise FetchFailure(classify_failure(e), message) from e
+
+    if raw is None:
+        # 급여 행 없음
+        METRICS.inc('medigate_parse_failures_total', kind='no_salary_row')
+        mark_fetched(conn, db_id)
+        return 'none'
+
+    try:
+        parsed = parse_salary(raw, tax_year_of(register_date))
+    except Exception as e:
+        raise FetchFailure('parse', f"{type(e).__name__}: {e} ({raw[:60]})") from e
+    save_salary(conn, db_id, raw, parsed)
+    if parsed['salary_net_min'] is not None:
+        return 'salary'
+    if parsed['salary_type'] is None:
+        return 'nego'
+    # type/unit 있으나 숫자 파싱 실패
+    METRICS.inc('medigate_parse_failures_total', kind='salary_unparsed')
+    return 'none'
+
+
+def handle_failure(conn, driver, worker, db_id, post_id, url, failure, max_attempts):
+    """실패한 공고를 큐에 재시도로 남김 → 'retry' | 'dropped' | 'relogin'
+    로그인 만료는 공고 탓이 아니므로 시도 횟수에 넣지 않고 다시 로그인한다 (실패 시 예외).
+    """
+    log(f"  [실패:{failure.kind}] id={db_id} url={url}: {failure}",
+        post_id=post_id, db_id=db_id, failure=failure.kind)
+    METRICS.inc('medigate_parse_failures_total', kind='fetch_error')
+    relogin = failure.kind == 'login'
+    outcome = detail_queue.retry_later(conn, db_id, worker, failure.kind, str(failure),
+                                       max_attempts=max_attempts, count_attempt=not relogin)
+    outcome = outcome or 'retry'   # 임대가 다른 워커로 넘어간 경우 — 그쪽에서 처리
+    METRICS.inc('medigate_fetch_failures_total', failure=failure.kind, outcome=outcome)
+    if outcome == 'dropped':
+        log(f"  [포기] id={db_id} — 시도 한도 도달 ({failure.kind})",
+            post_id=post_id, db_id=db_id, failure=failure.kind)
+
+    if relogin:
+        log("  [LOGIN] 세션 만료 → 다시 로그인")
+        session_store.clear_session()
+        if not session_store.ensure_login(driver, login, LOGIN_URL, log=log):
+            raise RuntimeError('재로그인 실패')
+        return 'relogin'
+    return outcome
+
+
+def _export_metrics(path):
+    if not path:
+        return
+    try:
+        METRICS.write_textfile(path)
+    except Exception as e:
+        log(f"  [경고] 지표 파일 저장 실패: {e}")
+
+
 def main():
+    args = parse_args()
+    session_store.DISABLED = args.fresh_login
+    parse_cache.DISABLED   = args.no_parse_cache
     log("=" * 62)
     log("  급여 Backfill 시작")
     log(f"  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -258,20 +554,44 @@ def main():
         sys.exit(1)
 
     ensure_columns(conn)
+    parse_cache.attach(DB_CONFIG, log=log)
+    if args.reparse:
+        log(f"\n[2] 저장된 salary_raw 재파싱 ({REPARSE_CHUNK:,}건 단위, 브라우저 없음)")
+        report_reparse(reparse_stored(conn, dry_run=args.dry_run), dry_run=args.dry_run)
+        parse_cache.detach(log=log)
+        conn.close()
+        if _LOGGER is not None:
+            _LOGGER.close()
+        return
+
+    if args.seed:
+        log(f"  큐 등록: {seed_queue(conn):,}건 (급여 미수집 공고)")
+    else:
+        detail_queue.ensure_queue_table(conn)
 
-    posts = fetch_pending(conn)
-    total = len(posts)
-    log(f"  처리 대상: {total:,}건\n")
+    counts = detail_queue.queue_summary(conn)
+    total  = counts.get('pending', 0) + counts.get('expired', 0)
+    log(f"  처리 대상: {total:,}건 (큐 대기 {counts.get('pending', 0):,} / "
+        f"임대 만료 {counts.get('expired', 0):,} / 다른 워커 처리 중 {counts.get('leased', 0):,})")
+    log(f"  {detail_queue.format_retry_summary(detail_queue.retry_summary(conn))}\n")
 
-    if total == 0:
-        log("처리할 공고 없음. (모두 salary_fetched=TRUE)")
+    if total == 0 and not args.follow:
+        log("처리할 공고 없음. (큐가 비어 있음)")
+        parse_cache.detach(log=log)
         conn.close()
         return
 
+    if args.metrics_port is not None:
+        try:
+            port = METRICS.start_http_server(args.metrics_port)
+            log(f"  [지표] http://127.0.0.1:{port}/metrics")
+        except Exception as e:
+            log(f"  [경고] 지표 엔드포인트 시작 실패: {e}")
+
     # ── 브라우저 & 로그인 ────────────────────────────────────
     log("[2] Chrome 브라우저 시작 및 로그인...")
     driver = setup_driver()
-    if not login(driver):
+    if not session_store.ensure_login(driver, login, LOGIN_URL, log=log):
         log("  [ERROR] 로그인 실패. 종료합니다.")
         driver.quit()
         conn.close()
@@ -279,55 +599,81 @@ def main():
     log("  [OK] 로그인 성공\n")
 
     # ── 수집 루프 ────────────────────────────────────────────
-    log(f"[3] 급여 수집 시작 (딜레이 {DELAY_MIN}~{DELAY_MAX}초)\n")
+    worker = detail_queue.worker_name()
+    log(f"[3] 급여 수집 시작 (워커 {worker}, 딜레이 {DELAY_MIN}~{DELAY_MAX}초)\n")
 
     cnt_total   = 0  # 방문 완료
     cnt_salary  = 0  # 급여 파싱 성공 (Net 환산까지)
     cnt_nego    = 0  # 협의/미정
     cnt_nofield = 0  # 급여 행 없음
-    cnt_err     = 0  # 오류
-
-    for idx, (db_id, post_id, url) in enumerate(posts, 1):
-        try:
-            raw = extract_salary_text(driver, url)
-            cnt_total += 1
-
-            if raw is None:
-                # 급여 행 없음
-                mark_fetched(conn, db_id)
-                cnt_nofield += 1
-            else:
-                parsed = parse_salary(raw)
-                save_salary(conn, db_id, raw, parsed)
+    cnt_retry   = 0  # 실패 → 재시도 대기
+    cnt_dropped = 0  # 실패 → 시도 한도 초과로 포기
+    cnt_relogin = 0  # 세션 만료 → 재로그인 후 바로 재시도
 
-                if parsed['salary_net_min'] is not None:
+    idx   = 0
+    batch = []
+    try:
+        while True:
+            batch = detail_queue.lease_batch(conn, worker)
+            if not batch:
+                if not args.follow:
+                    break
+                time.sleep(FOLLOW_POLL)
+                continue
+            while batch:
+                db_id, post_id, url, _, register_date = batch[0]
+                # 건마다 남은 배치의 임대 연장 — 이미 다른 워커에게 넘어간 공고는 건너뜀
+                if db_id not in detail_queue.extend_lease(conn, [row[0] for row in batch], worker):
+                    log(f"  [임대 만료] id={db_id} 다른 워커가 가져감 → 건너뜀", db_id=db_id)
+                    batch.pop(0)
+                    continue
+                idx  += 1
+                total = max(total, idx)
+                try:
+                    result = process_post(conn, driver, db_id, post_id, url, register_date)
+                    detail_queue.complete(conn, db_id, worker)
+                except FetchFailure as f:
+                    result = handle_failure(conn, driver, worker, db_id, post_id, url,
+                                            f, args.max_attempts)
+                batch.pop(0)
+
+                cnt_total += 1
+                if result == 'salary':
                     cnt_salary += 1
-                elif parsed['salary_type'] is None:
+                elif result == 'nego':
                     cnt_nego += 1
+                elif result == 'retry':
+                    cnt_retry += 1
+                elif result == 'dropped':
+                    cnt_dropped += 1
+                elif result == 'relogin':
+                    cnt_relogin += 1
                 else:
-                    # type/unit 있으나 숫자 파싱 실패
                     cnt_nofield += 1
 
-        except Exception as e:
-            log(f"  [오류] id={db_id} url={url}: {e}")
-            mark_fetched(conn, db_id)
-            cnt_err += 1
-            cnt_total += 1
-
-        # 딜레이
-        time.sleep(random.uniform(DELAY_MIN, DELAY_MAX))
-
-        # 진행 출력
-        if idx % PROGRESS_N == 0 or idx == total:
-            elapsed = max(1, (datetime.now() - start).seconds)
-            speed   = idx / elapsed * 60
-            remain  = (total - idx) / speed if speed > 0 else 0
-            log(
-                f"  [{idx:>5}/{total}] "
-                f"급여수집 {cnt_salary}건 | 협의 {cnt_nego}건 | "
-                f"없음 {cnt_nofield}건 | 오류 {cnt_err}건 "
-                f"| {speed:.0f}건/분 | 잔여 약 {remain:.0f}분"
-            )
+                # 딜레이
+                time.sleep(random.uniform(DELAY_MIN, DELAY_MAX))
+
+                # 진행 출력
+                if idx % PROGRESS_N == 0 or idx == total:
+                    elapsed = max(1, (datetime.now() - start).seconds)
+                    speed   = idx / elapsed * 60
+                    remain  = (total - idx) / speed if speed > 0 else 0
+                    log(
+                        f"  [{idx:>5}/{total}] "
+                        f"급여수집 {cnt_salary}건 | 협의 {cnt_nego}건 | "
+                        f"없음 {cnt_nofield}건 | 재시도 {cnt_retry}건 | 포기 {cnt_dropped}건 "
+                        f"| {speed:.0f}건/분 | 잔여 약 {remain:.0f}분"
+                    )
+                    _export_metrics(args.metrics_file)
+                    parse_cache.flush()
+    except KeyboardInterrupt:
+        log("\n  중단 요청 → 남은 임대 작업 반납")
+    except RuntimeError as e:
+        log(f"\n  [ERROR] {e} → 남은 임대 작업 반납 후 종료")
+    finally:
+        # 처리하지 못한 임대분은 바로 다른 워커가 가져갈 수 있게 반납
+        detail_queue.release(conn, [row[0] for row in batch], worker)
 
     # ── 최종 결과 ────────────────────────────────────────────
     elapsed_total = max(1, (datetime.now() - start).seconds)
@@ -337,13 +683,34 @@ def main():
     log(f"  급여 수집   : {cnt_salary:,}건  (Net 환산 완료)")
     log(f"  협의/미정   : {cnt_nego:,}건  (salary_net = NULL)")
     log(f"  급여행 없음 : {cnt_nofield:,}건  (salary_net = NULL)")
-    log(f"  오류        : {cnt_err:,}건")
+    log(f"  재시도 대기 : {cnt_retry:,}건  (다음 실행에서 다시 시도)")
+    log(f"  포기        : {cnt_dropped:,}건  (시도 {args.max_attempts}회 초과, "
+        f"detail_queue.py requeue 로 되살림)")
+    if cnt_relogin:
+        log(f"  재로그인    : {cnt_relogin:,}회  (세션 만료, 시도 횟수에 넣지 않음)")
+    try:
+        log(f"  큐 상태     : {detail_queue.format_retry_summary(detail_queue.retry_summary(conn))}")
+    except Exception as e:
+        log(f"  [경고] 재시도 현황 조회 실패: {e}")
     log(f"  소요 시간   : {elapsed_total // 60}분 {elapsed_total % 60}초")
+    detail = METRICS.summary()['histograms'].get('medigate_detail_page_seconds', {}).get('_')
+    if detail:
+        log(f"  상세 지연   : p50 {detail['p50']:.2f}초 / p95 {detail['p95']:.2f}초")
+    parse_cache.detach(log=log)
     log("=" * 62)
 
+    _export_metrics(args.metrics_file)
+    try:
+        METRICS.write_json(args.metrics_json, visited=cnt_total, salary=cnt_salary,
+                           nego=cnt_nego, no_field=cnt_nofield, retry=cnt_retry,
+                           dropped=cnt_dropped)
+    except Exception as e:
+        log(f"  [경고] 실행 요약 저장 실패: {e}")
+    METRICS.stop_http_server()
     driver.quit()
     conn.close()
-    _LOG.close()
+    if _LOGGER is not None:
+        _LOGGER.close()
 
 
 if __name__ == '__main__':
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-한국 봉직의 월 실수령액 계산기 (2025년 기준)
+한국 봉직의 월 실수령액 계산기 (연도별 세율 규칙, 기본 2025년 기준)
 ─────────────────────────────────────────────
-공제 항목
+공제 항목 (2025년)
   · 국민연금    4.5%   (기준소득월액 상한 617만원 → 월 최대 277,650원)
   · 건강보험    3.545%
   · 장기요양    건강보험료 × 12.95%
@@ -12,13 +12,47 @@
   · 지방소득세  소득세 × 10%
   · 식대 비과세 월 20만원 적용
 
+연도별 규칙
+  · TAX_RULES[적용 시작 연도] — 요율·상한·세율표 묶음, register_tax_rules() 로 추가
+  · 공고는 등록일(register_date) 연도의 규칙으로 계산 (해당 연도가 없으면 직전 연도 규칙)
+  · 연도를 주지 않으면 DEFAULT_TAX_YEAR 규칙 (실행 날짜와 무관 — 해가 바뀌어도 결과 그대로)
+  · tax_calculator(year) — 규칙 1세트로 구간표·역산 구간을 미리 계산한 NetCalculator (규칙당 1개 캐시)
+
+간이세액표 모드 (선택)
+  · WITHHOLDING_TABLE = True — 소득세를 연봉 환산 누진세 대신
+    국세청 간이세액표(withholding_table.py, 가족 1명)로, 지방소득세는 그 10% (10원 미만 절사)
+  · DB 에 Net 을 쓰는 모든 경로(크롤러 · backfill · --reparse · recalculate_net)가 이 값 하나를 따름
+    → 방식이 섞이지 않도록 실행 옵션으로 바꾸지 않고, 바꾼 뒤에는 recalculate_net 실행
+    (withholding=True/False 인자는 비교·분석용 — 저장 경로에서는 쓰지 않음)
+  · 병원이 매달 실제 원천징수하는 금액 = 급여명세서 실수령액 기준 (역산은 항상 연봉 환산 방식)
+
 퇴직금 월 환산
   · 1년 근무 기준 법정 퇴직금 = 1개월 평균 Gross 임금
   · 월 환산 = Gross_월급 / 12
-  · Net 공고: Gross 역산(binary search) 후 동일 방식 적용
+  · Net → Gross 역산: estimate_gross_from_net (구간별 1차식을 거꾸로 푼 닫힌 식 + 원 단위 보정)
+
+일괄 계산 (NumPy)
+  · gross_to_net_array / calc_net_with_retirement_array — 열 전체를 한 번에 계산
+  · 구간별 공제·세율표를 np.searchsorted 로 찾아 스칼라 함수와 원 단위까지 같은 결과
+  · estimate_gross_from_net_array — Net 열 전체를 Gross 로 역산
+  · years= 로 원소별 연도를 주면 규칙 세트마다 한 번씩 계산해 합침 (여러 해 재계산도 호출 1번)
+
+급여 텍스트 파싱 캐시
+  · parse_salary 는 공백을 정리한 문구 단위로 LRU 메모 (같은 병원이 같은 문구를 매달 다시 올림)
+    → 정규식 파싱은 문구당 1번, Net 환산은 (숫자, 세율 규칙)당 1번. 반환 dict 는 매번 새로 만듦
+  · 영구 캐시(parse_cache.py)를 연결하면 (문구 해시, PARSER_VERSION) 단위로 DB 에도 저장
+    → 파싱 규칙을 바꾸면 PARSER_VERSION 을 올릴 것
 """
 
+import math
 import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:   # numpy 미설치 시 스칼라 함수만 사용 가능
+    np = None
 
 # ══════════════════════════════════════════════════════════════
 # 상수 (2025년 기준)
@@ -42,91 +76,437 @@ _TAX_TABLE = [
     (  float('inf'), 0.45, 65_940_000),
 ]
 
+# 근로소득공제 (총급여 상한, 기본액, 구간 시작, 율) — 한도 2,000만원
+_EID_TABLE = [
+    (    5_000_000,          0,          0, 0.70),
+    (   15_000_000,  3_500_000,  5_000_000, 0.40),
+    (   45_000_000,  7_500_000, 15_000_000, 0.15),
+    (  100_000_000, 12_000_000, 45_000_000, 0.05),
+    (  float('inf'), 14_750_000,         0, 0.0),
+]
+
+# 근로소득세액공제 한도 (총급여 상한, 한도)
+_CREDIT_CAPS = [
+    (   33_000_000, 740_000),
+    (   70_000_000, 660_000),
+    (  float('inf'), 500_000),
+]
+
 
 # ══════════════════════════════════════════════════════════════
-# 세금 계산 내부 함수
+# 연도별 세율 규칙
 # ══════════════════════════════════════════════════════════════
+WITHHOLDING_TABLE = False   # True 면 소득세를 간이세액표로 — 모든 저장 경로 공통, 바꾸면 recalculate_net 실행
+DEFAULT_TAX_YEAR  = 2025    # 연도를 모를 때(year=None) 쓰는 규칙 연도 — 바꾸면 recalculate_net 실행
+
+TAX_RULES    = {}   # 적용 시작 연도 → 규칙 dict
+_CALCULATORS = {}   # 요청 연도 → NetCalculator (같은 규칙이면 같은 객체, register_tax_rules 시 비움)
+
+
+def register_tax_rules(year: int, base: int = None, **rules):
+    """year 부터 적용할 규칙 등록 — base 연도 규칙을 복사하고 바뀐 항목만 덮어씀"""
+    merged = dict(TAX_RULES[base]) if base is not None else {}
+    merged.update(rules)
+    TAX_RULES[year] = merged
+    _CALCULATORS.clear()
+
+
+register_tax_rules(
+    2025,
+    meal_nontax      = MEAL_NONTAX,
+    pension_rate     = PENSION_RATE,
+    pension_cap      = PENSION_CAP,
+    health_rate      = HEALTH_RATE,
+    ltc_ratio        = LTC_RATIO,
+    emp_rate         = EMP_RATE,
+    basic_deduction  = 1_500_000,      # 본인 기본공제
+    eid_table        = _EID_TABLE,
+    eid_max          = 20_000_000,
+    tax_table        = _TAX_TABLE,
+    credit_knee      = 1_300_000,      # 산출세액 130만원 이하 55%, 초과분 30%
+    credit_base      = 715_000,
+    credit_low_rate  = 0.55,
+    credit_high_rate = 0.30,
+    credit_caps      = _CREDIT_CAPS,
+    local_tax_rate   = 0.10,
+    withholding_table = 'withholding_table_2025_approx.csv',   # 별표 2 산식 근사 (국세청 표로 교체 가능)
+)
+# 2026: 국민연금 9.5% (근로자 4.75%), 기준소득월액 상한 637만원 (2025.7~),
+#       건강보험 7.19% (근로자 3.595%), 장기요양 = 건강보험료 × 13.14%
+register_tax_rules(
+    2026, base=2025,
+    pension_rate = 0.0475,
+    pension_cap  = 6_370_000,
+    health_rate  = 0.03595,
+    ltc_ratio    = 0.1314,
+    withholding_table = 'withholding_table_2026_approx.csv',
+)
 
-def _earned_income_deduction(annual_gross):
-    """근로소득공제 (한도 2,000만원)"""
-    if annual_gross <= 5_000_000:
-        d = annual_gross * 0.70
-    elif annual_gross <= 15_000_000:
-        d = 3_500_000 + (annual_gross - 5_000_000) * 0.40
-    elif annual_gross <= 45_000_000:
-        d = 7_500_000 + (annual_gross - 15_000_000) * 0.15
-    elif annual_gross <= 100_000_000:
-        d = 12_000_000 + (annual_gross - 45_000_000) * 0.05
-    else:
-        d = 14_750_000
-    return min(d, 20_000_000)
-
-
-def _income_tax(taxable):
-    """소득세 (누진세율표)"""
-    if taxable <= 0:
-        return 0
-    for limit, rate, deduction in _TAX_TABLE:
-        if taxable <= limit:
-            return max(0, int(taxable * rate - deduction))
-    return int(taxable * 0.45 - 65_940_000)
-
-
-def _tax_credit(tax, annual_gross):
-    """근로소득세액공제"""
-    credit = 715_000 + (tax - 1_300_000) * 0.30 if tax > 1_300_000 else tax * 0.55
-    if annual_gross <= 33_000_000:
-        cap = 740_000
-    elif annual_gross <= 70_000_000:
-        cap = 660_000
-    else:
-        cap = 500_000
-    return min(credit, cap)
 
+def tax_rule_year(year: int = None) -> int:
+    """year(없으면 DEFAULT_TAX_YEAR)에 적용할 규칙 연도 — 같은 해가 없으면 직전 연도, 그보다 앞이면 가장 이른 규칙"""
+    years = sorted(TAX_RULES)
+    year  = DEFAULT_TAX_YEAR if year is None else int(year)
+    return years[max(bisect_right(years, year) - 1, 0)]
 
-def gross_monthly_to_net_monthly(gross_monthly_won: int) -> int:
-    """
-    월 Gross(원) → 월 Net 실수령액(원)  ※ 퇴직금 미포함
-    식대 비과세 20만원, 부양가족 본인만 적용
+
+def tax_year_of(date_text):
+    """'2025-03-14' 같은 등록일 문자열 → 2025 (연도를 못 읽으면 None)"""
+    m = re.match(r'\s*(\d{4})', str(date_text or ''))
+    return int(m.group(1)) if m else None
+
+
+def tax_calculator(year: int = None) -> 'NetCalculator':
+    """year(없으면 DEFAULT_TAX_YEAR)에 적용할 규칙으로 만든 계산기 (규칙 연도당 1번만 생성)"""
+    if year is None:
+        year = DEFAULT_TAX_YEAR
+    calc = _CALCULATORS.get(year)
+    if calc is None:
+        rule_year = tax_rule_year(year)
+        calc = _CALCULATORS.get(rule_year) or NetCalculator(rule_year, TAX_RULES[rule_year])
+        _CALCULATORS[rule_year] = _CALCULATORS[year] = calc
+    return calc
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('배열 계산에는 numpy 가 필요합니다 (pip install numpy)')
+
+
+def _pwl_invert(knots, y):
+    """증가하는 꺾은선 [(x, y), ...] 에서 y → x (양 끝 밖은 끝 구간 연장)"""
+    ys = [ky for _, ky in knots]
+    i  = min(max(bisect_left(ys, y), 1), len(knots) - 1)
+    (x0, y0), (x1, y1) = knots[i - 1], knots[i]
+    return x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+
+
+# ══════════════════════════════════════════════════════════════
+# 규칙 1세트로 미리 계산해 둔 계산기
+# ══════════════════════════════════════════════════════════════
+class NetCalculator:
+    """세율 규칙 1세트 → 월 Gross ↔ Net 계산기 (tax_calculator(year) 로 얻음)
+
+    생성 시 1회: 구간표(근로소득공제·세율·세액공제 한도) 배열화,
+                 역산용 Gross 구간 경계와 구간별 기울기·절편 계산.
+    스칼라(net / net_with_retirement / gross_from_net)와 배열(*_array) 결과는 원 단위까지 같다.
     """
-    taxable_m = max(0, gross_monthly_won - MEAL_NONTAX)
 
-    pension    = min(taxable_m * PENSION_RATE, PENSION_CAP * PENSION_RATE)
-    health     = taxable_m * HEALTH_RATE
-    ltc        = health * LTC_RATIO
-    employment = taxable_m * EMP_RATE
+    def __init__(self, year, rules):
+        self.year  = year
+        self.rules = rules
+        self.meal_nontax  = rules['meal_nontax']
+        self.pension_rate = rules['pension_rate']
+        self.pension_cap  = rules['pension_cap']
+        self.health_rate  = rules['health_rate']
+        self.ltc_ratio    = rules['ltc_ratio']
+        self.emp_rate     = rules['emp_rate']
+        self.basic_deduction = rules['basic_deduction']
+        self.local_tax_rate  = rules['local_tax_rate']
+        self.credit_knee      = rules['credit_knee']
+        self.credit_base      = rules['credit_base']
+        self.credit_low_rate  = rules['credit_low_rate']
+        self.credit_high_rate = rules['credit_high_rate']
+        self.eid_max = rules['eid_max']
+        self.withholding_file = rules.get('withholding_table')
+        self._withholding     = None
+
+        # 구간표: 마지막 행 상한은 inf → 경계 목록에서는 제외 (searchsorted 결과가 곧 행 번호)
+        self.eid_table      = rules['eid_table']
+        self.eid_limits     = [row[0] for row in self.eid_table[:-1]]
+        self.tax_table      = rules['tax_table']
+        self.tax_limits     = [row[0] for row in self.tax_table]
+        self.credit_caps    = rules['credit_caps']
+        self.credit_limits  = [lim for lim, _ in self.credit_caps[:-1]]
+
+        if np is not None:
+            self._eid_limits    = np.array(self.eid_limits, dtype=float)
+            self._eid_base      = np.array([row[1] for row in self.eid_table], dtype=float)
+            self._eid_start     = np.array([row[2] for row in self.eid_table], dtype=float)
+            self._eid_rate      = np.array([row[3] for row in self.eid_table], dtype=float)
+            self._tax_limits    = np.array(self.tax_limits, dtype=float)
+            self._tax_rates     = np.array([row[1] for row in self.tax_table], dtype=float)
+            self._tax_deduct    = np.array([row[2] for row in self.tax_table], dtype=float)
+            self._credit_limits = np.array(self.credit_limits, dtype=float)
+            self._credit_caps   = np.array([cap for _, cap in self.credit_caps], dtype=float)
+
+        self._compile_inverse()
+
+    def __repr__(self):
+        return f"NetCalculator({self.year})"
+
+    def withholding(self):
+        """이 규칙의 간이세액표 (처음 쓸 때 1번 읽음)"""
+        if self._withholding is None:
+            if not self.withholding_file:
+                raise ValueError(f"{self.year}년 규칙에 간이세액표가 없습니다")
+            from withholding_table import load_table
+            self._withholding = load_table(self.withholding_file)
+        return self._withholding
+
+    # ── 세금 계산 내부 함수 ───────────────────────────────────
+    def _earned_income_deduction(self, annual_gross):
+        """근로소득공제 (한도 eid_max)"""
+        for limit, base, start, rate in self.eid_table:
+            if annual_gross <= limit:
+                return min(base + (annual_gross - start) * rate, self.eid_max)
+
+    def _tax_linear(self, taxable):
+        """누진세율표 산출세액 (원 미만 절사 전)"""
+        for limit, rate, deduction in self.tax_table:
+            if taxable <= limit:
+                return taxable * rate - deduction
+
+    def _income_tax(self, taxable):
+        """소득세 (누진세율표)"""
+        if taxable <= 0:
+            return 0
+        return max(0, int(self._tax_linear(taxable)))
+
+    def _tax_credit(self, tax, annual_gross):
+        """근로소득세액공제"""
+        if tax > self.credit_knee:
+            credit = self.credit_base + (tax - self.credit_knee) * self.credit_high_rate
+        else:
+            credit = tax * self.credit_low_rate
+        for limit, cap in self.credit_caps:
+            if annual_gross <= limit:
+                return min(credit, cap)
+
+    # ── Gross → Net ──────────────────────────────────────────
+    def net(self, gross_monthly_won: int, withholding: bool = None) -> int:
+        """
+        월 Gross(원) → 월 Net 실수령액(원)  ※ 퇴직금 미포함
+        식대 비과세, 부양가족 본인만 적용
+        withholding: 간이세액표 모드 (None 이면 WITHHOLDING_TABLE)
+        """
+        taxable_m = max(0, gross_monthly_won - self.meal_nontax)
+
+        pension    = min(taxable_m * self.pension_rate, self.pension_cap * self.pension_rate)
+        health     = taxable_m * self.health_rate
+        ltc        = health * self.ltc_ratio
+        employment = taxable_m * self.emp_rate
+
+        if WITHHOLDING_TABLE if withholding is None else withholding:
+            income_tax = self.withholding().monthly_tax(taxable_m)
+            local_tax  = int(income_tax * self.local_tax_rate) // 10 * 10
+        else:
+            annual_g   = taxable_m * 12
+            eid        = self._earned_income_deduction(annual_g)
+            taxable_y  = max(0, annual_g - eid - self.basic_deduction)
+            tax_y      = self._income_tax(taxable_y)
+            credit     = self._tax_credit(tax_y, annual_g)
+            income_tax = max(0, tax_y - credit) / 12
+            local_tax  = income_tax * self.local_tax_rate
+
+        total_ded = pension + health + ltc + employment + income_tax + local_tax
+        return round(gross_monthly_won - total_ded)
+
+    def net_array(self, gross_monthly_won, withholding: bool = None):
+        """net() 의 벡터화 버전 → int64 배열 (연산 순서까지 같게 유지 → 원 단위 일치)"""
+        _require_numpy()
+        gross     = np.asarray(gross_monthly_won, dtype=np.int64)
+        taxable_m = np.maximum(0, gross - self.meal_nontax)
+
+        pension    = np.minimum(taxable_m * self.pension_rate,
+                                self.pension_cap * self.pension_rate)
+        health     = taxable_m * self.health_rate
+        ltc        = health * self.ltc_ratio
+        employment = taxable_m * self.emp_rate
+
+        if WITHHOLDING_TABLE if withholding is None else withholding:
+            income_tax = self.withholding().monthly_tax_array(taxable_m)
+            local_tax  = np.trunc(income_tax * self.local_tax_rate).astype(np.int64) // 10 * 10
+            total_ded  = pension + health + ltc + employment + income_tax + local_tax
+            return np.round(gross - total_ded).astype(np.int64)
+
+        # 근로소득공제 (상한 '이하' 가 같은 구간 → side='left')
+        annual_g = taxable_m * 12
+        seg      = np.searchsorted(self._eid_limits, annual_g, side='left')
+        eid      = self._eid_base[seg] + (annual_g - self._eid_start[seg]) * self._eid_rate[seg]
+        eid      = np.minimum(eid, self.eid_max)
+
+        # 소득세 (누진세율표, 원 미만 절사)
+        taxable_y = np.maximum(0, annual_g - eid - self.basic_deduction)
+        seg       = np.searchsorted(self._tax_limits, taxable_y, side='left')
+        tax_y     = np.maximum(0, np.trunc(taxable_y * self._tax_rates[seg]
+                                           - self._tax_deduct[seg]))
+
+        # 근로소득세액공제
+        credit = np.where(tax_y > self.credit_knee,
+                          self.credit_base + (tax_y - self.credit_knee) * self.credit_high_rate,
+                          tax_y * self.credit_low_rate)
+        cap    = self._credit_caps[np.searchsorted(self._credit_limits, annual_g, side='left')]
+        credit = np.minimum(credit, cap)
+
+        income_tax = np.maximum(0, tax_y - credit) / 12
+        local_tax  = income_tax * self.local_tax_rate
+
+        total_ded = pension + health + ltc + employment + income_tax + local_tax
+        return np.round(gross - total_ded).astype(np.int64)
+
+    def net_with_retirement(self, salary_type: str, monthly_gross_or_net_won: int,
+                            withholding: bool = None) -> int:
+        """Gross: 실수령 + Gross/12 (퇴직금 월 환산) / Net: 공고 기재 Net 그대로"""
+        if salary_type == 'gross':
+            gross = monthly_gross_or_net_won
+            return round(self.net(gross, withholding) + gross / 12)
+        return monthly_gross_or_net_won
 
-    annual_g   = taxable_m * 12
-    eid        = _earned_income_deduction(annual_g)
-    taxable_y  = max(0, annual_g - eid - 1_500_000)   # 본인 기본공제 150만원
-    tax_y      = _income_tax(taxable_y)
-    credit     = _tax_credit(tax_y, annual_g)
-    income_tax = max(0, tax_y - credit) / 12
-    local_tax  = income_tax * 0.10
+    def net_with_retirement_array(self, salary_type, monthly_gross_or_net_won,
+                                  withholding: bool = None):
+        _require_numpy()
+        values   = np.asarray(monthly_gross_or_net_won, dtype=np.int64)
+        is_gross = np.asarray(salary_type) == 'gross'
+        with_ret = np.round(self.net_array(values, withholding) + values / 12).astype(np.int64)
+        return np.where(is_gross, with_ret, values)
+
+    # ── Net → Gross 역산 (구간별 닫힌 식) ─────────────────────
+    # 소득세 원 미만 절사와 마지막 반올림을 빼면 Net(g) 는 Gross g 의 구간별 1차식이다.
+    # 연금 상한 · 근로소득공제 구간 · 세율 구간 · 세액공제 꺾임점 · 세액공제 한도가 바뀌는
+    # Gross 지점을 구간 경계로 미리 구해 두고, 구간마다 Net = A + B·g 를 거꾸로 풀어 g 를 얻는다.
+    # 절사·반올림 차이(1원 미만)는 실제 함수로 앞뒤 몇 원을 확인해 맞춘다.
+    #
+    # 세액공제 한도는 총급여 3,300만 / 7,000만원을 넘는 순간 줄어 Net 이 몇천 원 떨어진다.
+    # 그래서 같은 Net 을 주는 Gross 가 둘 이상일 수 있고, 역산은 'Net 이 target 이상이 되는
+    # 가장 작은 Gross' 를 돌려준다.
+    def _net_continuous(self, gross):
+        """net() 에서 세액 절사·반올림을 뺀 값 (구간 안에서 1차식)"""
+        taxable_m = max(0.0, gross - self.meal_nontax)
+
+        pension    = min(taxable_m * self.pension_rate, self.pension_cap * self.pension_rate)
+        health     = taxable_m * self.health_rate
+        ltc        = health * self.ltc_ratio
+        employment = taxable_m * self.emp_rate
+
+        annual_g   = taxable_m * 12
+        taxable_y  = max(0, annual_g - self._earned_income_deduction(annual_g)
+                         - self.basic_deduction)
+        tax_y      = max(0.0, self._tax_linear(taxable_y))
+        income_tax = max(0, tax_y - self._tax_credit(tax_y, annual_g)) / 12
+
+        return gross - (pension + health + ltc + employment
+                        + income_tax * (1 + self.local_tax_rate))
+
+    def _compile_inverse(self):
+        """구간 경계(Gross)와 구간별 기울기·절편, 구간 끝까지의 최대 Net 을 계산"""
+        far = 1e12
+
+        # 근로소득공제가 한도(eid_max)에 닿는 총급여 (2025 표는 최대 공제 1,475만원 → 없음)
+        eid_cap, lower = [], 0
+        for limit, base, start, rate in self.eid_table:
+            if rate > 0 and lower < start + (self.eid_max - base) / rate <= limit:
+                eid_cap.append(start + (self.eid_max - base) / rate)
+            lower = limit
+
+        # 연 총급여 → 과세표준 (근로소득공제 구간 끝·공제 한도에서 꺾임, 증가)
+        annual_knots = sorted(set([0] + self.eid_limits + eid_cap + [far]))
+        base_knots   = [(a, a - self._earned_income_deduction(a) - self.basic_deduction)
+                        for a in annual_knots]
+        # 과세표준 → 산출세액 (세율 구간 끝에서 꺾임, 증가)
+        tax_knots = ([(0, 0)] + [(lim, self._tax_linear(lim)) for lim in self.tax_limits[:-1]]
+                     + [(far, self._tax_linear(far))])
+        # 산출세액 → 한도 적용 전 세액공제 (credit_knee 에서 꺾임, 증가)
+        credit_knots = [(0, 0), (self.credit_knee, self.credit_base),
+                        (far, self.credit_base + (far - self.credit_knee) * self.credit_high_rate)]
+
+        taxes   = [self.credit_knee] + [_pwl_invert(credit_knots, cap)
+                                        for _, cap in self.credit_caps]
+        bases   = [0] + self.tax_limits[:-1] + [_pwl_invert(tax_knots, t) for t in taxes]
+        annuals = (self.eid_limits + eid_cap + self.credit_limits
+                   + [_pwl_invert(base_knots, y) for y in bases])
+        monthly = [self.pension_cap] + [a / 12 for a in annuals]
+        starts  = sorted({0.0, float(self.meal_nontax)}
+                         | {m + self.meal_nontax for m in monthly if 0 < m < far / 12})
+
+        slopes, intercepts, reach = [], [], []
+        best = -math.inf
+        for lo, hi in zip(starts, starts[1:] + [starts[-1] * 2]):
+            x1, x2 = lo + (hi - lo) / 3, lo + (hi - lo) * 2 / 3
+            n1, n2 = self._net_continuous(x1), self._net_continuous(x2)
+            slope  = (n2 - n1) / (x2 - x1)
+            slopes.append(slope)
+            intercepts.append(n1 - slope * x1)
+            best = max(best, intercepts[-1] + slope * hi)
+            reach.append(best)
+        reach[-1] = math.inf   # 마지막 구간은 끝없이 증가
+
+        self.inv_starts, self.inv_slopes = starts, slopes
+        self.inv_intercepts, self.inv_reach = intercepts, reach
+        if np is not None:
+            self._inv_starts     = np.array(starts)
+            self._inv_slopes     = np.array(slopes)
+            self._inv_intercepts = np.array(intercepts)
+            self._inv_reach      = np.array(reach)
+
+    def gross_from_net(self, target_net_won: int) -> int:
+        """
+        Net 월급(원) → 추정 Gross 월급(원)
+        net(g) >= target 인 가장 작은 g (보통 = target 과 정확히 같은 Net)
+        """
+        if target_net_won <= 0:
+            return 0
+        # 반올림 때문에 연속값이 target - 0.5 이상이면 target 이 된다
+        k = bisect_left(self.inv_reach, target_net_won - 0.5)
+        g = math.ceil(max(self.inv_starts[k],
+                          (target_net_won - 0.5 - self.inv_intercepts[k]) / self.inv_slopes[k]))
+        # 세액 절사 보정 (보통 0~1원 이동)
+        while self.net(g, False) < target_net_won:
+            g += 1
+        while g > 0 and self.net(g - 1, False) >= target_net_won:
+            g -= 1
+        return g
+
+    def gross_from_net_array(self, target_net_won):
+        """
+        gross_from_net 의 벡터화 버전 → int64 배열
+        닫힌 식으로 구한 값 -2 ~ +1원을 net_array 로 한 번에 확인하고,
+        그 범위 밖에서 답이 나오는 드문 원소만 스칼라 함수로 다시 계산한다.
+        """
+        _require_numpy()
+        target = np.asarray(target_net_won, dtype=np.int64)
+        flat   = target.ravel()
+        k      = np.searchsorted(self._inv_reach, flat - 0.5, side='left')
+        guess  = np.maximum(self._inv_starts[k],
+                            (flat - 0.5 - self._inv_intercepts[k]) / self._inv_slopes[k])
+        guess  = np.ceil(guess).astype(np.int64)
+
+        window = guess[:, None] + np.arange(-2, 2)
+        ok     = self.net_array(window, False) >= flat[:, None]
+        first  = ok.argmax(axis=1)
+        result = window[np.arange(len(flat)), first]
+
+        # 창 안에 답이 없거나(전부 미달) 창 첫 칸부터 충족(더 아래일 수 있음) → 스칼라로
+        redo = ~ok.any(axis=1) | ok[:, 0]
+        for i in np.flatnonzero(redo):
+            result[i] = self.gross_from_net(int(flat[i]))
+        result[flat <= 0] = 0
+        return result.reshape(target.shape)
 
-    total_ded = pension + health + ltc + employment + income_tax + local_tax
-    return round(gross_monthly_won - total_ded)
+
+# ══════════════════════════════════════════════════════════════
+# 모듈 함수 (year 생략 시 DEFAULT_TAX_YEAR 규칙)
+# ══════════════════════════════════════════════════════════════
+def gross_monthly_to_net_monthly(gross_monthly_won: int, year: int = None,
+                                 withholding: bool = None) -> int:
+    """
+    월 Gross(원) → 월 Net 실수령액(원)  ※ 퇴직금 미포함
+    식대 비과세 20만원, 부양가족 본인만 적용
+    withholding=True 면 소득세를 간이세액표로 (None 이면 WITHHOLDING_TABLE)
+    """
+    return tax_calculator(year).net(gross_monthly_won, withholding)
 
 
-def _estimate_gross_from_net(target_net_won: int) -> int:
+def estimate_gross_from_net(target_net_won: int, year: int = None) -> int:
     """
     Net 월급(원) → 추정 Gross 월급(원)
-    binary search (40회 반복, ±1,000원 오차 이내)
+    gross_monthly_to_net_monthly(g) >= target 인 가장 작은 g (보통 = target 과 정확히 같은 Net)
     """
-    lo, hi = target_net_won, target_net_won * 3
-    for _ in range(40):
-        mid = (lo + hi) // 2
-        computed = gross_monthly_to_net_monthly(mid)
-        if abs(computed - target_net_won) <= 1_000:
-            return mid
-        if computed < target_net_won:
-            lo = mid
-        else:
-            hi = mid
-    return (lo + hi) // 2
+    return tax_calculator(year).gross_from_net(target_net_won)
 
 
-def calc_net_with_retirement(salary_type: str, monthly_gross_or_net_won: int) -> int:
+def calc_net_with_retirement(salary_type: str, monthly_gross_or_net_won: int,
+                             year: int = None, withholding: bool = None) -> int:
     """
     최종 월 실수령 + 퇴직금 월 환산 (원 단위 반환)
 
@@ -139,12 +519,61 @@ def calc_net_with_retirement(salary_type: str, monthly_gross_or_net_won: int) ->
         공고 기재 Net 그대로 반환 (퇴직금 미합산)
         return net
     """
-    if salary_type == 'gross':
-        gross = monthly_gross_or_net_won
-        net   = gross_monthly_to_net_monthly(gross)
-        return round(net + gross / 12)
-    else:  # 'net': 공고 기재 Net 그대로
-        return monthly_gross_or_net_won
+    return tax_calculator(year).net_with_retirement(salary_type, monthly_gross_or_net_won,
+                                                    withholding)
+
+
+# ══════════════════════════════════════════════════════════════
+# 배열 일괄 계산 (NumPy)
+# ══════════════════════════════════════════════════════════════
+def _rule_groups(years):
+    """원소별 연도 → [(NetCalculator, mask)] (연도 하나·None 이면 mask=None)
+    연도를 못 읽은 원소(None / NaN)는 DEFAULT_TAX_YEAR 규칙
+    """
+    if years is None or np.ndim(years) == 0:
+        return [(tax_calculator(None if years is None else int(years)), None)]
+    ys = np.asarray(years, dtype=float)
+    ys = np.where(np.isnan(ys), DEFAULT_TAX_YEAR, ys)
+    rule_years = np.array(sorted(TAX_RULES))
+    idx = np.maximum(np.searchsorted(rule_years, ys, side='right') - 1, 0)
+    return [(tax_calculator(int(rule_years[i])), idx == i) for i in np.unique(idx)]
+
+
+def _by_rule_year(method, years, *arrays, **options):
+    """규칙 세트마다 해당 원소만 모아 method 로 배열 계산 후 한 배열로 합침"""
+    _require_numpy()
+    groups = _rule_groups(years)
+    if groups[0][1] is None:
+        return getattr(groups[0][0], method)(*arrays, **options)
+    arrays = np.broadcast_arrays(*[np.asarray(a) for a in arrays], np.asarray(years))[:-1]
+    out = np.zeros(arrays[0].shape, dtype=np.int64)
+    for calc, mask in groups:
+        out[mask] = getattr(calc, method)(*[a[mask] for a in arrays], **options)
+    return out
+
+
+def gross_to_net_array(gross_monthly_won, years=None, withholding=None):
+    """
+    월 Gross(원) 배열 → 월 Net 실수령액(원) 배열 (int64)  ※ 퇴직금 미포함
+    gross_monthly_to_net_monthly 의 벡터화 버전 — 원소마다 같은 값
+    years: 연도 하나 또는 원소별 연도 배열 (None 이면 DEFAULT_TAX_YEAR 규칙)
+    """
+    return _by_rule_year('net_array', years, gross_monthly_won, withholding=withholding)
+
+
+def calc_net_with_retirement_array(salary_type, monthly_gross_or_net_won, years=None,
+                                   withholding=None):
+    """
+    calc_net_with_retirement 의 벡터화 버전 → int64 배열
+    salary_type: 'gross' / 'net' 문자열 하나 또는 원소별 배열 (gross 가 아니면 Net 그대로)
+    """
+    return _by_rule_year('net_with_retirement_array', years,
+                         salary_type, monthly_gross_or_net_won, withholding=withholding)
+
+
+def estimate_gross_from_net_array(target_net_won, years=None):
+    """estimate_gross_from_net 의 벡터화 버전 → int64 배열"""
+    return _by_rule_year('gross_from_net_array', years, target_net_won)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -168,6 +597,11 @@ _PAT_MAN   = re.compile(r'([\d,]+)\s*(?:만원|만\s*원|\(만원\))')
 # 3~4자리 단독 숫자 (문맥상 만원 단위)
 _PAT_NUM   = re.compile(r'\b(\d{3,4})\b')
 
+PARSER_VERSION   = 1        # 위 패턴·_extract_numbers 등 파싱 규칙을 바꾸면 올림 (영구 캐시 무효화)
+PARSE_CACHE_SIZE = 65_536   # 프로세스 안 LRU 메모 크기 (문구 수)
+
+_PARSE_STORE = None   # 영구 파싱 캐시 (parse_cache.ParseCache) — set_parse_store 로 연결
+
 
 def _clean(text: str) -> str:
     """천단위 콤마 제거"""
@@ -226,30 +660,28 @@ def _extract_numbers(raw: str):
     return None, None
 
 
-def parse_salary(raw_text: str) -> dict:
-    """
-    급여 원본 텍스트 → 파싱 결과 dict
+def normalize_salary_text(raw_text: str) -> str:
+    """캐시 키용 문구 정리 — 앞뒤 공백 제거 + 연속 공백·줄바꿈을 공백 1개로 (파싱 결과는 같음)"""
+    return ' '.join(raw_text.split())
 
-    반환 키:
-        salary_type    : 'net' | 'gross' | None
-        salary_unit    : 'monthly' | 'annual' | None
-        salary_min     : int(만원) | None   ← 원본 단위 그대로
-        salary_max     : int(만원) | None
-        salary_net_min : int(만원) | None   ← Net 환산 + 퇴직금 포함
-        salary_net_max : int(만원) | None
-    """
-    empty = dict(salary_type=None, salary_unit=None,
-                 salary_min=None, salary_max=None,
-                 salary_net_min=None, salary_net_max=None)
 
-    if not raw_text or not raw_text.strip():
-        return empty
+def set_parse_store(store):
+    """영구 파싱 캐시 연결 (None 이면 해제) — get(text) / put(text, fields) 를 가진 객체"""
+    global _PARSE_STORE
+    _PARSE_STORE = store
+    _parse_text.cache_clear()
+
 
-    text = raw_text.strip()
+def parse_cache_info():
+    """프로세스 안 LRU 메모 적중 현황 (문구 파싱) → functools CacheInfo"""
+    return _parse_text.cache_info()
 
+
+def _parse_fields(text: str) -> tuple:
+    """정리된 문구 → (salary_type, salary_unit, salary_min, salary_max) — 세율 규칙과 무관한 부분"""
     # 협의 / 미정 → 전부 None
     if _PAT_NEGO.search(text):
-        return empty
+        return None, None, None, None
 
     # ── Net / Gross ──────────────────────────────────────────
     if _PAT_NET.search(text):
@@ -270,28 +702,71 @@ def parse_salary(raw_text: str) -> dict:
 
     # ── 숫자 추출 ─────────────────────────────────────────────
     s_min, s_max = _extract_numbers(text)
+    return salary_type, salary_unit, s_min, s_max
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_text(text: str) -> tuple:
+    """_parse_fields 메모 — 영구 캐시에 있으면 그 값, 없으면 파싱 후 저장 (예외는 캐시 안 함)"""
+    store = _PARSE_STORE
+    if store is not None:
+        fields = store.get(text)
+        if fields is not None:
+            return fields
+    fields = _parse_fields(text)
+    if store is not None:
+        store.put(text, fields)
+    return fields
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _net_range(calc, withholding, salary_type, salary_unit, s_min, s_max) -> tuple:
+    """파싱된 숫자 → (net_min, net_max) 만원. 계산기 객체가 키 → 규칙을 다시 등록하면 새 항목"""
+    # 연봉 → 월급 변환
+    if salary_unit == 'annual':
+        m_min = s_min / 12
+        m_max = (s_max / 12) if s_max else m_min
+    else:
+        m_min = float(s_min)
+        m_max = float(s_max) if s_max else m_min
+
+    # 만원 → 원 단위 변환 후 계산
+    net_min_won = calc.net_with_retirement(salary_type, int(m_min * 10_000), withholding)
+    net_max_won = calc.net_with_retirement(salary_type, int(m_max * 10_000), withholding)
 
-    result = dict(salary_type=salary_type, salary_unit=salary_unit,
-                  salary_min=s_min, salary_max=s_max,
+    # 원 → 만원 (반올림)
+    return round(net_min_won / 10_000), round(net_max_won / 10_000)
+
+
+def parse_salary(raw_text: str, year: int = None) -> dict:
+    """
+    급여 원본 텍스트 → 파싱 결과 dict (호출마다 새 dict — 고쳐 써도 캐시에 영향 없음)
+    year: Net 환산에 쓸 세율 규칙 연도 (공고 등록일 연도, 없으면 DEFAULT_TAX_YEAR)
+
+    반환 키:
+        salary_type    : 'net' | 'gross' | None
+        salary_unit    : 'monthly' | 'annual' | None
+        salary_min     : int(만원) | None   ← 원본 단위 그대로
+        salary_max     : int(만원) | None
+        salary_net_min : int(만원) | None   ← Net 환산 + 퇴직금 포함
+        salary_net_max : int(만원) | None
+    """
+    result = dict(salary_type=None, salary_unit=None,
+                  salary_min=None, salary_max=None,
                   salary_net_min=None, salary_net_max=None)
 
-    # ── Net 환산 (salary_type 이 명확할 때만) ──────────────────
-    if s_min is not None and salary_type is not None:
-        # 연봉 → 월급 변환
-        if salary_unit == 'annual':
-            m_min = s_min / 12
-            m_max = (s_max / 12) if s_max else m_min
-        else:
-            m_min = float(s_min)
-            m_max = float(s_max) if s_max else m_min
+    if not raw_text or not raw_text.strip():
+        return result
 
-        # 만원 → 원 단위 변환 후 계산
-        net_min_won = calc_net_with_retirement(salary_type, int(m_min * 10_000))
-        net_max_won = calc_net_with_retirement(salary_type, int(m_max * 10_000))
+    salary_type, salary_unit, s_min, s_max = _parse_text(normalize_salary_text(raw_text))
+    result.update(salary_type=salary_type, salary_unit=salary_unit,
+                  salary_min=s_min, salary_max=s_max)
 
-        # 원 → 만원 (반올림)
-        result['salary_net_min'] = round(net_min_won / 10_000)
-        result['salary_net_max'] = round(net_max_won / 10_000)
+    # ── Net 환산 (salary_type 이 명확할 때만) ──────────────────
+    if s_min is not None and salary_type is not None:
+        result['salary_net_min'], result['salary_net_max'] = _net_range(
+            tax_calculator(year), bool(WITHHOLDING_TABLE),
+            salary_type, salary_unit, s_min, s_max)
 
     return result
 
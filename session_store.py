@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+session_store.py — 로그인 세션(쿠키 + localStorage) 저장 / 재사용
+─────────────────────────────────────────────────
+phase4_crawler.login() / salary_backfill.login() 은 매번 화면 로그인(고정 대기 약 10초)을 한다.
+로그인 직후 상태를 session_state.json 에 저장해 두고, 다음 실행·병렬 워커는
+
+  1. 저장 파일 확인 — 대상 호스트가 같고 MAX_AGE_HOURS 이내인지
+  2. 가벼운 확인 요청 — 브라우저 없이 urllib 로 목록 URL 요청,
+                        로그인 호스트로 리다이렉트되지 않으면 유효
+  3. 브라우저에 복원 — CDP Network.setCookies 로 쿠키(여러 도메인) 주입 → 목록 URL 이동
+                        → localStorage 복원 → 대상 호스트에 머무르면 재사용 성공
+
+하나라도 실패하면 기존 login() 을 실행하고 성공 시 새 상태로 교체한다.
+파일은 임시 파일 → os.replace 로 원자적으로 교체하고 소유자만 읽을 수 있게(0600) 만든다.
+
+사용:
+    from session_store import ensure_login
+    ok = ensure_login(driver, login, RECRUIT_URL, log=log)
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+
+_SCRIPT_DIR   = os.path.dirname(os.path.abspath(__file__))
+SESSION_FILE  = os.path.join(_SCRIPT_DIR, 'session_state.json')
+MAX_AGE_HOURS = 12     # 이보다 오래된 세션은 확인 없이 다시 로그인
+PROBE_TIMEOUT = 10     # 확인 요청 제한 시간(초)
+DISABLED      = False  # True 면 저장·재사용 없이 항상 로그인 (--fresh-login)
+
+_LOCK = threading.Lock()   # 같은 프로세스의 여러 브라우저(상세 워커)가 동시에 저장할 때
+
+_LOCAL_STORAGE_JS = "return Object.assign({}, window.localStorage);"
+_RESTORE_STORAGE_JS = """
+    const items = arguments[0];
+    for (const k in items) { window.localStorage.setItem(k, items[k]); }
+    return Object.keys(items).length;
+"""
+
+
+def _noop(msg):
+    pass
+
+
+# ============================================================
+# 파일 저장 / 읽기
+# ============================================================
+def save_session(driver, path=None):
+    """로그인된 브라우저의 쿠키·localStorage 저장. 성공 시 True"""
+    path = path or SESSION_FILE
+    try:
+        cookies = driver.get_cookies()
+        try:
+            storage = driver.execute_script(_LOCAL_STORAGE_JS) or {}
+        except Exception:
+            storage = {}
+        state = {
+            'host':          urlsplit(driver.current_url).netloc,
+            'saved_at':      datetime.now().isoformat(timespec='seconds'),
+            'cookies':       cookies,
+            'local_storage': storage,
+        }
+    except Exception:
+        return False
+
+    with _LOCK:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        fd  = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    return True
+
+
+def load_session(host, path=None, max_age_hours=MAX_AGE_HOURS):
+    """host 용으로 저장된 세션 dict (없거나 오래됐거나 다른 사이트면 None)"""
+    path = path or SESSION_FILE
+    try:
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f)
+        saved_at = datetime.fromisoformat(state['saved_at'])
+    except (OSError, ValueError, KeyError):
+        return None
+    if state.get('host') != host:
+        return None
+    if datetime.now() - saved_at > timedelta(hours=max_age_hours):
+        return None
+    now = time.time()
+    state['cookies'] = [c for c in state.get('cookies', [])
+                        if not c.get('expiry') or c['expiry'] > now]
+    return state if state['cookies'] else None
+
+
+def clear_session(path=None):
+    try:
+        os.remove(path or SESSION_FILE)
+    except OSError:
+        pass
+
+
+# ============================================================
+# 확인 요청 / 브라우저 복원
+# ============================================================
+def _domain_match(host, domain):
+    domain = (domain or '').lstrip('.')
+    return host == domain or host.endswith('.' + domain)
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+def probe_session(state, probe_url, timeout=PROBE_TIMEOUT):
+    """브라우저 없이 probe_url 을 저장된 쿠키로 요청 → 로그인 페이지로 보내지지 않으면 True"""
+    parts  = urlsplit(probe_url)
+    cookie = '; '.join(f"{c['name']}={c['value']}" for c in state['cookies']
+                       if _domain_match(parts.hostname or '', c.get('domain'))
+                       and parts.path.startswith(c.get('path') or '/'))
+    if not cookie:
+        return False
+    request = urllib.request.Request(probe_url, headers={
+        'Cookie': cookie,
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                      'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    })
+    opener = urllib.request.build_opener(_NoRedirect)
+    try:
+        with opener.open(request, timeout=timeout) as resp:
+            return 200 <= resp.status < 300
+    except urllib.error.HTTPError as e:
+        if 300 <= e.code < 400:
+            location = e.headers.get('Location', '')
+            # 같은 호스트 안의 이동(정렬 파라미터 등)은 유효, 로그인 호스트로 가면 만료
+            return not urlsplit(location).netloc or urlsplit(location).netloc == parts.netloc
+        return False
+    except Exception:
+        return False
+
+
+def _cdp_cookie(c):
+    cookie = {'name': c['name'], 'value': c['value'], 'domain': c.get('domain', ''),
+              'path': c.get('path', '/'), 'secure': bool(c.get('secure')),
+              'httpOnly': bool(c.get('httpOnly'))}
+    if c.get('expiry'):
+        cookie['expires'] = c['expiry']
+    if c.get('sameSite') in ('Strict', 'Lax', 'None'):
+        cookie['sameSite'] = c['sameSite']
+    return cookie
+
+
+def restore_session(driver, state, probe_url):
+    """브라우저에 쿠키·localStorage 복원 후 probe_url 로 이동 → 대상 호스트에 머무르면 True"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setCookies',
+                               {'cookies': [_cdp_cookie(c) for c in state['cookies']]})
+        driver.get(probe_url)
+        if urlsplit(driver.current_url).netloc != urlsplit(probe_url).netloc:
+            return False
+        if state.get('local_storage'):
+            driver.execute_script(_RESTORE_STORAGE_JS, state['local_storage'])
+        return True
+    except Exception:
+        return False
+
+
+def ensure_login(driver, login_fn, probe_url, log=None, path=None):
+    """저장된 세션을 재사용하고, 없거나 만료됐으면 login_fn(driver) 후 저장. 로그인 여부 반환"""
+    log  = log or _noop
+    host = urlsplit(probe_url).netloc
+    if not DISABLED:
+        state = load_session(host, path)
+        if state is not None:
+            t0 = time.monotonic()
+            if probe_session(state, probe_url) and restore_session(driver, state, probe_url):
+                log(f"[OK] 저장된 세션 재사용 ({state['saved_at']} 로그인, "
+                    f"{time.monotonic() - t0:.1f}초)")
+                return True
+            log("[LOGIN] 저장된 세션 만료 → 다시 로그인")
+
+    if not login_fn(driver):
+        return False
+    if not DISABLED and save_session(driver, path):
+        log(f"    세션 저장 → {os.path.basename(path or SESSION_FILE)}")
+    return True
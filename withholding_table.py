@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+withholding_table.py — 근로소득 간이세액표 조회
+─────────────────────────────────────────────────
+병원이 매달 실제로 떼는 근로소득세는 연봉 환산 누진세가 아니라 국세청 간이세액표 금액이다.
+salary_calculator 의 간이세액표 모드(WITHHOLDING_TABLE / withholding=True)가 이 모듈을 쓴다.
+
+  · 데이터 : 세율 규칙 연도별 CSV (TAX_RULES 의 withholding_table, build_withholding_table.py 로 생성)
+             월급여액(비과세 제외) 구간 [lower, upper) × 공제대상가족 1~11명 → 월 소득세(원)
+             저장소의 withholding_table_<연도>_approx.csv 는 별표 2 산식으로 계산한 근사값
+             — 국세청 배포 표와 일부 구간에서 다름 (--from-xlsx 로 만든 표로 교체 가능)
+  · 조회   : 구간 하한 정렬 배열에서 bisect / np.searchsorted — 스칼라·배열 모두 O(log n)
+  · 1,000만원 초과 : 표 각주의 산식 (1,000만원 세액 + 초과액 × 율)
+  · 지방소득세 = 소득세 × 10% (10원 미만 절사) — 호출하는 쪽에서 계산
+  · 자녀세액공제(8~20세 자녀)는 표에 들어 있지 않음 → 본인만(가족 1명) 기준이면 해당 없음
+
+사용:
+    from withholding_table import load_table
+    table = load_table()                       # 파일당 1번만 읽음 (기본 DEFAULT_TABLE)
+    table.monthly_tax(12_000_000)              # 가족 1명 기준 월 소득세
+    table.monthly_tax_array(values, dependents=3)
+"""
+
+import csv
+import os
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:   # numpy 미설치 시 스칼라 조회만 사용 가능
+    np = None
+
+_DIR          = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TABLE = 'withholding_table_2025_approx.csv'   # 규칙 연도를 거치지 않고 직접 조회할 때
+MAX_DEPENDENTS = 11
+
+# 월급여액 1,000만원 초과분 산식 (2024.3 개정 간이세액표 각주)
+#   (구간 상한, 구간 시작, 1,000만원 세액에 더할 금액, 초과액 반영 비율, 세율)
+#   세액 = 1,000만원 세액 + 더할 금액 + (월급여 - 구간 시작) × 비율 × 세율
+OVER_10M = [
+    ( 14_000_000, 10_000_000,     25_000, 0.98, 0.35),
+    ( 28_000_000, 14_000_000,  1_397_000, 0.98, 0.38),
+    ( 30_000_000, 28_000_000,  6_610_600, 0.98, 0.40),
+    ( 45_000_000, 30_000_000,  7_394_600, 1.00, 0.40),
+    ( 87_000_000, 45_000_000, 13_394_600, 1.00, 0.42),
+    (float('inf'), 87_000_000, 31_034_600, 1.00, 0.45),
+]
+TABLE_MAX = 10_000_000   # 표에 있는 마지막 금액 (이 금액 행 = 정확히 1,000만원)
+
+_TABLES = {}   # 경로 → WithholdingTable
+
+
+class WithholdingTable:
+    """간이세액표 1개 — 구간 하한 정렬 배열 + 가족 수별 세액 열"""
+
+    def __init__(self, rows, source=''):
+        rows = sorted(rows)
+        self.source = source
+        self.lowers = [r[0] for r in rows]
+        self.uppers = [r[1] for r in rows]
+        self.taxes  = [list(r[2:]) for r in rows]   # 행 → [가족 1명, 2명, ...]
+        top = bisect_right(self.lowers, TABLE_MAX) - 1
+        if top < 0 or self.lowers[top] != TABLE_MAX:
+            raise ValueError(f"간이세액표에 {TABLE_MAX:,}원 행이 없습니다: {source}")
+        self.top_taxes = self.taxes[top]
+        if np is not None:
+            self._lowers  = np.array(self.lowers, dtype=np.int64)
+            self._uppers  = np.array(self.uppers, dtype=np.int64)
+            self._taxes   = np.array(self.taxes, dtype=np.int64)
+            self._o_lims  = np.array([r[0] for r in OVER_10M[:-1]], dtype=float)
+            self._o_start = np.array([r[1] for r in OVER_10M], dtype=float)
+            self._o_add   = np.array([r[2] for r in OVER_10M], dtype=float)
+            self._o_ratio = np.array([r[3] for r in OVER_10M], dtype=float)
+            self._o_rate  = np.array([r[4] for r in OVER_10M], dtype=float)
+
+    def __len__(self):
+        return len(self.lowers)
+
+    @staticmethod
+    def _column(dependents):
+        return min(max(int(dependents), 1), MAX_DEPENDENTS) - 1
+
+    def monthly_tax(self, monthly_pay_won, dependents=1) -> int:
+        """월급여액(비과세 제외, 원) → 월 소득세(원)"""
+        col = self._column(dependents)
+        if monthly_pay_won > TABLE_MAX:
+            for limit, start, add, ratio, rate in OVER_10M:
+                if monthly_pay_won <= limit:
+                    tax = (self.top_taxes[col] + add
+                           + (monthly_pay_won - start) * ratio * rate)
+                    return int(tax) // 10 * 10
+        i = bisect_right(self.lowers, monthly_pay_won) - 1
+        if i < 0 or monthly_pay_won >= self.uppers[i]:
+            return 0   # 첫 구간(77만원) 미만
+        return self.taxes[i][col]
+
+    def monthly_tax_array(self, monthly_pay_won, dependents=1):
+        """monthly_tax 의 배열 버전 → int64 배열"""
+        if np is None:
+            raise ImportError('배열 조회에는 numpy 가 필요합니다 (pip install numpy)')
+        col  = self._column(dependents)
+        pay  = np.asarray(monthly_pay_won, dtype=np.int64)
+        i    = np.searchsorted(self._lowers, pay, side='right') - 1
+        safe = np.maximum(i, 0)
+        tax  = np.where((i >= 0) & (pay < self._uppers[safe]), self._taxes[safe, col], 0)
+
+        over = pay > TABLE_MAX
+        if over.any():
+            seg = np.searchsorted(self._o_lims, pay[over], side='left')
+            extra = (self.top_taxes[col] + self._o_add[seg]
+                     + (pay[over] - self._o_start[seg]) * self._o_ratio[seg] * self._o_rate[seg])
+            tax[over] = np.trunc(extra).astype(np.int64) // 10 * 10
+        return tax
+
+
+def load_table(name=DEFAULT_TABLE):
+    """간이세액표 CSV 읽기 (같은 파일은 1번만). name 은 파일명(저장소 기준) 또는 경로"""
+    path = name if os.path.isabs(name) else os.path.join(_DIR, name)
+    table = _TABLES.get(path)
+    if table is None:
+        with open(path, encoding='utf-8', newline='') as f:
+            reader = csv.reader(row for row in f if not row.startswith('#'))
+            next(reader)   # 헤더
+            rows = [tuple(int(v) for v in row) for row in reader if row]
+        table = _TABLES[path] = WithholdingTable(rows, source=path)
+    return table